@@ -1,4 +1,16 @@
 from mapperpy.object_mapper import ObjectMapper
 from mapperpy.one_way_mapper import OneWayMapper
 from mapperpy.mapper_options import MapperOptions
-from mapperpy.exceptions import ConfigurationException
+from mapperpy.exceptions import ConfigurationException, RecordMappingException, TooManyErrorsException, \
+    TrustedInputException
+from mapperpy.mapper_stats import enable_stats, disable_stats, stats_enabled
+from mapperpy.readers import map_jsonl, map_csv
+from mapperpy.parallel import map_file_parallel
+from mapperpy.writers import map_to_writer, JsonLinesWriter, CsvWriter
+from mapperpy.record_batch import RecordBatch
+from mapperpy.mapper_spec import MapperSpec
+from mapperpy.error_collector import ErrorCollector
+from mapperpy.batch_functions import batched
+from mapperpy.converter_cache import LRU
+from mapperpy.startup import enable_lazy_construction, disable_lazy_construction, enable_startup_report, \
+    disable_startup_report, startup_report
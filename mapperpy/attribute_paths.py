@@ -0,0 +1,122 @@
+from operator import attrgetter
+
+from mapperpy.exceptions import ConfigurationException
+
+PATH_SEPARATOR = "."
+
+
+def is_attribute_path(attr_name):
+    return bool(attr_name) and PATH_SEPARATOR in attr_name
+
+
+class AttributePath(object):
+    """
+    Accessor of a nested attribute given by dotted path (e.g. "address.city"). Path is split once, levels can be
+    objects or dicts. If any of intermediate values is None, None is returned. Key (or instance attribute) named
+    literally like the path takes precedence over nested value.
+    """
+
+    __slots__ = ("path", "segments", "__get_nested_attr")
+
+    def __init__(self, path):
+        self.path = path
+        self.segments = tuple(path.split(PATH_SEPARATOR))
+        self.__get_nested_attr = attrgetter(path)
+
+    def get(self, obj):
+        if isinstance(obj, dict):
+            if self.path in obj:
+                return obj[self.path]
+        elif self.path in getattr(obj, "__dict__", ()):
+            return obj.__dict__[self.path]
+        else:
+            try:
+                # all levels are objects in the common case - resolved by a single attrgetter call
+                return self.__get_nested_attr(obj)
+            except AttributeError:
+                pass
+
+        for segment in self.segments:
+            if obj is None:
+                return None
+            obj = obj[segment] if isinstance(obj, dict) else getattr(obj, segment)
+
+        return obj
+
+    def find(self, obj):
+        """
+        Returns value under the path or None if any of its levels is missing.
+        """
+        for segment in self.segments:
+            if obj is None:
+                return None
+            obj = obj.get(segment) if isinstance(obj, dict) else getattr(obj, segment, None)
+
+        return obj
+
+
+class NestedTargetPlan(object):
+    """
+    Builds nested target attributes from mapped values stored under dotted paths. Params dict
+    {"address.city": "Krakow"} becomes {"address": Address(city="Krakow")} - class of nested value is taken from
+    target prototype (dict if prototype has no value there).
+    """
+
+    def __init__(self, paths, target_prototype):
+        tree = {}
+        for path in paths:
+            node = tree
+            segments = path.split(PATH_SEPARATOR)
+            for segment in segments[:-1]:
+                node = node.setdefault(segment, {})
+                if not isinstance(node, dict):
+                    raise ConfigurationException("Attribute path {} conflicts with other mapped path".format(path))
+            if isinstance(node.get(segments[-1]), dict):
+                raise ConfigurationException("Attribute path {} conflicts with other mapped path".format(path))
+            node[segments[-1]] = path
+
+        self.__nodes = self.__compile_nodes(tree, target_prototype)
+
+    def build(self, params_dict):
+        """
+        Replaces values under dotted paths in *params_dict* with nested values (in place).
+        """
+        for attr_name, nested_value in self.__build_nodes(self.__nodes, params_dict):
+            params_dict[attr_name] = nested_value
+
+    @classmethod
+    def __compile_nodes(cls, tree, prototype):
+        """
+        Returns (attr_name, factory, leaves, subnodes) tuples, leaves are (attr_name, path) pairs.
+        """
+        nodes = []
+
+        for attr_name, subtree in sorted(tree.items()):
+            proto_value = cls.__get_proto_value(prototype, attr_name)
+            factory = proto_value.__class__ if proto_value is not None and not isinstance(proto_value, dict) \
+                else dict
+
+            leaves = tuple((name, path) for name, path in sorted(subtree.items()) if not isinstance(path, dict))
+            subnodes = cls.__compile_nodes(
+                {name: node for name, node in subtree.items() if isinstance(node, dict)}, proto_value)
+            nodes.append((attr_name, factory, leaves, subnodes))
+
+        return tuple(nodes)
+
+    @classmethod
+    def __build_nodes(cls, nodes, params_dict):
+        for attr_name, factory, leaves, subnodes in nodes:
+            values = {name: params_dict.pop(path) for name, path in leaves if path in params_dict}
+            values.update(cls.__build_nodes(subnodes, params_dict))
+
+            # nothing mapped into nested value (e.g. not requested fields) - attribute is skipped
+            if values:
+                yield attr_name, factory(**values)
+
+    @staticmethod
+    def __get_proto_value(prototype, attr_name):
+        if prototype is None:
+            return None
+        if isinstance(prototype, dict):
+            return prototype.get(attr_name)
+        return getattr(prototype, attr_name, None)
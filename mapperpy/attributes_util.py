@@ -6,6 +6,10 @@ def get_attributes(obj):
     if isinstance(obj, dict):
         return obj.keys()
 
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        # namedtuple - only fields are attributes, not its helpers (_fields, _asdict etc.)
+        return list(obj._fields)
+
     attributes = inspect.getmembers(obj, lambda a: not(inspect.isroutine(a)))
     return [attr[0] for attr in attributes if not(attr[0].startswith('__') and attr[0].endswith('__'))]
 
@@ -16,16 +20,28 @@ class AttributesCache(object):
         self.__cached_class = None
         self.__cached_class_attrs = None
         self.__get_attributes_func = get_attributes_func
+        self.__hits = 0
+        self.__misses = 0
 
     def get_attrs_update_cache(self, obj):
         if isinstance(obj, dict):
             return set(obj.keys())
         elif self.__cached_class_attrs is not None and isinstance(obj, self.__cached_class):
+            self.__hits += 1
             return self.__cached_class_attrs
         else:
+            self.__misses += 1
             self.__update_source_class_cache(obj)
             return self.__cached_class_attrs
 
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
     def __update_source_class_cache(self, obj):
         self.__cached_class = type(obj)
         self.__cached_class_attrs = set(self.__get_attributes_func(obj))
@@ -0,0 +1,46 @@
+from itertools import islice
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class BatchFunction(object):
+    """
+    Initializer or converter which processes whole chunk of values at once: it's called with list of source objects
+    (initializer) or attribute values (converter) and returns list of results in the same order. Mapper calls it once
+    per chunk of objects in *map_many()*, e.g. to load related entities with a single query. Called with a single value
+    (e.g. by *map()*) it processes one-element chunk.
+    """
+
+    def __init__(self, func):
+        self.__func = func
+
+    def __call__(self, value):
+        return self.call_batch([value])[0]
+
+    def call_batch(self, values):
+        results = self.__func(values)
+
+        if len(results) != len(values):
+            raise ValueError("Batch function {} returned {} results for {} values".format(
+                getattr(self.__func, "__name__", self.__func), len(results), len(values)))
+
+        return results
+
+
+def batched(func):
+    """
+    Marks function as batch initializer / converter (see :class:`BatchFunction`), can be used as decorator.
+    """
+    return BatchFunction(func)
+
+
+def iter_chunks(iterable, chunk_size):
+    """
+    Yields lists of at most *chunk_size* consecutive items of given iterable.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,3 @@
+from mapperpy.benchmarks.runner import run_benchmarks, compare_with_baseline, load_results, save_results, Regression
+from mapperpy.benchmarks.scenarios import Scenario, SCENARIOS, get_scenarios
+from mapperpy.benchmarks.memory import run_memory_benchmarks, check_budgets
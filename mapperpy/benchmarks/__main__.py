@@ -0,0 +1,96 @@
+import argparse
+import os
+import sys
+
+from mapperpy.benchmarks.memory import run_memory_benchmarks, check_budgets, DEFAULT_MEMORY_NUMBER, MEMORY_METRICS
+from mapperpy.benchmarks.runner import run_benchmarks, compare_with_baseline, load_results, save_results, \
+    DEFAULT_REPEAT, DEFAULT_NUMBER, DEFAULT_THRESHOLD
+from mapperpy.benchmarks.scenarios import SCENARIOS
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m mapperpy.benchmarks", description="MapperPy benchmarks")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help="scenarios to run (default: all): {}".format(", ".join(s.name for s in SCENARIOS)))
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("-b", "--baseline", help="compare results against baseline JSON file")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before reporting regression (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store results as new baseline (file given by --baseline)")
+    parser.add_argument("-m", "--memory", action="store_true",
+                        help="measure retained memory instead of time and check allocation budgets")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("-n", "--number", type=int,
+                        help="calls per round (default: {}, {} with --memory)".format(
+                            DEFAULT_NUMBER, DEFAULT_MEMORY_NUMBER))
+    return parser.parse_args(argv)
+
+
+def print_results(results, baseline=None):
+    baseline_scenarios = baseline.get("scenarios", {}) if baseline else {}
+
+    for name, values in sorted(results["scenarios"].items()):
+        if "objects_per_object" in values:
+            line = "{:<28}{:>10.2f} allocated{:>10.2f} retained objects{:>12.1f} B per object".format(
+                name, values["allocations_per_object"], values["objects_per_object"], values["bytes_per_object"])
+            if "peak_bytes" in values:
+                line += "{:>12} B peak".format(values["peak_bytes"])
+            print(line)
+            continue
+
+        line = "{:<28}{:>12.3f}us".format(name, values["seconds_per_call"] * 1e6)
+        if name in baseline_scenarios:
+            ratio = values["seconds_per_call"] / baseline_scenarios[name]["seconds_per_call"]
+            line += "  ({:+.1f}% vs baseline)".format((ratio - 1) * 100)
+        print(line)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.save_baseline and not args.baseline:
+        print("--save-baseline requires --baseline")
+        return 2
+
+    if args.memory:
+        results = run_memory_benchmarks(args.scenarios, number=args.number or DEFAULT_MEMORY_NUMBER)
+    else:
+        results = run_benchmarks(args.scenarios, repeat=args.repeat, number=args.number or DEFAULT_NUMBER)
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print_results(results)
+        print("Baseline saved to {}".format(args.baseline))
+        return 0
+
+    baseline = load_results(args.baseline) if args.baseline and os.path.exists(args.baseline) else None
+    print_results(results, baseline)
+
+    violations = check_budgets(results, args.scenarios) if args.memory else []
+    if violations:
+        print("Allocation budgets exceeded:")
+        for violation in violations:
+            print("  {}".format(violation))
+
+    if args.baseline and baseline is None:
+        print("Baseline {} not found, nothing to compare".format(args.baseline))
+        return 1 if violations else 0
+
+    metrics = MEMORY_METRICS if args.memory else ["seconds_per_call"]
+    regressions = [regression for metric in metrics
+                   for regression in compare_with_baseline(results, baseline, args.threshold, metric)] \
+        if baseline else []
+    if regressions:
+        print("Regressions (threshold {:.0f}%):".format(args.threshold * 100))
+        for regression in regressions:
+            print("  {}".format(regression))
+
+    return 1 if regressions or violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import gc
+import platform
+import sys
+
+from mapperpy.benchmarks.runner import Regression
+from mapperpy.benchmarks.scenarios import get_scenarios
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2 without pytracemalloc - peak memory is not reported
+    tracemalloc = None
+
+DEFAULT_MEMORY_NUMBER = 200
+MEMORY_METRICS = ("allocations_per_object", "objects_per_object", "bytes_per_object", "peak_bytes")
+
+
+def run_memory_benchmarks(scenario_names=None, number=DEFAULT_MEMORY_NUMBER):
+    """
+    Measures memory allocated by *number* calls of benchmark scenarios. For each scenario number of objects allocated
+    per mapped object is reported - it's counted by garbage collector (generation 0 counter with collections disabled)
+    on every Python version, so only container objects (objects, dicts, lists, tuples...) are included. Number of new
+    live objects (found through garbage collector) retained by results and their size (*sys.getsizeof*) per mapped
+    object is reported as well. Objects created once by the interpreter (e.g. caches) add a constant overhead, so
+    *number* shouldn't be too small. If *tracemalloc* is available, peak memory traced during a single call is
+    reported too.
+    """
+    results = {}
+
+    for scenario in get_scenarios(scenario_names):
+        run = scenario.setup()
+        # mapping plans and caches are built by the first call
+        run()
+
+        allocations = _measure_allocations(run, number)
+        objects, size = _measure_retained(run, number)
+        mapped_objects = float(number * scenario.objects_per_call)
+        results[scenario.name] = {
+            "allocations_per_object": allocations / mapped_objects,
+            "objects_per_object": objects / mapped_objects,
+            "bytes_per_object": size / mapped_objects,
+            "number": number,
+        }
+        if tracemalloc is not None:
+            results[scenario.name]["peak_bytes"] = _measure_peak(run)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "scenarios": results,
+    }
+
+
+def check_budgets(results, scenario_names=None):
+    """
+    Returns list of :class:`Regression` (with budget as baseline value) for scenarios which allocate more objects per
+    mapped object than their *allocation_budget*.
+    """
+    violations = []
+
+    for scenario in get_scenarios(scenario_names):
+        values = results.get("scenarios", {}).get(scenario.name)
+        if scenario.allocation_budget is None or values is None:
+            continue
+
+        if values["allocations_per_object"] > scenario.allocation_budget:
+            violations.append(Regression(
+                scenario.name, scenario.allocation_budget, values["allocations_per_object"], "allocations_per_object"))
+
+    return violations
+
+
+def _measure_allocations(run, number):
+    """
+    Returns number of objects tracked by garbage collector allocated by *number* calls and not freed by reference
+    counting (temporary objects freed right away are not included, garbage reference cycles are). Collections are
+    disabled during the calls, so that generation 0 counter isn't reset.
+    """
+    call_results = [None] * number
+    indexes = range(number)
+    gc.collect()
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        before = gc.get_count()[0]
+        for idx in indexes:
+            call_results[idx] = run()
+        return gc.get_count()[0] - before
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure_retained(run, number):
+    call_results = [None] * number
+    gc.collect()
+
+    before = _live_objects()
+    for idx in range(number):
+        call_results[idx] = run()
+    gc.collect()
+    after = _live_objects(exclude=before)
+
+    new_objects = [obj for obj_id, obj in after.items() if obj_id not in before]
+    return len(new_objects), sum(sys.getsizeof(obj) for obj in new_objects)
+
+
+def _live_objects(exclude=None):
+    """
+    Returns id -> object of objects tracked by garbage collector and objects they refer to directly (strings, numbers
+    and other objects which aren't tracked themselves). Objects are kept alive, so that their ids aren't reused.
+    """
+    tracked_objects = gc.get_objects()
+    live_objects = {}
+
+    for obj in tracked_objects:
+        if obj is exclude:
+            continue
+        live_objects[id(obj)] = obj
+        for referent in gc.get_referents(obj):
+            if not gc.is_tracked(referent):
+                live_objects[id(referent)] = referent
+
+    return live_objects
+
+
+def _measure_peak(run):
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,82 @@
+import json
+import platform
+import timeit
+
+from mapperpy.benchmarks.scenarios import get_scenarios
+
+DEFAULT_REPEAT = 5
+DEFAULT_NUMBER = 2000
+DEFAULT_THRESHOLD = 0.1
+
+
+class Regression(object):
+
+    def __init__(self, scenario_name, baseline_value, current_value, metric="seconds_per_call"):
+        self.scenario_name = scenario_name
+        self.baseline_value = baseline_value
+        self.current_value = current_value
+        self.metric = metric
+
+    @property
+    def ratio(self):
+        return self.current_value / self.baseline_value if self.baseline_value else float("inf")
+
+    def __repr__(self):
+        if self.metric == "seconds_per_call":
+            return "{}: {:.3f}us -> {:.3f}us ({:+.1f}%)".format(
+                self.scenario_name, self.baseline_value * 1e6, self.current_value * 1e6, (self.ratio - 1) * 100)
+
+        return "{} {}: {:.1f} -> {:.1f} ({:+.1f}%)".format(
+            self.scenario_name, self.metric, self.baseline_value, self.current_value, (self.ratio - 1) * 100)
+
+
+def run_benchmarks(scenario_names=None, repeat=DEFAULT_REPEAT, number=DEFAULT_NUMBER):
+    """
+    Runs benchmark scenarios and returns JSON-serializable results. For each scenario the best time per call out of
+    *repeat* rounds (each of *number* calls) is reported - minimum is the least noisy estimate.
+    """
+    results = {}
+
+    for scenario in get_scenarios(scenario_names):
+        timings = timeit.Timer(scenario.setup()).repeat(repeat=repeat, number=number)
+        results[scenario.name] = {
+            "seconds_per_call": min(timings) / number,
+            "repeat": repeat,
+            "number": number,
+        }
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "scenarios": results,
+    }
+
+
+def compare_with_baseline(results, baseline, threshold=DEFAULT_THRESHOLD, metric="seconds_per_call"):
+    """
+    Returns list of :class:`Regression` for scenarios which got slower than baseline by more than *threshold*
+    (relative, i.e. 0.1 means 10%). Scenarios missing on either side are ignored.
+    """
+    regressions = []
+
+    baseline_scenarios = baseline.get("scenarios", {})
+    for name, values in sorted(results.get("scenarios", {}).items()):
+        if name not in baseline_scenarios or metric not in baseline_scenarios[name] or metric not in values:
+            continue
+
+        baseline_value = baseline_scenarios[name][metric]
+        current_value = values[metric]
+        if current_value > baseline_value * (1 + threshold):
+            regressions.append(Regression(name, baseline_value, current_value, metric))
+
+    return regressions
+
+
+def load_results(path):
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def save_results(results, path):
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
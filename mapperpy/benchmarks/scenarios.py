@@ -0,0 +1,239 @@
+from datetime import datetime
+from enum import Enum
+
+from mapperpy import ObjectMapper, OneWayMapper
+
+
+class Scenario(object):
+    """
+    Single benchmark case. *setup* is called once (outside of the measured code) and has to return no-arg callable
+    which performs the measured work and returns its result (kept alive when measuring retained memory).
+
+    :param objects_per_call: number of objects mapped by single call, memory is reported per mapped object
+    :param allocation_budget: maximum number of objects allocated per mapped object
+    """
+
+    def __init__(self, name, setup, description="", objects_per_call=1, allocation_budget=None):
+        self.name = name
+        self.setup = setup
+        self.description = description
+        self.objects_per_call = objects_per_call
+        self.allocation_budget = allocation_budget
+
+    def __repr__(self):
+        return "Scenario({})".format(self.name)
+
+
+class Status(Enum):
+    active = 1
+    suspended = 2
+
+
+class FlatSource(object):
+    def __init__(self, id=None, name=None, email=None, age=None, score=None, country=None, active=None,
+                 created=None, status=None, notes=None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.age = age
+        self.score = score
+        self.country = country
+        self.active = active
+        self.created = created
+        self.status = status
+        self.notes = notes
+
+
+class FlatTarget(object):
+    def __init__(self, id=None, full_name=None, email=None, age=None, score=None, country=None, active=None,
+                 created=None, status=None, notes=None):
+        self.id = id
+        self.full_name = full_name
+        self.email = email
+        self.age = age
+        self.score = score
+        self.country = country
+        self.active = active
+        self.created = created
+        self.status = status
+        self.notes = notes
+
+
+class AddressSource(object):
+    def __init__(self, street=None, city=None, zip_code=None):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class AddressTarget(object):
+    def __init__(self, street=None, city=None, zip_code=None):
+        self.street = street
+        self.city = city
+        self.zip_code = zip_code
+
+
+class PersonSource(object):
+    def __init__(self, id=None, name=None, address=None, billing_address=None):
+        self.id = id
+        self.name = name
+        self.address = address
+        self.billing_address = billing_address
+
+
+class PersonTarget(object):
+    def __init__(self, id=None, name=None, address=None, billing_address=None):
+        self.id = id
+        self.name = name
+        self.address = address
+        self.billing_address = billing_address
+
+
+COLLECTION_SIZE = 100
+
+_DICT_KEY_SHAPES = [
+    ("id", "name", "email", "age", "score"),
+    ("id", "name", "email", "country"),
+    ("id", "email", "age", "score", "country", "active"),
+    ("id", "name", "notes"),
+]
+
+
+def make_flat_source(idx=0):
+    return FlatSource(id=idx, name="name_{}".format(idx), email="user{}@example.com".format(idx), age=30 + idx % 40,
+                      score=idx * 0.5, country="PL", active=True, notes=None)
+
+
+def make_flat_dict(idx=0, keys=_DICT_KEY_SHAPES[0]):
+    values = make_flat_source(idx).__dict__
+    return {key: values[key] for key in keys}
+
+
+def make_flat_mapper():
+    return ObjectMapper.from_class(FlatSource, FlatTarget).custom_mappings({"name": "full_name"})
+
+
+def _setup_object_to_object():
+    mapper = make_flat_mapper()
+    obj = make_flat_source()
+    return lambda: mapper.map(obj)
+
+
+def _setup_object_to_dict():
+    mapper = ObjectMapper.for_dict(FlatSource())
+    obj = make_flat_source()
+    return lambda: mapper.map(obj)
+
+
+def _setup_dict_to_object_uniform():
+    mapper = OneWayMapper.for_target_class(FlatSource)
+    obj = make_flat_dict()
+    return lambda: mapper.map(obj)
+
+
+def _setup_dict_to_object_varying():
+    mapper = OneWayMapper.for_target_class(FlatSource)
+    objs = [make_flat_dict(idx, keys) for idx, keys in enumerate(_DICT_KEY_SHAPES)]
+
+    return lambda: [mapper.map(obj) for obj in objs]
+
+
+def _setup_dict_to_dict_rename():
+    mapper = ObjectMapper.from_class(dict, dict).custom_mappings(
+        {"id": "user_id", "name": "user_name", "email": "user_email", "age": "age", "score": "score"})
+    obj = make_flat_dict()
+    return lambda: mapper.map(obj)
+
+
+def make_nested_mapper():
+    return ObjectMapper.from_class(PersonSource, PersonTarget).nested_mapper(
+        ObjectMapper.from_class(AddressSource, AddressTarget))
+
+
+def make_person_source(idx=0):
+    return PersonSource(id=idx, name="name_{}".format(idx),
+                        address=AddressSource("Main St {}".format(idx), "Krakow", "30-001"),
+                        billing_address=AddressSource("Side St {}".format(idx), "Warsaw", "00-001"))
+
+
+def _setup_nested():
+    mapper = make_nested_mapper()
+    obj = make_person_source()
+    return lambda: mapper.map(obj)
+
+
+def _setup_collection():
+    mapper = make_flat_mapper()
+    objs = [make_flat_source(idx) for idx in range(COLLECTION_SIZE)]
+    return lambda: [mapper.map(obj) for obj in objs]
+
+
+def _setup_enum_conversion():
+    mapper = ObjectMapper.from_prototype(FlatSource(status=Status.active), FlatTarget(status=""))
+    obj = FlatSource(id=1, status=Status.suspended)
+    return lambda: mapper.map(obj)
+
+
+def _setup_datetime_conversion():
+    mapper = ObjectMapper.from_prototype(FlatSource(created=datetime.now()), FlatTarget(created=""))
+    obj = FlatSource(id=1, created=datetime(2016, 5, 17, 12, 30, 45, 123456))
+    target = FlatTarget(id=1, created="2016-05-17T12:30:45.123456")
+
+    return lambda: (mapper.map(obj), mapper.map(target))
+
+
+def _setup_mapper_construction():
+    return lambda: ObjectMapper.from_class(FlatSource, FlatTarget).custom_mappings({"name": "full_name"}) \
+        .nested_mapper(ObjectMapper.from_class(AddressSource, AddressTarget))
+
+
+def _setup_record_batch():
+    mapper = OneWayMapper.for_target_prototype(FlatTarget(status=Status.active))
+    objs = [make_flat_source(idx) for idx in range(COLLECTION_SIZE)]
+    return lambda: mapper.map_many(objs, as_batch=True)
+
+
+def _setup_columns():
+    mapper = OneWayMapper.for_target_prototype(FlatTarget(status=Status.active))
+    columns = {"id": list(range(COLLECTION_SIZE)), "age": [30 + idx % 40 for idx in range(COLLECTION_SIZE)],
+               "status": [idx % 2 + 1 for idx in range(COLLECTION_SIZE)]}
+    return lambda: list(mapper.map_from_columns(columns))
+
+
+# allocation budgets are set above objects allocated per mapped object in measured runs (--memory), with room for
+# instance __dict__ which is a separate object on Python 2
+SCENARIOS = [
+    Scenario("object_to_object", _setup_object_to_object, "flat object -> object with one custom mapping",
+             allocation_budget=3),
+    Scenario("object_to_dict", _setup_object_to_dict, "flat object -> dict", allocation_budget=2),
+    Scenario("dict_to_object_uniform", _setup_dict_to_object_uniform, "dict -> object, same key shape every call",
+             allocation_budget=3),
+    Scenario("dict_to_object_varying", _setup_dict_to_object_varying,
+             "dict -> object, {} different key shapes".format(len(_DICT_KEY_SHAPES)),
+             objects_per_call=len(_DICT_KEY_SHAPES), allocation_budget=3),
+    Scenario("dict_to_dict_rename", _setup_dict_to_dict_rename, "dict -> dict with renamed keys", allocation_budget=2),
+    Scenario("nested_mapper", _setup_nested, "object with two nested objects mapped by nested mapper",
+             allocation_budget=7),
+    Scenario("collection", _setup_collection, "list of {} flat objects".format(COLLECTION_SIZE),
+             objects_per_call=COLLECTION_SIZE, allocation_budget=3),
+    Scenario("enum_conversion", _setup_enum_conversion, "Enum -> str conversion", allocation_budget=3),
+    Scenario("datetime_conversion", _setup_datetime_conversion, "datetime -> str and str -> datetime conversion",
+             objects_per_call=2, allocation_budget=4),
+    Scenario("mapper_construction", _setup_mapper_construction, "ObjectMapper with custom and nested mapping"),
+    Scenario("record_batch", _setup_record_batch, "{} flat objects -> RecordBatch".format(COLLECTION_SIZE),
+             objects_per_call=COLLECTION_SIZE, allocation_budget=1),
+    Scenario("columns", _setup_columns, "{} rows of 3 columns -> objects".format(COLLECTION_SIZE),
+             objects_per_call=COLLECTION_SIZE, allocation_budget=3),
+]
+
+
+def get_scenarios(names=None):
+    if not names:
+        return list(SCENARIOS)
+
+    by_name = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError("Unknown benchmark scenario(s): {}".format(", ".join(unknown)))
+
+    return [by_name[name] for name in names]
@@ -0,0 +1,324 @@
+"""
+Ahead-of-time generation of mapping code. Configured :class:`ObjectMapper` instances are turned into a plain Python
+module with straight-line ``map_<Source>_to_<Target>`` functions - attribute accesses, type conversions and nested
+mappings are inlined, custom converters and initializers (and classes) are imported by their import path. Generated
+module can be imported instead of building mappers at runtime::
+
+    python -m mapperpy.codegen myapp.mappers -o myapp/generated_mappers.py
+
+Generated functions assume that source objects have the attributes of source side prototype (dicts have its keys) and
+they don't collect statistics nor call tracing hooks.
+"""
+import __builtin__ as builtins
+import argparse
+import importlib
+import keyword
+import re
+import sys
+from collections import OrderedDict, deque
+from datetime import datetime
+
+from enum import Enum
+
+from mapperpy.attributes_util import get_attributes
+from mapperpy.attribute_paths import is_attribute_path
+from mapperpy.conversions import parse_datetime
+from mapperpy.exceptions import ConfigurationException
+from mapperpy.mapper_spec import import_object
+from mapperpy.object_mapper import ObjectMapper
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_BUILTINS_MODULES = ("__builtin__", "builtins")
+_MAX_LINE_LENGTH = 120
+
+# names which can't be used for imported classes and functions - argument of generated functions and builtins
+_RESERVED_NAMES = ("obj",) + tuple(dir(builtins))
+
+
+def get_import_path(obj):
+    """
+    Returns (module name, name) under which module level class or function can be imported.
+
+    :raise ConfigurationException: if the object can't be imported by its name (e.g. it's lambda or local function)
+    """
+    module_name = getattr(obj, "__module__", None)
+    name = getattr(obj, "__name__", None)
+
+    if module_name and module_name != "__main__" and name and _IDENTIFIER.match(name):
+        try:
+            if import_object("{}:{}".format(module_name, name)) is obj:
+                return module_name, name
+        except ImportError:
+            pass
+
+    raise ConfigurationException(
+        "{!r} can't be referenced by import path - only module level classes and functions can be used in generated "
+        "code".format(obj))
+
+
+def generate_module(mappers, source_module_name=None):
+    """
+    Returns source code of module with mapping functions (both directions) for given :class:`ObjectMapper` instances.
+    """
+    generator = _ModuleGenerator()
+    for mapper in mappers:
+        generator.add_object_mapper(mapper)
+    return generator.generate(source_module_name)
+
+
+def find_mappers(module):
+    """
+    Returns :class:`ObjectMapper` instances defined at the module level, ordered by their names.
+    """
+    return [value for name, value in sorted(vars(module).items()) if isinstance(value, ObjectMapper)]
+
+
+class _Namespace(object):
+
+    def __init__(self, reserved_names):
+        self.__names = set(reserved_names)
+
+    def allocate(self, name):
+        candidate = name
+        suffix = 2
+        while candidate in self.__names or keyword.iskeyword(candidate):
+            candidate = "{}_{}".format(name, suffix)
+            suffix += 1
+
+        self.__names.add(candidate)
+        return candidate
+
+
+class _ModuleGenerator(object):
+
+    def __init__(self):
+        self.__namespace = _Namespace(_RESERVED_NAMES)
+        # (module name, name) -> name used in generated code
+        self.__imports = {}
+        # (id(one way mapper), source type) -> (function name, mapper, source type)
+        self.__functions = OrderedDict()
+        # target class -> prototype, used to find attributes of source objects
+        self.__prototypes = {}
+
+    def add_object_mapper(self, mapper):
+        self.__collect_prototypes(mapper)
+
+        left_class = mapper.from_right_mapper.target_class
+        right_class = mapper.from_left_mapper.target_class
+        self.__get_function_name(mapper.from_left_mapper, left_class)
+        self.__get_function_name(mapper.from_right_mapper, right_class)
+
+    def generate(self, source_module_name=None):
+        functions = []
+
+        # nested mappers add their functions while parent functions are generated
+        idx = 0
+        while idx < len(self.__functions):
+            function_name, mapper, source_type = list(self.__functions.values())[idx]
+            functions.append(self.__generate_function(function_name, mapper, source_type))
+            idx += 1
+
+        header = '"""\nMapping functions generated by mapperpy.codegen{}. Do not edit - regenerate instead.\n"""'.format(
+            " from " + source_module_name if source_module_name else "")
+
+        imports = self.__generate_imports()
+        return "\n".join([header] + ([""] + imports if imports else []) + ["", "", "\n\n".join(functions)])
+
+    def __collect_prototypes(self, mapper):
+        one_way_mappers = deque([mapper.from_left_mapper, mapper.from_right_mapper])
+        visited = set()
+
+        while one_way_mappers:
+            one_way_mapper = one_way_mappers.popleft()
+            if id(one_way_mapper) in visited:
+                continue
+            visited.add(id(one_way_mapper))
+
+            if one_way_mapper.target_prototype is not None:
+                self.__prototypes.setdefault(one_way_mapper.target_class, one_way_mapper.target_prototype)
+            one_way_mappers.extend(
+                nested_mapper for _, nested_mapper in one_way_mapper.describe_mapping([]).nested_mappers)
+
+    def __get_source_attributes(self, source_type):
+        if source_type not in self.__prototypes:
+            try:
+                self.__prototypes[source_type] = source_type()
+            except TypeError:
+                # attributes of the source can't be determined - only explicit mappings are used
+                self.__prototypes[source_type] = None
+
+        prototype = self.__prototypes[source_type]
+        return get_attributes(prototype) if prototype is not None else []
+
+    def __get_function_name(self, mapper, source_type):
+        key = (id(mapper), source_type)
+        if key not in self.__functions:
+            function_name = self.__namespace.allocate("map_{}_to_{}".format(
+                source_type.__name__, mapper.target_class.__name__))
+            self.__functions[key] = (function_name, mapper, source_type)
+
+        return self.__functions[key][0]
+
+    def __reference(self, obj):
+        """
+        Returns name under which class or function is available in generated module.
+        """
+        module_name, name = get_import_path(obj)
+        if module_name in _BUILTINS_MODULES:
+            return name
+
+        if (module_name, name) not in self.__imports:
+            self.__imports[(module_name, name)] = self.__namespace.allocate(name)
+
+        return self.__imports[(module_name, name)]
+
+    def __generate_imports(self):
+        names_by_module = {}
+        for (module_name, name), local_name in self.__imports.items():
+            names_by_module.setdefault(module_name, []).append(
+                name if name == local_name else "{} as {}".format(name, local_name))
+
+        import_lines = []
+        for module_name, names in sorted(names_by_module.items()):
+            import_line = "from {} import {}".format(module_name, ", ".join(sorted(names)))
+            if len(import_line) > _MAX_LINE_LENGTH:
+                import_line = "from {} import (\n{})".format(
+                    module_name, "".join("    {},\n".format(name) for name in sorted(names)))
+            import_lines.append(import_line)
+
+        return import_lines
+
+    def __generate_function(self, function_name, mapper, source_type):
+        description = mapper.describe_mapping(self.__get_source_attributes(source_type))
+
+        lines = ["def {}(obj):".format(function_name)]
+        values = OrderedDict()
+
+        for idx, attr in enumerate(description.attributes):
+            if is_attribute_path(attr.attr_name_from) or is_attribute_path(attr.attr_name_to):
+                raise ConfigurationException("Can't generate code for mapper {}. Attribute paths ({}->{}) are not "
+                                             "supported".format(mapper, attr.attr_name_from, attr.attr_name_to))
+
+            value_expr = self.__get_attribute_expr(source_type, attr.attr_name_from, description.fail_on_get_attr)
+
+            if attr.converter is not None:
+                values[attr.attr_name_to] = "{}({})".format(self.__reference(attr.converter), value_expr)
+                continue
+
+            value_name = "value_{}".format(idx)
+            branches = self.__get_nested_branches(attr, value_name) + \
+                self.__get_conversion_branches(attr.target_type, value_name)
+            if not branches:
+                values[attr.attr_name_to] = value_expr
+                continue
+
+            lines.append("    {} = {}".format(value_name, value_expr))
+            for branch_idx, (condition, statement) in enumerate(branches):
+                lines.append("    {} {}:".format("if" if branch_idx == 0 else "elif", condition))
+                lines.append("        {}".format(statement))
+            values[attr.attr_name_to] = value_name
+
+        for attr_name, initializer in description.initializers:
+            values[attr_name] = "{}(obj)".format(self.__reference(initializer))
+
+        lines.extend(self.__get_return_lines(description.target_class, values))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __get_attribute_expr(source_type, attr_name, fail_on_get_attr):
+        if issubclass(source_type, dict):
+            return "obj[{!r}]".format(attr_name) if fail_on_get_attr else "obj.get({!r})".format(attr_name)
+        elif not fail_on_get_attr:
+            return "getattr(obj, {!r}, None)".format(attr_name)
+        elif _IDENTIFIER.match(attr_name) and not keyword.iskeyword(attr_name):
+            return "obj.{}".format(attr_name)
+        return "getattr(obj, {!r})".format(attr_name)
+
+    def __get_nested_branches(self, attr, value_name):
+        branches = []
+
+        for from_type, nested_mapper in attr.nested_mappers:
+            condition = "type({}) is {}".format(value_name, self.__reference(from_type))
+            if isinstance(nested_mapper, ConfigurationException):
+                statement = "raise {}({!r})".format(self.__reference(ConfigurationException), nested_mapper.message)
+            else:
+                statement = "{0} = {1}({0})".format(value_name, self.__get_function_name(nested_mapper, from_type))
+            branches.append((condition, statement))
+
+        return branches
+
+    def __get_conversion_branches(self, to_type, value_name):
+        """
+        Returns (condition, statement) pairs applying the same type conversions as mapper does for values mapped to
+        attribute of given type.
+        """
+        if to_type is None:
+            return []
+
+        if issubclass(to_type, Enum):
+            enum_class = self.__reference(to_type)
+            return [("type({}) is int".format(value_name),
+                     "{0} = {1}({0})".format(value_name, enum_class)),
+                    ("isinstance({}, {}) and not isinstance({}, {})".format(
+                        value_name, self.__reference(basestring), value_name, self.__reference(Enum)),
+                     "{0} = getattr({1}, {0})".format(value_name, enum_class))]
+        elif to_type == int:
+            return [("isinstance({}, {})".format(value_name, self.__reference(Enum)),
+                     "{0} = {0}.value".format(value_name))]
+        elif issubclass(to_type, basestring):
+            return [("isinstance({}, {})".format(value_name, self.__reference(Enum)),
+                     "{0} = {0}.name".format(value_name)),
+                    ("isinstance({}, {})".format(value_name, self.__reference(datetime)),
+                     "{0} = {0}.isoformat()".format(value_name))]
+        elif issubclass(to_type, datetime):
+            return [("isinstance({}, {}) and not isinstance({}, {})".format(
+                value_name, self.__reference(basestring), value_name, self.__reference(Enum)),
+                "{0} = {1}({0})".format(value_name, self.__reference(parse_datetime)))]
+
+        return []
+
+    def __get_return_lines(self, target_class, values):
+        if not values:
+            return ["    return {}()".format(self.__reference(target_class))]
+
+        items = ["        {!r}: {},".format(attr_name, value) for attr_name, value in values.items()]
+
+        if target_class is dict:
+            return ["    return {"] + items + ["    }"]
+        elif all(_IDENTIFIER.match(attr_name) and not keyword.iskeyword(attr_name) for attr_name in values):
+            return ["    return {}(".format(self.__reference(target_class))] + \
+                ["        {}={},".format(attr_name, value) for attr_name, value in values.items()] + ["    )"]
+
+        return ["    return {}(**{{".format(self.__reference(target_class))] + items + ["    })"]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m mapperpy.codegen",
+                                     description="Generates module with mapping functions of ObjectMapper instances "
+                                                 "defined in given module")
+    parser.add_argument("module", help="module with ObjectMapper instances defined at the module level")
+    parser.add_argument("-o", "--output", help="write generated module to this file (default: standard output)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    mappers = find_mappers(importlib.import_module(args.module))
+    if not mappers:
+        sys.stderr.write("No ObjectMapper instances found in {}\n".format(args.module))
+        return 1
+
+    source_code = generate_module(mappers, args.module)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(source_code)
+    else:
+        sys.stdout.write(source_code)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
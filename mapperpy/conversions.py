@@ -0,0 +1,22 @@
+from datetime import datetime
+
+DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S")
+
+
+def parse_datetime(value):
+    """
+    Converts ISO 8601 string (with or without microseconds) to datetime. Used by mappers and generated modules (see
+    :mod:`mapperpy.codegen`).
+    """
+    try:
+        return datetime.strptime(value, DATETIME_FORMATS[0])
+    except ValueError as e1:
+        try:
+            return datetime.strptime(value, DATETIME_FORMATS[1])
+        except ValueError as e2:
+            raise ValueError("Could not create datetime object from string: {}. {}. {}".format(
+                value, e1.message, e2.message))
+
+
+def format_datetime(value):
+    return value.isoformat()
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+from mapperpy.batch_functions import BatchFunction
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "hit_rate"])
+
+
+class LRU(object):
+    """
+    Cache policy for value converters: results of the *size* most recently used (hashable) input values are
+    memoized, separately for every converter. Should be used only for pure converters.
+    """
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("Cache size has to be positive, got {}".format(size))
+        self.size = size
+
+    def wrap(self, converter):
+        if isinstance(converter, BatchFunction):
+            raise ValueError("Batch converters can't be cached")
+        return CachedConverter(converter, self.size)
+
+
+class CachedConverter(object):
+    """
+    Converter with memoized results. Values are cached by their type and value (so that e.g. 1 and True don't share
+    result), unhashable values are always converted.
+    """
+
+    def __init__(self, converter, max_size):
+        self.__converter = converter
+        self.__max_size = max_size
+        self.__cache = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __call__(self, value):
+        try:
+            key = (value.__class__, value)
+            hash(key)
+        except TypeError:
+            return self.__converter(value)
+
+        with self.__lock:
+            if key in self.__cache:
+                # re-inserted item becomes the most recently used one
+                result = self.__cache[key] = self.__cache.pop(key)
+                self.__hits += 1
+                return result
+            self.__misses += 1
+
+        result = self.__converter(value)
+
+        with self.__lock:
+            self.__cache[key] = result
+            if len(self.__cache) > self.__max_size:
+                self.__cache.popitem(last=False)
+
+        return result
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    @property
+    def hit_rate(self):
+        calls = self.__hits + self.__misses
+        return float(self.__hits) / calls if calls else 0.0
+
+    def cache_info(self):
+        return CacheInfo(self.__hits, self.__misses, self.__max_size, len(self.__cache), self.hit_rate)
+
+    def cache_clear(self):
+        with self.__lock:
+            self.__cache.clear()
+            self.__hits = self.__misses = 0
@@ -0,0 +1,79 @@
+from mapperpy.exceptions import TooManyErrorsException
+
+
+class MappingError(object):
+    """
+    Compact record of a single object which couldn't be mapped. Message is formatted only when requested.
+
+    :ivar index: index of the object in mapped iterable
+    :ivar attribute: name of the source attribute (or initialized target attribute) which couldn't be mapped, None if
+        the error isn't related to a single attribute (e.g. target object couldn't be created)
+    :ivar cause: exception raised when mapping
+    """
+    __slots__ = ("index", "attribute", "cause", "target_class", "params")
+
+    def __init__(self, index, attribute, cause, target_class=None, params=None):
+        self.index = index
+        self.attribute = attribute
+        self.cause = cause
+        # set when target object couldn't be created - only for the message
+        self.target_class = target_class
+        self.params = params
+
+    @property
+    def message(self):
+        cause = "{}: {}".format(self.cause.__class__.__name__, self.cause)
+
+        if self.target_class is not None:
+            return "Record {}: error when initializing class {} with params: {}\n{}".format(
+                self.index, self.target_class.__name__, self.params, cause)
+        elif self.attribute is not None:
+            return "Record {}: could not map attribute {}. {}".format(self.index, self.attribute, cause)
+        return "Record {}: {}".format(self.index, cause)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return "MappingError(index={!r}, attribute={!r}, cause={!r})".format(self.index, self.attribute, self.cause)
+
+
+class ErrorCollector(object):
+    """
+    Collects :class:`MappingError` records of objects which couldn't be mapped by *map_many(objs, errors=collector)*.
+    Failing objects are skipped and mapping carries on, unless there are more than *max_errors* errors - then
+    :class:`mapperpy.exceptions.TooManyErrorsException` is raised.
+    """
+
+    def __init__(self, max_errors=None):
+        self.__max_errors = max_errors
+        self.__errors = []
+
+    @property
+    def errors(self):
+        return list(self.__errors)
+
+    @property
+    def indexes(self):
+        """
+        Indexes of objects which couldn't be mapped.
+        """
+        return [error.index for error in self.__errors]
+
+    def add(self, error):
+        self.__errors.append(error)
+
+        if self.__max_errors is not None and len(self.__errors) > self.__max_errors:
+            raise TooManyErrorsException(self.errors)
+
+    def select_failed(self, objs):
+        """
+        Returns objects from the mapped sequence which couldn't be mapped, e.g. to retry them.
+        """
+        return [objs[idx] for idx in self.indexes]
+
+    def __len__(self):
+        return len(self.__errors)
+
+    def __iter__(self):
+        return iter(self.__errors)
@@ -3,3 +3,51 @@ __author__ = 'lgrech'
 
 class ConfigurationException(Exception):
     pass
+
+
+class RecordMappingException(Exception):
+    """
+    :ivar cause: exception raised when the record was mapped - when it was raised in a worker process, its description
+        (class name and message) is passed instead, as the exception itself doesn't have to be picklable
+    :ivar cause_traceback: formatted traceback of the cause, if known
+    """
+
+    def __init__(self, offset, cause, cause_traceback=None):
+        super(RecordMappingException, self).__init__(
+            "Could not map record at byte offset {}: {}".format(offset, _describe_cause(cause)))
+        self.offset = offset
+        self.cause = cause
+        self.cause_traceback = cause_traceback
+
+    def __reduce__(self):
+        # raised in worker processes so it has to be picklable
+        return self.__class__, (self.offset, _describe_cause(self.cause), self.cause_traceback)
+
+
+class TooManyErrorsException(Exception):
+
+    def __init__(self, errors):
+        super(TooManyErrorsException, self).__init__(
+            "Mapping aborted after {} errors. First error: {}".format(len(errors), errors[0].message))
+        self.errors = errors
+
+    def __reduce__(self):
+        return self.__class__, (self.errors,)
+
+
+class TrustedInputException(Exception):
+
+    def __init__(self, mapper_name, attr_name, reason):
+        super(TrustedInputException, self).__init__(
+            "Trusted input check failed in mapper {} for attribute {}: {}".format(mapper_name, attr_name, reason))
+        self.mapper_name = mapper_name
+        self.attr_name = attr_name
+        self.reason = reason
+
+    def __reduce__(self):
+        # may be raised in worker processes (see mapperpy.parallel) so it has to be picklable
+        return self.__class__, (self.mapper_name, self.attr_name, self.reason)
+
+
+def _describe_cause(cause):
+    return cause if isinstance(cause, basestring) else "{}: {}".format(cause.__class__.__name__, cause)
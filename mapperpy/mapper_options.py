@@ -17,3 +17,6 @@ class MapperOption(object):
 
 class MapperOptions(object):
     fail_on_get_attr = MapperOption('fail_on_get_attr')
+    # source objects are assumed to have all mapped attributes with stable types - set to True (or number of objects
+    # to check per source class) to check only first object(s) and map the rest without guards
+    trusted_input = MapperOption('trusted_input')
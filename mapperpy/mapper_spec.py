@@ -0,0 +1,133 @@
+import importlib
+
+import __builtin__ as builtins
+
+from mapperpy.mapper_options import MapperOptions, MapperOption
+from mapperpy.object_mapper import ObjectMapper
+
+
+def import_object(dotted_name):
+    """
+    Imports object by its name, e.g. "package.module.ClassName" or "package.module:function". Names without module
+    (e.g. "dict") refer to builtins.
+    """
+    if ":" in dotted_name:
+        module_name, attr_path = dotted_name.split(":", 1)
+    elif "." in dotted_name:
+        module_name, attr_path = dotted_name.rsplit(".", 1)
+    else:
+        module_name, attr_path = None, dotted_name
+
+    obj = importlib.import_module(module_name) if module_name else builtins
+    try:
+        for attr_name in attr_path.split("."):
+            obj = getattr(obj, attr_name)
+    except AttributeError:
+        raise ImportError("Can't import {}".format(dotted_name))
+
+    return obj
+
+
+class MapperSpec(object):
+    """
+    Declarative, picklable description of :class:`ObjectMapper`. Classes, converters, initializers and prototype
+    factories are referenced by dotted names (see :func:`import_object`), so the spec holds only plain data and can be
+    cheaply sent to worker processes or stored. Spec is callable - calling it builds the mapper, so it can be used
+    wherever mapper factory is expected.
+
+    :param left: name of "left" class
+    :param right: name of "right" class
+    :param mappings: custom mappings, as passed to :meth:`ObjectMapper.custom_mappings`
+    :param left_initializers: attribute name -> name of initializer function
+    :param right_initializers: attribute name -> name of initializer function
+    :param value_converters: "left" attribute name -> tuple of names of both converter functions
+    :param options: option name (attribute of :class:`MapperOptions`) -> value
+    :param nested: list of nested mappers' specs
+    :param left_prototype: name of no-arg function returning "left" prototype (mapper is created from prototypes then)
+    :param right_prototype: name of no-arg function returning "right" prototype
+    """
+
+    def __init__(self, left, right, mappings=None, left_initializers=None, right_initializers=None,
+                 value_converters=None, options=None, nested=None, left_prototype=None, right_prototype=None):
+        self.left = left
+        self.right = right
+        self.mappings = dict(mappings or {})
+        self.left_initializers = dict(left_initializers or {})
+        self.right_initializers = dict(right_initializers or {})
+        self.value_converters = {attr_name: tuple(converters)
+                                 for attr_name, converters in (value_converters or {}).items()}
+        self.options = dict(options or {})
+        self.nested = list(nested or [])
+        self.left_prototype = left_prototype
+        self.right_prototype = right_prototype
+
+    def build(self):
+        if self.left_prototype or self.right_prototype:
+            mapper = ObjectMapper.from_prototype(
+                self.__create_prototype(self.left_prototype, self.left),
+                self.__create_prototype(self.right_prototype, self.right))
+        else:
+            mapper = ObjectMapper.from_class(import_object(self.left), import_object(self.right))
+
+        if self.mappings:
+            mapper.custom_mappings(self.mappings)
+        if self.left_initializers:
+            mapper.left_initializers(self.__import_values(self.left_initializers))
+        if self.right_initializers:
+            mapper.right_initializers(self.__import_values(self.right_initializers))
+        if self.value_converters:
+            mapper.value_converters({attr_name: tuple(import_object(converter) for converter in converters)
+                                     for attr_name, converters in self.value_converters.items()})
+
+        for option_name, value in self.options.items():
+            if not isinstance(getattr(MapperOptions, option_name, None), MapperOption):
+                raise ValueError("Unknown mapper option: {}".format(option_name))
+            mapper.options(getattr(MapperOptions, option_name) == value)
+
+        for nested_spec in self.nested:
+            mapper.nested_mapper(nested_spec.build())
+
+        return mapper
+
+    __call__ = build
+
+    def to_dict(self):
+        """
+        Returns spec as dict of plain (e.g. JSON serializable) values.
+        """
+        spec_dict = {"left": self.left, "right": self.right}
+
+        for attr_name in ["mappings", "left_initializers", "right_initializers", "options", "left_prototype",
+                          "right_prototype"]:
+            if getattr(self, attr_name):
+                spec_dict[attr_name] = getattr(self, attr_name)
+        if self.value_converters:
+            spec_dict["value_converters"] = {attr_name: list(converters)
+                                             for attr_name, converters in self.value_converters.items()}
+        if self.nested:
+            spec_dict["nested"] = [nested_spec.to_dict() for nested_spec in self.nested]
+
+        return spec_dict
+
+    @classmethod
+    def from_dict(cls, spec_dict):
+        spec_dict = dict(spec_dict)
+        spec_dict["nested"] = [cls.from_dict(nested_dict) for nested_dict in spec_dict.get("nested", [])]
+        return cls(**spec_dict)
+
+    def __eq__(self, other):
+        return isinstance(other, MapperSpec) and self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "MapperSpec({}<->{})".format(self.left, self.right)
+
+    @staticmethod
+    def __create_prototype(factory_name, class_name):
+        return import_object(factory_name)() if factory_name else import_object(class_name)()
+
+    @staticmethod
+    def __import_values(names_dict):
+        return {attr_name: import_object(name) for attr_name, name in names_dict.items()}
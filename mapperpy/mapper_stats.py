@@ -0,0 +1,128 @@
+import threading
+import weakref
+
+MAPS = 0
+TIME_SPENT = 1
+ENUM_CONVERSIONS = 2
+DATETIME_CONVERSIONS = 3
+CUSTOM_CONVERSIONS = 4
+NESTED_MAPPINGS = 5
+GET_ATTR_FALLBACKS = 6
+
+_COUNTERS_COUNT = 7
+
+_settings = {"enabled": False}
+
+
+def enable_stats(enabled=True):
+    """
+    Globally enables (or disables) collecting of mapper statistics. Statistics are disabled by default.
+    """
+    _settings["enabled"] = bool(enabled)
+
+
+def disable_stats():
+    enable_stats(False)
+
+
+def stats_enabled():
+    return _settings["enabled"]
+
+
+class MapperStats(object):
+    """
+    Counters of a single mapper. Every thread increments its own list of counters (no locking on the hot path),
+    lists are merged when statistics are read. Counters of finished threads are folded into common totals.
+    """
+
+    def __init__(self):
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        # (weak reference to thread, counters) pairs of live threads
+        self.__all_counters = []
+        self.__finished_totals = [0] * _COUNTERS_COUNT
+
+    def get_counters(self):
+        """
+        Returns counters list of current thread or None if statistics are disabled.
+        """
+        if not _settings["enabled"]:
+            return None
+
+        try:
+            return self.__local.counters
+        except AttributeError:
+            counters = self.__local.counters = [0] * _COUNTERS_COUNT
+            with self.__lock:
+                self.__fold_finished_threads()
+                self.__all_counters.append((weakref.ref(threading.current_thread()), counters))
+            return counters
+
+    def count(self, counter_idx, value=1):
+        counters = self.get_counters()
+        if counters is not None:
+            counters[counter_idx] += value
+
+    def snapshot(self, cache_hits=0, cache_misses=0, converter_cache_hits=0, converter_cache_misses=0):
+        with self.__lock:
+            self.__fold_finished_threads()
+            totals = [sum(values) for values in zip(self.__finished_totals,
+                                                    *[counters for _, counters in self.__all_counters])]
+
+        return {
+            "maps": totals[MAPS],
+            "time_spent": totals[TIME_SPENT],
+            "attr_cache_hits": cache_hits,
+            "attr_cache_misses": cache_misses,
+            "conversions": {
+                "enum": totals[ENUM_CONVERSIONS],
+                "datetime": totals[DATETIME_CONVERSIONS],
+                "custom_converter": totals[CUSTOM_CONVERSIONS],
+                "nested_mapper": totals[NESTED_MAPPINGS],
+            },
+            "fail_on_get_attr_fallbacks": totals[GET_ATTR_FALLBACKS],
+            "converter_cache_hits": converter_cache_hits,
+            "converter_cache_misses": converter_cache_misses,
+        }
+
+
+    def __fold_finished_threads(self):
+        """
+        Adds counters of finished threads to totals and drops them, so that thread churn doesn't grow the counters
+        list. Has to be called with the lock held.
+        """
+        live_counters = []
+
+        for thread_ref, counters in self.__all_counters:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live_counters.append((thread_ref, counters))
+            else:
+                self.__finished_totals = [total + value for total, value in zip(self.__finished_totals, counters)]
+
+        self.__all_counters = live_counters
+
+    @property
+    def threads_count(self):
+        """
+        Number of live threads with own counters.
+        """
+        with self.__lock:
+            self.__fold_finished_threads()
+            return len(self.__all_counters)
+
+
+def merge_stats(*stats_dicts):
+    """
+    Sums statistics dictionaries returned by :meth:`MapperStats.snapshot`.
+    """
+    merged = {}
+
+    for stats in stats_dicts:
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                merged[key] = merge_stats(merged.get(key, {}), value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+
+    return merged
@@ -0,0 +1,225 @@
+from collections import namedtuple
+from itertools import izip
+from operator import attrgetter, itemgetter
+
+from mapperpy.exceptions import TrustedInputException
+
+MAX_CACHED_ATTR_MAPPINGS = 256
+
+# Description of mapping of a single attribute. nested_mappers are (source type, nested OneWayMapper) pairs - instead of
+# mapper there is ConfigurationException if nested mapper for the type can't be chosen unambiguously.
+AttributeDescription = namedtuple(
+    "AttributeDescription", ["attr_name_from", "attr_name_to", "target_type", "converter", "nested_mappers"])
+
+# Description of mapping of source objects with known attributes, see OneWayMapper.describe_mapping().
+MappingDescription = namedtuple(
+    "MappingDescription", ["target_class", "attributes", "initializers", "nested_mappers", "fail_on_get_attr"])
+
+
+class DictRenamePlan(object):
+    """
+    Mapping of a dict into a dict precompiled into key rename tables. Values are passed through
+    *convert_value(attr_name_from, attr_name_to, value)* only for keys which may need conversion.
+    """
+
+    def __init__(self, target_keys, implicit_renames, explicit_renames, converted, initializers, convert_value,
+                 get_missing_value):
+        """
+        :param target_keys: keys which can be mapped implicitly (attributes of the target prototype)
+        :param implicit_renames: (from, to) pairs mapped only if present in the source
+        :param explicit_renames: (from, to) pairs which have to be present in the source
+        :param converted: (from, to, required) triples which need value conversion
+        :param initializers: (attr_name, init_func) pairs
+        :param convert_value: function applying conversion to attribute value
+        :param get_missing_value: function called with (source, attr_name_from) for missing explicitly mapped keys
+        """
+        self.__target_keys = frozenset(target_keys)
+        self.__implicit_renames = tuple(implicit_renames)
+        self.__explicit_renames = tuple(explicit_renames)
+        self.__converted = tuple(converted)
+        self.__initializers = tuple(initializers)
+        self.__convert_value = convert_value
+        self.__get_missing_value = get_missing_value
+        # implicit renames always keep the key name so without other entries mapping is a (filtered) copy
+        self.__identity = not (self.__explicit_renames or self.__converted or self.__initializers)
+
+    @property
+    def is_identity(self):
+        return self.__identity
+
+    def map(self, source):
+        if self.__identity and source.viewkeys() <= self.__target_keys:
+            return dict(source)
+
+        result = {attr_to: source[attr_from] for attr_from, attr_to in self.__implicit_renames if attr_from in source}
+
+        if self.__explicit_renames:
+            self.__apply_explicit_renames(source, result)
+
+        if self.__converted:
+            self.__apply_conversions(source, result)
+
+        for attr_name, init_func in self.__initializers:
+            result[attr_name] = init_func(source)
+
+        return result
+
+    def __apply_explicit_renames(self, source, result):
+        for attr_from, attr_to in self.__explicit_renames:
+            result[attr_to] = source[attr_from] if attr_from in source else self.__get_missing_value(source, attr_from)
+
+    def __apply_conversions(self, source, result):
+        for attr_from, attr_to, required in self.__converted:
+            if attr_from in source:
+                result[attr_to] = self.__convert_value(attr_from, attr_to, source[attr_from])
+            elif required:
+                result[attr_to] = self.__convert_value(
+                    attr_from, attr_to, self.__get_missing_value(source, attr_from))
+
+
+class ProjectionPlan(object):
+    """
+    Mapping restricted to requested target attributes (fields). (attr_name_from, attr_name_to) pairs resolved for
+    source class / dict shape are filtered once and cached.
+    """
+
+    def __init__(self, fields, initializers):
+        self.fields = frozenset(fields)
+        self.initializers = tuple((attr_name, init_func) for attr_name, init_func in initializers
+                                  if attr_name in self.fields)
+        self.__attr_mappings = {}
+
+    def filter_attr_mapping(self, attr_mapping):
+        cached = self.__attr_mappings.get(id(attr_mapping))
+
+        # identity check - id of garbage collected mapping can be reused
+        if cached is None or cached[0] is not attr_mapping:
+            if len(self.__attr_mappings) >= MAX_CACHED_ATTR_MAPPINGS:
+                self.__attr_mappings.clear()
+            cached = self.__attr_mappings[id(attr_mapping)] = (
+                attr_mapping, tuple((attr_name_from, attr_name_to) for attr_name_from, attr_name_to in attr_mapping
+                                    if attr_name_to in self.fields))
+
+        return cached[1]
+
+
+class TrustedPlan(object):
+    """
+    Mapping of trusted source objects of a single class (e.g. dicts) which are assumed to have all mapped attributes,
+    with stable types. First *sample_size* objects are checked - missing attributes and changed value types are
+    reported with :class:`mapperpy.exceptions.TrustedInputException`. Following objects are mapped without per
+    attribute guards: all values are read at once and only those which need conversion are passed through
+    *convert_value(attr_name_from, attr_name_to, value)*. Dicts have to have the same keys as the first one, otherwise
+    values of additional keys would be silently skipped.
+    """
+
+    def __init__(self, mapper_name, attr_mapping, from_dict, initializers, convert_value, needs_conversion,
+                 sample_size=1):
+        """
+        :param mapper_name: name of the mapper reported in errors
+        :param attr_mapping: (attr_name_from, attr_name_to) pairs
+        :param from_dict: if set, source objects are dicts
+        :param initializers: (attr_name, init_func) pairs
+        :param convert_value: function applying conversion to attribute value
+        :param needs_conversion: function called with (attr_name_from, attr_name_to, source type) for values of the
+            first object - attributes for which it returns False are copied without conversion
+        :param sample_size: number of objects checked before mapping without guards
+        """
+        self.__mapper_name = mapper_name
+        self.__from_dict = from_dict
+        self.__attr_names_from = tuple(attr_name_from for attr_name_from, _ in attr_mapping)
+        self.__attr_names_to = tuple(attr_name_to for _, attr_name_to in attr_mapping)
+        self.__initializers = tuple(initializers)
+        self.__convert_value = convert_value
+        self.__needs_conversion = needs_conversion
+        self.__checks_left = max(sample_size, 1)
+        # (index, type) of attributes copied without conversion and (index, from, to) of converted ones, both set
+        # by the first check
+        self.__copied_types = None
+        self.__converted = ()
+        # keys of the first dict, set by the first check
+        self.__keys = None
+        self.__get_values = self.__values_getter(self.__attr_names_from, from_dict)
+
+    def map(self, source):
+        if self.__checks_left:
+            self.__check(source)
+
+        try:
+            values = self.__get_values(source)
+        except (KeyError, AttributeError) as er:
+            self.__check_values(source)
+            raise er
+
+        if self.__from_dict and source.viewkeys() != self.__keys:
+            self.__check_keys(source)
+
+        result = dict(izip(self.__attr_names_to, values))
+
+        for idx, attr_name_from, attr_name_to in self.__converted:
+            result[attr_name_to] = self.__convert_value(attr_name_from, attr_name_to, values[idx])
+
+        for attr_name, init_func in self.__initializers:
+            result[attr_name] = init_func(source)
+
+        return result
+
+    def __check(self, source):
+        values = self.__check_values(source)
+
+        if self.__copied_types is None:
+            self.__classify(values)
+            self.__keys = frozenset(source) if self.__from_dict else None
+        else:
+            for idx, expected_type in self.__copied_types:
+                if values[idx] is not None and type(values[idx]) is not expected_type:
+                    raise TrustedInputException(
+                        self.__mapper_name, self.__attr_names_from[idx], "expected value of type {}, got {}".format(
+                            expected_type.__name__, type(values[idx]).__name__))
+
+        self.__checks_left -= 1
+
+    def __check_values(self, source):
+        values = []
+
+        for attr_name in self.__attr_names_from:
+            try:
+                values.append(source[attr_name] if self.__from_dict else getattr(source, attr_name))
+            except (KeyError, AttributeError):
+                raise TrustedInputException(self.__mapper_name, attr_name, "attribute is missing")
+
+        return values
+
+    def __check_keys(self, source):
+        missing_keys = self.__keys.difference(source)
+        if missing_keys:
+            raise TrustedInputException(self.__mapper_name, min(missing_keys), "attribute is missing")
+
+        raise TrustedInputException(self.__mapper_name, min(self.__keys.symmetric_difference(source)),
+                                    "attribute is not present in the first object")
+
+    def __classify(self, values):
+        copied_types = []
+        converted = []
+
+        for idx, (attr_name_from, attr_name_to, value) in enumerate(
+                izip(self.__attr_names_from, self.__attr_names_to, values)):
+            # type of None value is unknown, such attribute is always converted
+            if value is None or self.__needs_conversion(attr_name_from, attr_name_to, type(value)):
+                converted.append((idx, attr_name_from, attr_name_to))
+            else:
+                copied_types.append((idx, type(value)))
+
+        self.__copied_types = tuple(copied_types)
+        self.__converted = tuple(converted)
+
+    @staticmethod
+    def __values_getter(attr_names, from_dict):
+        if not attr_names:
+            return lambda source: ()
+
+        getter = itemgetter(*attr_names) if from_dict else attrgetter(*attr_names)
+        if len(attr_names) == 1:
+            return lambda source: (getter(source),)
+
+        return getter
@@ -1,5 +1,13 @@
+from itertools import groupby
+
 from enum import Enum
 from mapperpy.one_way_mapper import OneWayMapper
+from mapperpy.mapper_stats import merge_stats
+from mapperpy.error_collector import MappingError
+from mapperpy.batch_functions import iter_chunks, DEFAULT_CHUNK_SIZE
+from mapperpy.string_table import DEFAULT_MAX_SIZE
+from mapperpy.records import SLOTS
+from mapperpy.record_batch import RecordBatch
 
 __author__ = 'lgrech'
 
@@ -20,6 +28,11 @@ class ObjectMapper(object):
         """
         self.__from_left_mapper = from_left_mapper
         self.__from_right_mapper = from_right_mapper
+        self.__declare_source_classes()
+        # (left -> right, right -> left) attribute names, see __get_name_index()
+        self.__name_index = None
+        # configuration versions of one way mappers the name index was built for
+        self.__name_index_versions = None
 
     @classmethod
     def from_class(cls, left_class, right_class):
@@ -39,26 +52,81 @@ class ObjectMapper(object):
             OneWayMapper.for_target_prototype(left_proto_obj.__dict__),
             OneWayMapper.for_target_prototype(left_proto_obj))
 
-    def map(self, obj):
-        if isinstance(obj, self.__from_right_mapper.target_class):
-            return self.__from_left_mapper.map(obj)
-        elif isinstance(obj, self.__from_left_mapper.target_class):
-            return self.__from_right_mapper.map(obj)
+    @classmethod
+    def for_record(cls, left_proto_obj, name=None, kind=SLOTS):
+        """
+        Like :meth:`for_dict` but "right" side is generated compact record class instead of dict.
+        """
+        return ObjectMapper(
+            OneWayMapper.for_target_prototype(left_proto_obj.__dict__).as_record_type(
+                name or "{}Record".format(left_proto_obj.__class__.__name__), kind),
+            OneWayMapper.for_target_prototype(left_proto_obj))
 
-        raise ValueError("This mapper does not support {} class".format(obj.__class__.__name__))
+    def map(self, obj, fields=None):
+        """
+        :param fields: if set, only these attributes of the opposite class are mapped (see :meth:`OneWayMapper.map`)
+        """
+        return self.__get_target_mapper(obj).map(obj, fields)
+
+    def map_attributes(self, obj, fields=None):
+        """
+        Returns dict of mapped attributes of the opposite class without creating its instance.
+        """
+        return self.__get_target_mapper(obj).map_attributes(obj, fields)
+
+    def map_many(self, objs, as_batch=False, errors=None, chunk_size=DEFAULT_CHUNK_SIZE, fields=None):
+        """
+        Lazily maps objects from given iterable, direction is determined for each object separately.
+
+        :param as_batch: if set, all objects are mapped at once into columnar :class:`RecordBatch` - all of them have
+            to be of the same class then
+        :param errors: :class:`mapperpy.ErrorCollector` - if set, objects which can't be mapped are skipped and reported
+            into it instead of raising exception
+        :param chunk_size: number of objects passed at once to batch initializers and converters
+        :param fields: if set, only these attributes of the opposite class are mapped (see :meth:`OneWayMapper.map`)
+        """
+        if as_batch:
+            objs = list(objs)
+            if not objs:
+                return RecordBatch(self.__from_left_mapper.target_class)
+            if any(obj.__class__ is not objs[0].__class__ for obj in objs):
+                raise ValueError("All objects mapped into record batch have to be of the same class")
+            return self.__get_target_mapper(objs[0]).map_many(
+                objs, as_batch=True, errors=errors, chunk_size=chunk_size, fields=fields)
+
+        if errors is not None:
+            return self.__map_many_collecting(objs, errors, fields)
+
+        if fields is not None or \
+                self.__from_left_mapper.uses_batch_functions or self.__from_right_mapper.uses_batch_functions:
+            return self.__map_many_chunked(objs, chunk_size, fields)
+
+        return (self.map(obj) for obj in objs)
+
+    def map_from_columns(self, columns, mapping_direction):
+        """
+        Lazily maps columnar data (see :meth:`OneWayMapper.map_from_columns`) in given direction.
+
+        :type mapping_direction: MappingDirection
+        """
+        if mapping_direction == MappingDirection.left_to_right:
+            return self.__from_left_mapper.map_from_columns(columns)
+        elif mapping_direction == MappingDirection.right_to_left:
+            return self.__from_right_mapper.map_from_columns(columns)
+
+        raise ValueError("Unknown mapping direction: {}".format(mapping_direction))
 
     def map_attr_name(self, attr_name):
         """
         :type attr_name: basestring
         :rtype: basestring
         """
-        mapped_name = self.__get_mapped_name(self.__from_left_mapper, attr_name)
-        if mapped_name and self.__get_mapped_name(self.__from_right_mapper, mapped_name) == attr_name:
-            return mapped_name
+        left_to_right, right_to_left = self.__get_name_index()
 
-        mapped_name = self.__get_mapped_name(self.__from_right_mapper, attr_name)
-        if mapped_name and self.__get_mapped_name(self.__from_left_mapper, mapped_name) == attr_name:
-            return mapped_name
+        if attr_name in left_to_right:
+            return left_to_right[attr_name]
+        elif attr_name in right_to_left:
+            return right_to_left[attr_name]
 
         raise ValueError("Can't find mapping for attribute name: {}".format(attr_name))
 
@@ -75,22 +143,61 @@ class ObjectMapper(object):
                 or mapping_direction is None and target_class is None:
             raise ValueError("Either mapping direction or target class has to be set (not both)")
 
+        left_to_right, right_to_left = self.__get_name_index()
+
         if mapping_direction and mapping_direction == MappingDirection.left_to_right \
                 or target_class and target_class == self.__from_left_mapper.target_class:
-            mapped_name = self.__get_mapped_name(self.__from_left_mapper, attr_name)
-            if mapped_name and self.__get_mapped_name(self.__from_right_mapper, mapped_name) == attr_name:
+            if attr_name in left_to_right:
                 return self.__from_left_mapper.map_attr_value(attr_name, attr_value)
 
         elif mapping_direction and mapping_direction == MappingDirection.right_to_left \
                 or target_class and target_class == self.__from_right_mapper.target_class:
-            mapped_name = self.__get_mapped_name(self.__from_right_mapper, attr_name)
-            if mapped_name and self.__get_mapped_name(self.__from_left_mapper, mapped_name) == attr_name:
+            if attr_name in right_to_left:
                 return self.__from_right_mapper.map_attr_value(attr_name, attr_value)
 
         raise ValueError(
             "Can't find mapping for attribute name: {}, direction: {}, target class: {}".format(
                 attr_name, mapping_direction, target_class.__name__ if target_class else None))
 
+    def translate(self, attr_values, mapping_direction, map_values=True):
+        """
+        Maps names (and values) of all attributes in given dict at once, e.g. to turn API filter into storage query.
+        All unknown attribute names are reported together.
+
+        :type attr_values: dict
+        :type mapping_direction: MappingDirection
+        :param map_values: if not set, values are passed unchanged
+        :rtype: dict
+        """
+        attr_name_index, one_way_mapper = self.__get_direction_name_index(mapping_direction)
+
+        unknown_names = [attr_name for attr_name in attr_values if attr_name not in attr_name_index]
+        if unknown_names:
+            raise ValueError("Can't find mapping for attribute names: {}, direction: {}".format(
+                ", ".join(sorted(unknown_names)), mapping_direction))
+
+        if not map_values:
+            return {attr_name_index[attr_name]: attr_value for attr_name, attr_value in attr_values.items()}
+
+        return {attr_name_index[attr_name]: one_way_mapper.map_attr_value(
+            attr_name, attr_value, attr_name_index[attr_name]) for attr_name, attr_value in attr_values.items()}
+
+    def translate_names(self, attr_names, mapping_direction):
+        """
+        Maps sequence of attribute names (e.g. sort specification) at once, unknown names are reported together.
+
+        :type mapping_direction: MappingDirection
+        :rtype: list
+        """
+        attr_name_index, _ = self.__get_direction_name_index(mapping_direction)
+
+        unknown_names = [attr_name for attr_name in attr_names if attr_name not in attr_name_index]
+        if unknown_names:
+            raise ValueError("Can't find mapping for attribute names: {}, direction: {}".format(
+                ", ".join(unknown_names), mapping_direction))
+
+        return [attr_name_index[attr_name] for attr_name in attr_names]
+
     def custom_mappings(self, mapping_dict):
 
         mapping, rev_mapping = self.__get_explicit_mapping(mapping_dict)
@@ -121,12 +228,36 @@ class ObjectMapper(object):
         self.__from_left_mapper.target_initializers(initializers_dict)
         return self
 
-    def value_converters(self, converters_dict):
+    def left_as_record_type(self, name=None, kind=SLOTS):
+        self.__from_right_mapper.as_record_type(name, kind)
+        self.__declare_source_classes()
+        return self
+
+    def right_as_record_type(self, name=None, kind=SLOTS):
+        self.__from_left_mapper.as_record_type(name, kind)
+        self.__declare_source_classes()
+        return self
+
+    def value_converters(self, converters_dict, cache=None):
+        """
+        :param cache: cache policy (e.g. :class:`mapperpy.LRU`) - if set, results of given converters (in both
+            directions) are memoized
+        """
         to_right_converters, to_left_converters = self.__split_converters(converters_dict)
 
-        self.__from_left_mapper.target_value_converters(to_right_converters)
-        self.__from_right_mapper.target_value_converters(to_left_converters)
+        self.__from_left_mapper.target_value_converters(to_right_converters, cache)
+        self.__from_right_mapper.target_value_converters(to_left_converters, cache)
+
+        return self
 
+    def intern_strings(self, attr_names, max_size=DEFAULT_MAX_SIZE):
+        """
+        Deduplicates string values of given ("left") attributes in both directions (see
+        :meth:`OneWayMapper.intern_strings`).
+        """
+        self.__from_right_mapper.intern_strings(attr_names, max_size)
+        self.__from_left_mapper.intern_strings(
+            [self.__from_left_mapper.map_attr_name(attr_name) for attr_name in attr_names], max_size)
         return self
 
     def options(self, option):
@@ -134,15 +265,106 @@ class ObjectMapper(object):
         self.__from_right_mapper.options(option)
         return self
 
+    def tracing_hook(self, hook, sample_rate=1, nested_spans=False):
+        self.__from_left_mapper.tracing_hook(hook, sample_rate, nested_spans)
+        self.__from_right_mapper.tracing_hook(hook, sample_rate, nested_spans)
+        return self
+
+    def stats(self):
+        """
+        Returns statistics collected for both mapping directions (see :func:`mapperpy.enable_stats`).
+        """
+        return merge_stats(self.__from_left_mapper.stats(), self.__from_right_mapper.stats())
+
+    @property
+    def from_left_mapper(self):
+        """
+        :rtype: OneWayMapper
+        """
+        return self.__from_left_mapper
+
+    @property
+    def from_right_mapper(self):
+        """
+        :rtype: OneWayMapper
+        """
+        return self.__from_right_mapper
+
+    def converter_cache_info(self, mapping_direction):
+        """
+        Returns info about converters' caches (see :meth:`OneWayMapper.converter_cache_info`) for given direction.
+
+        :type mapping_direction: MappingDirection
+        """
+        if mapping_direction == MappingDirection.left_to_right:
+            return self.__from_left_mapper.converter_cache_info()
+        return self.__from_right_mapper.converter_cache_info()
+
     def __repr__(self):
         return "{}->{}".format(self.__from_right_mapper.target_class, self.__from_left_mapper.target_class)
 
-    @classmethod
-    def __get_mapped_name(cls, one_way_mapper, attr_name):
-        try:
-            return one_way_mapper.map_attr_name(attr_name)
-        except ValueError:
-            return None
+    def __get_target_mapper(self, obj):
+        if isinstance(obj, self.__from_right_mapper.target_class):
+            return self.__from_left_mapper
+        elif isinstance(obj, self.__from_left_mapper.target_class):
+            return self.__from_right_mapper
+
+        raise ValueError("This mapper does not support {} class".format(obj.__class__.__name__))
+
+    def __map_many_chunked(self, objs, chunk_size, fields):
+        for chunk in iter_chunks(objs, chunk_size):
+            # consecutive objects mapped in the same direction are passed to the one way mapper together
+            for target_mapper, objs_group in groupby(chunk, self.__get_target_mapper):
+                for mapped_obj in target_mapper.map_many(objs_group, chunk_size=chunk_size, fields=fields):
+                    yield mapped_obj
+
+    def __map_many_collecting(self, objs, errors, fields):
+        for idx, obj in enumerate(objs):
+            try:
+                target_mapper = self.__get_target_mapper(obj)
+            except ValueError as er:
+                errors.add(MappingError(idx, None, er))
+                continue
+
+            mapped_obj = target_mapper.map_or_report(obj, errors, idx, fields)
+            if mapped_obj is not None:
+                yield mapped_obj
+
+    def __declare_source_classes(self):
+        # objects mapped by one of one way mappers are instances of target class of the other one
+        self.__from_left_mapper.source_class(self.__from_right_mapper.target_class)
+        self.__from_right_mapper.source_class(self.__from_left_mapper.target_class)
+
+    def __get_name_index(self):
+        """
+        Returns (left -> right, right -> left) dicts of attribute names which are mapped consistently in both
+        directions. Index is built once and rebuilt after configuration of any of one way mappers changes (also when
+        they are configured directly).
+        """
+        versions = (self.__from_left_mapper.config_version, self.__from_right_mapper.config_version)
+
+        if self.__name_index is None or self.__name_index_versions != versions:
+            from_left = self.__from_left_mapper.attr_name_mapping()
+            from_right = self.__from_right_mapper.attr_name_mapping()
+
+            self.__name_index = (
+                {attr_name: mapped_name for attr_name, mapped_name in from_left.items()
+                 if from_right.get(mapped_name) == attr_name},
+                {attr_name: mapped_name for attr_name, mapped_name in from_right.items()
+                 if from_left.get(mapped_name) == attr_name})
+            self.__name_index_versions = versions
+
+        return self.__name_index
+
+    def __get_direction_name_index(self, mapping_direction):
+        left_to_right, right_to_left = self.__get_name_index()
+
+        if mapping_direction == MappingDirection.left_to_right:
+            return left_to_right, self.__from_left_mapper
+        elif mapping_direction == MappingDirection.right_to_left:
+            return right_to_left, self.__from_right_mapper
+
+        raise ValueError("Unknown mapping direction: {}".format(mapping_direction))
 
     @classmethod
     def __get_explicit_mapping(cls, input_mapping):
@@ -1,28 +1,80 @@
 from datetime import datetime
+from itertools import chain, izip
+from timeit import default_timer
 from enum import Enum
 
+from mapperpy import mapper_stats, startup
 from mapperpy.attributes_util import AttributesCache, get_attributes
+from mapperpy.attribute_paths import AttributePath, NestedTargetPlan, is_attribute_path
+from mapperpy.batch_functions import BatchFunction, iter_chunks, DEFAULT_CHUNK_SIZE
+from mapperpy.conversions import parse_datetime, format_datetime
+from mapperpy.converter_cache import CachedConverter
+from mapperpy.string_table import StringTable, DEFAULT_MAX_SIZE
+from mapperpy.error_collector import MappingError
+from mapperpy.mapper_stats import MapperStats
+from mapperpy.mapping_plan import DictRenamePlan, ProjectionPlan, TrustedPlan, AttributeDescription, \
+    MappingDescription
+from mapperpy.records import record_type, SLOTS
+from mapperpy.record_batch import RecordBatch
+from mapperpy.tracing import Tracer
+from mapperpy.type_hints import get_attribute_types
 from mapperpy.mapper_options import MapperOptions
 from mapperpy.exceptions import ConfigurationException
 
 __author__ = 'lgrech'
 
+MAX_CACHED_DICT_SHAPES = 256
+MAX_CACHED_PROJECTIONS = 256
+
+_UNKNOWN_TYPE = object()
+# target prototype of lazily constructed mapper (see mapperpy.startup.enable_lazy_construction) which isn't created yet
+_DEFERRED_PROTOTYPE = object()
+
 
 class OneWayMapper(object):
 
     def __init__(self, target_class, target_prototype_obj=None, attributes_cache_provider=AttributesCache):
+        lazy, report = startup.get_construction_settings()
+        start_time = default_timer() if report else None
+
         self.__target_class = target_class
-        self.__target_prototype_obj = \
-            target_prototype_obj if target_prototype_obj is not None else self.__try_create_prototype(target_class)
+        # class of mapped objects if it's known, used only to describe the mapper
+        self.__source_class = None
+        if target_prototype_obj is not None:
+            self.__target_prototype_obj = target_prototype_obj
+        else:
+            self.__target_prototype_obj = _DEFERRED_PROTOTYPE if lazy else self.__try_create_prototype(target_class)
         self.__discovered_target_class_attrs = None
 
         self.__source_attributes_cache = attributes_cache_provider()
 
         self.__explicit_mapping = {}
+        # accessors of dotted source attribute paths used in explicit mapping
+        self.__source_paths = {}
+        self.__nested_target_paths = ()
         self.__nested_mappers = {}
         self.__target_initializers = {}
         self.__target_value_converters = {}
         self.__general_settings = {}
+        self.__string_tables = {}
+
+        self.__stats = MapperStats()
+        # incremented whenever configuration changes, see config_version
+        self.__config_version = 0
+        self.__tracer = None
+        self.__dict_rename_plan = None
+        self.__dict_shape_attr_mappings = {}
+        self.__object_attr_mapping = (None, None)
+        self.__projections = {}
+        self.__nested_target_plan = None
+        # target attribute name -> type used for conversions, see __get_target_type()
+        self.__target_types = {}
+        self.__hinted_target_types = None
+        # source class -> TrustedPlan, None unless MapperOptions.trusted_input is set
+        self.__trusted_plans = None
+
+        self.__startup_record = startup.register(
+            self, default_timer() - start_time, self.__target_prototype_obj is _DEFERRED_PROTOTYPE) if report else None
 
     @classmethod
     def for_target_class(cls, target_class):
@@ -38,9 +90,143 @@ class OneWayMapper(object):
 
         return OneWayMapper(proto_obj.__class__, proto_obj)
 
-    def map(self, obj):
-        param_dict = self.__get_mapped_params_dict(obj)
-        return self.__try_create_target_object(param_dict)
+    @classmethod
+    def for_record_type(cls, name, fields, kind=SLOTS):
+        """
+        Creates mapper to a generated compact record class (see :func:`mapperpy.records.record_type`).
+        """
+        return OneWayMapper.for_target_class(record_type(name, fields, kind))
+
+    def as_record_type(self, name=None, kind=SLOTS):
+        """
+        Replaces target class (e.g. dict) with generated compact record class having the same attributes: attributes
+        of target prototype, explicitly mapped and initialized ones. Values of target prototype are kept, so type
+        conversions still apply. Should be called when mapper is fully configured.
+        """
+        fields = sorted(self.__get_target_attributes())
+        proto_values = {attr_name: self.__get_target_proto_attribute_value(attr_name)
+                        for attr_name in self.__get_discovered_target_class_attributes()}
+
+        self.__target_class = record_type(name or "{}Record".format(self.__target_class.__name__.capitalize()),
+                                          fields, kind)
+        self.__target_prototype_obj = self.__target_class(**proto_values)
+        self.__discovered_target_class_attrs = None
+        self.__invalidate_plans()
+
+        return self
+
+    def map(self, obj, fields=None):
+        """
+        :param fields: if set, only these target attributes are mapped (attributes which are not requested are skipped
+            with their converters, initializers and nested mappers) and target object is created only with them
+        """
+        if fields is None:
+            return self.__call_counted(self.__do_map, obj)
+
+        return self.__call_counted(self.__do_map_projection, obj, self.__get_projection(fields))
+
+    def map_attributes(self, obj, fields=None):
+        """
+        Returns dict of mapped target attributes (the same values which are passed to target class constructor by
+        :meth:`map`) without creating target object. Nested target attributes (see :meth:`custom_mappings`) are
+        returned flat, under their dotted paths.
+        """
+        if fields is None:
+            return self.__call_counted(self.__get_mapped_attributes, obj)
+
+        return self.__call_counted(self.__get_projected_params_dict, obj, self.__get_projection(fields))
+
+    def map_many(self, objs, as_batch=False, errors=None, chunk_size=DEFAULT_CHUNK_SIZE, fields=None):
+        """
+        Lazily maps objects from given iterable. Attribute mapping is resolved once per dict key shape / source class.
+        If batch initializers or converters (see :func:`mapperpy.batched`) are set, objects are mapped in chunks and
+        those are called once per chunk.
+
+        :param as_batch: if set, all objects are mapped at once into columnar :class:`RecordBatch`
+        :param errors: :class:`mapperpy.ErrorCollector` - if set, objects which can't be mapped are skipped and reported
+            into it instead of raising exception (batch functions are then called for every object separately)
+        :param chunk_size: number of objects passed at once to batch initializers and converters
+        :param fields: if set, only these target attributes are mapped (see :meth:`map`)
+        """
+        projection = self.__get_projection(fields) if fields is not None else None
+
+        if as_batch:
+            batch = RecordBatch(self.__target_class)
+            if errors is not None:
+                mapped_attributes = self.__map_many_collecting(objs, errors, False, projection)
+            elif self.uses_batch_functions:
+                mapped_attributes = self.__map_many_chunked(objs, chunk_size, False, projection)
+            elif projection is not None:
+                mapped_attributes = (self.__call_counted(self.__get_projected_params_dict, obj, projection)
+                                     for obj in objs)
+            else:
+                mapped_attributes = (self.map_attributes(obj) for obj in objs)
+
+            for attributes in mapped_attributes:
+                batch.append(attributes)
+            return batch
+
+        if errors is not None:
+            return self.__map_many_collecting(objs, errors, True, projection)
+
+        if self.uses_batch_functions:
+            return self.__map_many_chunked(objs, chunk_size, True, projection)
+
+        if projection is not None:
+            return (self.__call_counted(self.__do_map_projection, obj, projection) for obj in objs)
+
+        map_func = self.map
+        return (map_func(obj) for obj in objs)
+
+    def map_or_report(self, obj, errors, index=None, fields=None):
+        """
+        Maps object like :meth:`map` but if it can't be mapped, the failure is reported into *errors*
+        (:class:`mapperpy.ErrorCollector`) and None is returned.
+        """
+        projection = self.__get_projection(fields) if fields is not None else None
+        return self.__call_counted(self.__map_collecting, obj, errors, index, True, projection)
+
+    def map_rows(self, rows, column_names, create_object=True):
+        """
+        Lazily maps sequences of values (e.g. rows returned by csv.reader) ordered as *column_names*. Column names are
+        resolved against attribute mapping once, then values are taken from rows by position.
+
+        :param create_object: if not set, dicts of mapped target attributes are returned instead of target objects
+            (like :meth:`map_attributes`)
+        """
+        return self.__map_rows(rows, tuple(column_names), create_object)
+
+    def map_from_columns(self, columns):
+        """
+        Lazily maps columnar data - dict of equally long columns (lists, arrays) or NumPy structured array - row by
+        row. Columns are resolved against attribute mapping once. Type conversions which depend only on the value
+        (e.g. int codes to Enum) are applied to whole columns before rows are built, once per distinct value.
+        """
+        field_names = getattr(getattr(columns, "dtype", None), "names", None)
+        if field_names:
+            columns = {field_name: columns[field_name] for field_name in field_names}
+
+        column_names = tuple(columns)
+        # tolist() turns arrays (also NumPy ones) into lists of plain Python values at once
+        value_columns = [columns[column_name].tolist() if hasattr(columns[column_name], "tolist")
+                         else list(columns[column_name]) for column_name in column_names]
+
+        column_lengths = set(len(values) for values in value_columns)
+        if len(column_lengths) > 1:
+            raise ValueError("All columns have to be of the same length, got lengths: {}".format(
+                ", ".join("{}={}".format(column_name, len(values))
+                          for column_name, values in zip(column_names, value_columns))))
+
+        column_mapping = []
+        for column_idx, attr_name_from, attr_name_to, _ in self.__resolve_column_mapping(column_names):
+            converted = column_idx is not None and \
+                self.__is_value_conversion_column(attr_name_from, attr_name_to, value_columns[column_idx])
+            if converted:
+                value_columns[column_idx] = self.__convert_column(
+                    attr_name_from, attr_name_to, value_columns[column_idx])
+            column_mapping.append((column_idx, attr_name_from, attr_name_to, converted))
+
+        return self.__map_columns(value_columns, column_names, tuple(column_mapping))
 
     def map_attr_name(self, attr_name):
 
@@ -52,12 +238,49 @@ class OneWayMapper(object):
 
         raise ValueError("Can't find mapping for attribute name: {}".format(attr_name))
 
-    def map_attr_value(self, attr_name, attr_value):
-        mapped_attr_name = self.map_attr_name(attr_name)
+    def attr_name_mapping(self):
+        """
+        Returns dict of all attribute names which can be mapped by :meth:`map_attr_name` and their mapped names.
+        """
+        attr_name_mapping = {attr_name: attr_name for attr_name in self.__get_discovered_target_class_attributes()}
+        attr_name_mapping.update(self.__explicit_mapping)
+        return {attr_name: mapped_name for attr_name, mapped_name in attr_name_mapping.items() if mapped_name}
+
+    def map_attr_value(self, attr_name, attr_value, mapped_attr_name=None):
+        """
+        :param mapped_attr_name: mapped name of the attribute if it's already known (see :meth:`map_attr_name`)
+        """
+        if mapped_attr_name is None:
+            mapped_attr_name = self.map_attr_name(attr_name)
         return self.__do_apply_mapping(attr_name, mapped_attr_name, attr_value)
 
     def custom_mappings(self, mapping_dict):
+        """
+        Attribute names can be dotted paths (e.g. {"address.city": "city"}) - source value is then taken from nested
+        object (dict) and target value is set in nested object built from all mapped values with the same prefix.
+        """
         self.__explicit_mapping.update(mapping_dict)
+
+        self.__source_paths = {attr_name: AttributePath(attr_name)
+                               for attr_name in self.__explicit_mapping if is_attribute_path(attr_name)}
+        self.__nested_target_paths = tuple(
+            attr_name for attr_name in self.__explicit_mapping.values() if is_attribute_path(attr_name))
+
+        self.__invalidate_plans()
+        if self.__nested_target_paths and self.__target_prototype_obj is _DEFERRED_PROTOTYPE:
+            # conflicting paths are reported here, plan is compiled with the prototype on first use
+            NestedTargetPlan(self.__nested_target_paths, None)
+        elif self.__nested_target_paths:
+            # compiled right away so that conflicting paths are reported here
+            self.__nested_target_plan = NestedTargetPlan(self.__nested_target_paths, self.__target_prototype_obj)
+        return self
+
+    def source_class(self, source_class):
+        """
+        Declares class of objects mapped by this mapper. It's used only in mapper's description (e.g. in startup
+        report), mapping isn't restricted to it.
+        """
+        self.__source_class = source_class
         return self
 
     def nested_mapper(self, mapper, for_type):
@@ -74,29 +297,508 @@ class OneWayMapper(object):
                 for_type.__name__, mapper.target_class.__name__))
 
         self.__nested_mappers[for_type].add(mapper)
+        self.__invalidate_plans()
 
         return self
 
     def target_initializers(self, initializers_dict):
         self.__verify_if_callable(initializers_dict, "Initializer for {} is not callable")
         self.__target_initializers.update(initializers_dict)
+        self.__invalidate_plans()
         return self
 
-    def target_value_converters(self, converters_dict):
+    def target_value_converters(self, converters_dict, cache=None):
+        """
+        :param cache: cache policy (e.g. :class:`mapperpy.LRU`) - if set, results of given converters are memoized
+        """
         self.__verify_if_callable(converters_dict, "Converter for {} is not callable")
+        if cache is not None:
+            converters_dict = {attr_name: cache.wrap(converter) for attr_name, converter in converters_dict.items()}
         self.__target_value_converters.update(converters_dict)
+        self.__invalidate_plans()
+        return self
+
+    def intern_strings(self, attr_names, max_size=DEFAULT_MAX_SIZE):
+        """
+        Deduplicates string values mapped to given target attributes, so that equal values share one object. Every
+        attribute has its own table (see :class:`mapperpy.string_table.StringTable`) of at most *max_size* values.
+        """
+        for attr_name in attr_names:
+            self.__string_tables[attr_name] = StringTable(max_size)
+        self.__invalidate_plans()
         return self
 
     def options(self, (setting_name, setting_value)):
         self.__general_settings[setting_name] = setting_value
+        self.__invalidate_plans()
         return self
 
+    def tracing_hook(self, hook, sample_rate=1, nested_spans=False):
+        """
+        Registers hook (see :class:`mapperpy.tracing.MapHook`) called around every *sample_rate*-th map call and, if
+        *nested_spans* is set, around nested mappers applied within sampled calls.
+        """
+        if self.__tracer is None:
+            self.__tracer = Tracer(self.__target_class)
+            # traced functions are installed on the instance only, mappers without hooks don't pay for tracing
+            self.map = self.__tracer.wrap_map(self.map)
+
+        self.__tracer.add_hook(hook, sample_rate, nested_spans)
+
+        if nested_spans and "_OneWayMapper__try_apply_nested_mapper" not in self.__dict__:
+            self.__try_apply_nested_mapper = self.__tracer.wrap_nested(self.__try_apply_nested_mapper)
+
+        return self
+
+    def describe_mapping(self, source_attrs):
+        """
+        Returns :class:`mapperpy.mapping_plan.MappingDescription` of how source objects having given attributes are
+        mapped - which attributes, with which converters, nested mappers and target types (used by
+        :mod:`mapperpy.codegen`).
+        """
+        attributes = []
+        for attr_name_from, attr_name_to in sorted(self.__resolve_attr_name_mapping(frozenset(source_attrs))):
+            to_type = self.__get_target_type(attr_name_to)
+            attributes.append(AttributeDescription(
+                attr_name_from, attr_name_to, to_type, self.__target_value_converters.get(attr_name_from),
+                [(from_type, self.__try_select_nested_mapper(from_type, attr_name_from, to_type, attr_name_to))
+                 for from_type in self.__nested_mappers]))
+
+        return MappingDescription(
+            self.__target_class, attributes, sorted(self.__target_initializers.items()),
+            [(from_type, mapper) for from_type, mappers in self.__nested_mappers.items() for mapper in mappers],
+            self.__get_setting(MapperOptions.fail_on_get_attr, True))
+
+    def stats(self):
+        """
+        Returns statistics collected for this mapper (see :func:`mapperpy.enable_stats`).
+        """
+        cached_converters = self.__get_cached_converters()
+        stats = self.__stats.snapshot(
+            self.__source_attributes_cache.hits, self.__source_attributes_cache.misses,
+            sum(converter.hits for converter in cached_converters.values()),
+            sum(converter.misses for converter in cached_converters.values()))
+        stats["interning"] = {
+            "deduplicated": sum(table.deduplicated for table in self.__string_tables.values()),
+            "bytes_saved": sum(table.bytes_saved for table in self.__string_tables.values()),
+        }
+        return stats
+
+    def converter_cache_info(self):
+        """
+        Returns dict source attribute name -> :class:`mapperpy.converter_cache.CacheInfo` (hits, misses, hit rate etc.)
+        for converters with cache.
+        """
+        return {attr_name: converter.cache_info() for attr_name, converter in self.__get_cached_converters().items()}
+
     @property
     def target_class(self):
         return self.__target_class
 
+    @property
+    def config_version(self):
+        """
+        Number changed by every configuration change (e.g. custom mappings) - lets owners invalidate data derived
+        from mapper's configuration.
+        """
+        return self.__config_version
+
+    @property
+    def target_prototype(self):
+        return self.__get_target_prototype()
+
+    @property
+    def uses_batch_functions(self):
+        return any(isinstance(func, BatchFunction)
+                   for func in chain(self.__target_initializers.values(), self.__target_value_converters.values()))
+
+    def __get_target_prototype(self):
+        if self.__target_prototype_obj is _DEFERRED_PROTOTYPE:
+            self.__initialize()
+        return self.__target_prototype_obj
+
+    def __initialize(self):
+        start_time = default_timer()
+        self.__target_prototype_obj = self.__try_create_prototype(self.__target_class)
+
+        if self.__startup_record is not None:
+            self.__startup_record.initialization_seconds = default_timer() - start_time
+
+    def __call_counted(self, map_func, *args):
+        counters = self.__stats.get_counters()
+        if counters is None:
+            return map_func(*args)
+
+        start_time = default_timer()
+        try:
+            return map_func(*args)
+        finally:
+            counters[mapper_stats.MAPS] += 1
+            counters[mapper_stats.TIME_SPENT] += default_timer() - start_time
+
+    def __map_many_chunked(self, objs, chunk_size, create_object, projection):
+        for chunk in iter_chunks(objs, chunk_size):
+            for mapped_obj in self.__map_chunk(chunk, create_object, projection):
+                yield mapped_obj
+
+    def __map_chunk(self, chunk, create_object, projection):
+        counters = self.__stats.get_counters()
+        start_time = default_timer() if counters is not None else None
+
+        try:
+            mapped_params_dicts = self.__get_chunk_mapped_params_dicts(chunk, projection)
+        except AttributeError as er:
+            raise AttributeError("Unknown attribute: {}".format(er.message))
+
+        mapped_objects = [self.__try_create_target_object(mapped_params_dict)
+                          for mapped_params_dict in mapped_params_dicts] if create_object else mapped_params_dicts
+
+        if counters is not None:
+            counters[mapper_stats.MAPS] += len(chunk)
+            counters[mapper_stats.TIME_SPENT] += default_timer() - start_time
+
+        return mapped_objects
+
+    def __get_chunk_mapped_params_dicts(self, chunk, projection):
+        attr_mappings = [self.__get_planned_attr_name_mapping(obj, projection) for obj in chunk]
+        initializers = self.__get_planned_initializers(projection)
+
+        converted_values = self.__apply_batch_converters(chunk, attr_mappings)
+        initialized_values = {attr_name: init_func.call_batch(chunk)
+                              for attr_name, init_func in initializers if isinstance(init_func, BatchFunction)}
+
+        mapped_params_dicts = []
+        for idx, obj in enumerate(chunk):
+            mapped_params_dict = {}
+
+            for attr_name_from, attr_name_to in attr_mappings[idx]:
+                if attr_name_from in converted_values:
+                    converted_value = converted_values[attr_name_from][idx]
+                    # interned the same way as values converted by __do_apply_mapping
+                    mapped_params_dict[attr_name_to] = self.__string_tables[attr_name_to].intern(converted_value) \
+                        if attr_name_to in self.__string_tables else converted_value
+                else:
+                    source_attr_value = self.__get_attribute_value(obj, attr_name_from)
+                    mapped_params_dict[attr_name_to] = \
+                        self.__do_apply_mapping(attr_name_from, attr_name_to, source_attr_value)
+
+            for attr_name, init_func in initializers:
+                mapped_params_dict[attr_name] = \
+                    initialized_values[attr_name][idx] if attr_name in initialized_values else init_func(obj)
+
+            mapped_params_dicts.append(mapped_params_dict)
+
+        return mapped_params_dicts
+
+    def __apply_batch_converters(self, chunk, attr_mappings):
+        """
+        Returns dict attr_name_from -> {index in chunk: converted value} for attributes with batch converters.
+        """
+        batch_converters = [(attr_name_from, converter)
+                            for attr_name_from, converter in self.__target_value_converters.items()
+                            if isinstance(converter, BatchFunction)]
+        if not batch_converters:
+            return {}
+
+        # attribute mappings are shared by objects of the same class (dict shape)
+        mapped_attr_names = {}
+        for attr_mapping in attr_mappings:
+            if id(attr_mapping) not in mapped_attr_names:
+                mapped_attr_names[id(attr_mapping)] = frozenset(attr_name_from for attr_name_from, _ in attr_mapping)
+
+        converted_values = {}
+        for attr_name_from, converter in batch_converters:
+            indexes = [idx for idx, attr_mapping in enumerate(attr_mappings)
+                       if attr_name_from in mapped_attr_names[id(attr_mapping)]]
+            if not indexes:
+                continue
+
+            source_attr_values = [self.__get_attribute_value(chunk[idx], attr_name_from) for idx in indexes]
+            converted_values[attr_name_from] = dict(zip(indexes, converter.call_batch(source_attr_values)))
+
+            counters = self.__stats.get_counters()
+            if counters is not None:
+                counters[mapper_stats.CUSTOM_CONVERSIONS] += len(indexes)
+
+        return converted_values
+
+    def __map_many_collecting(self, objs, errors, create_object, projection):
+        for idx, obj in enumerate(objs):
+            mapped_obj = self.__call_counted(self.__map_collecting, obj, errors, idx, create_object, projection)
+            if mapped_obj is not None:
+                yield mapped_obj
+
+    def __map_collecting(self, obj, errors, index, create_object, projection):
+        mapped_params_dict = {}
+        attr_name = None
+
+        try:
+            for attr_name, attr_name_to in self.__get_planned_attr_name_mapping(obj, projection):
+                source_attr_value = self.__get_attribute_value(obj, attr_name)
+                mapped_params_dict[attr_name_to] = self.__do_apply_mapping(attr_name, attr_name_to, source_attr_value)
+
+            for attr_name, init_func in self.__get_planned_initializers(projection):
+                mapped_params_dict[attr_name] = init_func(obj)
+        except Exception as er:
+            errors.add(MappingError(index, attr_name, er))
+            return None
+
+        if not create_object:
+            return mapped_params_dict
+
+        try:
+            if self.__nested_target_paths:
+                self.__build_nested_targets(mapped_params_dict)
+            return self.__target_class(**mapped_params_dict)
+        except Exception as er:
+            # params are kept in the error, message with them is formatted only when needed
+            errors.add(MappingError(index, None, er, self.__target_class, mapped_params_dict))
+            return None
+
+    def __map_rows(self, rows, column_names, create_object):
+        column_mapping = self.__resolve_column_mapping(column_names)
+        row_length = len(column_names)
+        map_row = self.__map_row if create_object else self.__get_row_params_dict
+
+        for row in rows:
+            if len(row) < row_length:
+                # missing trailing values are treated as None (like csv.DictReader does)
+                row = list(row) + [None] * (row_length - len(row))
+            yield self.__call_counted(map_row, row, column_names, column_mapping)
+
+    def __resolve_column_mapping(self, column_names):
+        column_indexes = {column_name: idx for idx, column_name in enumerate(column_names)}
+
+        column_mapping = []
+        for attr_name_from, attr_name_to in self.__resolve_attr_name_mapping(frozenset(column_names)):
+            if attr_name_from not in column_indexes and self.__get_setting(MapperOptions.fail_on_get_attr, True):
+                raise AttributeError("Unknown attribute: {}. Available columns: {}".format(
+                    attr_name_from, ", ".join(column_names)))
+            column_mapping.append((column_indexes.get(attr_name_from), attr_name_from, attr_name_to, False))
+
+        return tuple(column_mapping)
+
+    def __map_columns(self, value_columns, column_names, column_mapping):
+        for row in izip(*value_columns):
+            yield self.__call_counted(self.__map_row, row, column_names, column_mapping)
+
+    def __is_value_conversion_column(self, attr_name_from, attr_name_to, values):
+        """
+        Checks if values of the column need only Enum conversion (result depends only on the value, so it can be
+        computed once per distinct value).
+        """
+        if attr_name_from in self.__target_value_converters or attr_name_to in self.__string_tables:
+            return False
+
+        to_type = self.__get_target_type(attr_name_to)
+        if to_type is None:
+            return False
+
+        value_types = set(type(value) for value in values)
+        if any(value_type in self.__nested_mappers or value_type.__hash__ is None for value_type in value_types):
+            return False
+
+        return issubclass(to_type, Enum) or any(issubclass(value_type, Enum) for value_type in value_types)
+
+    def __convert_column(self, attr_name_from, attr_name_to, values):
+        counters = self.__stats.get_counters()
+        converted_values = {}
+        converted_column = []
+        # rows of distinct values which were actually converted (e.g. Enum values mapped to Enum target are not)
+        converted_rows = {}
+
+        for value in values:
+            if value is None:
+                converted_column.append(None)
+                continue
+
+            # type is a part of the key, so that e.g. 1 and True are converted separately
+            key = (value.__class__, value)
+            if key not in converted_values:
+                conversions_before = counters[mapper_stats.ENUM_CONVERSIONS] if counters is not None else 0
+                converted_values[key] = self.__do_apply_mapping(attr_name_from, attr_name_to, value)
+                if counters is not None and counters[mapper_stats.ENUM_CONVERSIONS] != conversions_before:
+                    converted_rows[key] = 0
+            if key in converted_rows:
+                converted_rows[key] += 1
+            converted_column.append(converted_values[key])
+
+        if counters is not None:
+            # conversions done once per distinct value are counted for every row
+            counters[mapper_stats.ENUM_CONVERSIONS] += sum(rows - 1 for rows in converted_rows.values())
+
+        return converted_column
+
+    def __map_row(self, row, column_names, column_mapping):
+        return self.__try_create_target_object(self.__get_row_params_dict(row, column_names, column_mapping))
+
+    def __get_row_params_dict(self, row, column_names, column_mapping):
+        mapped_params_dict = {}
+
+        try:
+            for column_idx, attr_name_from, attr_name_to, converted in column_mapping:
+                if converted:
+                    mapped_params_dict[attr_name_to] = row[column_idx]
+                    continue
+
+                source_attr_value = row[column_idx] if column_idx is not None \
+                    else self.__get_attribute_value({}, attr_name_from)
+                mapped_params_dict[attr_name_to] = \
+                    self.__do_apply_mapping(attr_name_from, attr_name_to, source_attr_value)
+
+            if self.__target_initializers:
+                mapped_params_dict.update(self.__apply_initializers(dict(zip(column_names, row))))
+        except AttributeError as er:
+            raise AttributeError("Unknown attribute: {}".format(er.message))
+
+        return mapped_params_dict
+
+    def __do_map(self, obj):
+        if self.__trusted_plans is not None:
+            param_dict = self.__get_trusted_params_dict(obj)
+            return param_dict if self.__target_class is dict else self.__try_create_target_object(param_dict)
+
+        if self.__target_class is dict and isinstance(obj, dict) and not self.__has_attribute_paths():
+            return self.__map_dict_to_dict(obj)
+
+        param_dict = self.__get_mapped_params_dict(obj)
+        return self.__try_create_target_object(param_dict)
+
+    def __do_map_projection(self, obj, projection):
+        return self.__try_create_target_object(self.__get_projected_params_dict(obj, projection))
+
+    def __get_projected_params_dict(self, obj, projection):
+        attr_name_mapping = projection.filter_attr_mapping(self.__get_actual_attr_name_mapping(obj))
+
+        try:
+            mapped_params_dict = self.__apply_mapping(obj, attr_name_mapping)
+            for attr_name, init_func in projection.initializers:
+                mapped_params_dict[attr_name] = init_func(obj)
+            return mapped_params_dict
+        except AttributeError as er:
+            raise AttributeError("Unknown attribute: {}".format(er.message))
+
+    def __get_projection(self, fields):
+        fields = frozenset(fields)
+        projection = self.__projections.get(fields)
+
+        if projection is None:
+            unknown_fields = fields - self.__get_target_attributes()
+            if unknown_fields:
+                raise ValueError("Unknown fields requested: {}. Available fields: {}".format(
+                    ", ".join(sorted(unknown_fields)), ", ".join(sorted(self.__get_target_attributes()))))
+
+            if len(self.__projections) >= MAX_CACHED_PROJECTIONS:
+                self.__projections.clear()
+            projection = self.__projections[fields] = ProjectionPlan(fields, self.__target_initializers.items())
+
+        return projection
+
+    def __get_planned_attr_name_mapping(self, obj, projection):
+        attr_name_mapping = self.__get_actual_attr_name_mapping(obj)
+        return projection.filter_attr_mapping(attr_name_mapping) if projection is not None else attr_name_mapping
+
+    def __get_planned_initializers(self, projection):
+        return projection.initializers if projection is not None else self.__target_initializers.items()
+
+    def __get_target_attributes(self):
+        """
+        Returns all attributes target object can be created with - attributes of target prototype, explicitly mapped
+        and initialized ones.
+        """
+        target_attrs = set(self.__get_discovered_target_class_attributes())
+        target_attrs.update(attr_name for attr_name in self.__explicit_mapping.values() if attr_name)
+        target_attrs.update(self.__target_initializers)
+        return target_attrs
+
+    def __get_mapped_attributes(self, obj):
+        if self.__trusted_plans is not None:
+            return self.__get_trusted_params_dict(obj)
+
+        if isinstance(obj, dict) and self.__target_class is dict and not self.__has_attribute_paths():
+            return self.__map_dict_to_dict(obj)
+
+        return self.__get_mapped_params_dict(obj)
+
+    def __map_dict_to_dict(self, obj):
+        if self.__dict_rename_plan is None:
+            self.__dict_rename_plan = self.__compile_dict_rename_plan()
+
+        try:
+            return self.__dict_rename_plan.map(obj)
+        except AttributeError as er:
+            raise AttributeError("Unknown attribute: {}".format(er.message))
+
+    def __compile_dict_rename_plan(self):
+        explicit_pairs = [(attr_from, attr_to) for attr_from, attr_to in self.__explicit_mapping.items()
+                          if attr_from and attr_to]
+        implicit_pairs = [(attr_name, attr_name) for attr_name in self.__get_discovered_target_class_attributes()
+                          if attr_name not in self.__explicit_mapping]
+
+        implicit_renames = []
+        explicit_renames = []
+        converted = []
+
+        for pairs, renames, required in [(implicit_pairs, implicit_renames, False),
+                                         (explicit_pairs, explicit_renames, True)]:
+            for attr_from, attr_to in pairs:
+                if self.__may_need_conversion(attr_from, attr_to):
+                    converted.append((attr_from, attr_to, required))
+                else:
+                    renames.append((attr_from, attr_to))
+
+        return DictRenamePlan(
+            self.__get_discovered_target_class_attributes(), implicit_renames, explicit_renames, converted,
+            self.__target_initializers.items(), self.__do_apply_mapping, self.__get_attribute_value)
+
+    def __may_need_conversion(self, attr_name_from, attr_name_to):
+        return attr_name_from in self.__target_value_converters or bool(self.__nested_mappers) or \
+            attr_name_to in self.__string_tables or self.__get_target_type(attr_name_to) is not None
+
+    def __get_cached_converters(self):
+        return {attr_name: converter for attr_name, converter in self.__target_value_converters.items()
+                if isinstance(converter, CachedConverter)}
+
+    def __invalidate_plans(self):
+        self.__config_version += 1
+        self.__dict_rename_plan = None
+        self.__dict_shape_attr_mappings = {}
+        self.__object_attr_mapping = (None, None)
+        self.__projections = {}
+        self.__nested_target_plan = None
+        self.__target_types = {}
+        self.__hinted_target_types = None
+        # dotted paths are not read by trusted plans
+        self.__trusted_plans = {} if self.__get_setting(MapperOptions.trusted_input, False) and \
+            not self.__has_attribute_paths() else None
+
+    def __get_trusted_params_dict(self, obj):
+        trusted_plan = self.__trusted_plans.get(obj.__class__)
+
+        if trusted_plan is None:
+            # all objects of the class are assumed to have the same attributes as the first one
+            trusted_plan = self.__trusted_plans[obj.__class__] = TrustedPlan(
+                "{}->{}".format(obj.__class__.__name__, self.__target_class.__name__),
+                self.__get_actual_attr_name_mapping(obj), isinstance(obj, dict),
+                self.__target_initializers.items(), self.__do_apply_mapping, self.__needs_conversion,
+                int(self.__get_setting(MapperOptions.trusted_input, False)))
+
+        return trusted_plan.map(obj)
+
+    def __needs_conversion(self, attr_name_from, attr_name_to, from_type):
+        to_type = self.__get_target_type(attr_name_to)
+        return attr_name_from in self.__target_value_converters or from_type in self.__nested_mappers or \
+            attr_name_to in self.__string_tables or (to_type is not None and to_type != from_type)
+
+    def __build_nested_targets(self, param_dict):
+        if self.__nested_target_plan is None:
+            self.__nested_target_plan = NestedTargetPlan(self.__nested_target_paths, self.__get_target_prototype())
+        self.__nested_target_plan.build(param_dict)
+
     def __try_create_target_object(self, param_dict):
         try:
+            if self.__nested_target_paths:
+                self.__build_nested_targets(param_dict)
             return self.__target_class(**param_dict)
         except TypeError as er:
             raise AttributeError("Error when initializing class {} with params: {}\n{}".format(
@@ -125,40 +827,53 @@ class OneWayMapper(object):
 
         mapped_params_dict = {}
 
-        for attr_name_from, attr_name_to in attr_name_mapping.items():
-            # skip since mapping is suppressed by user (attribute_name = None)
-            if not (attr_name_from and attr_name_to):
-                continue
-
+        for attr_name_from, attr_name_to in attr_name_mapping:
             source_attr_value = self.__get_attribute_value(source_obj, attr_name_from)
             mapped_params_dict[attr_name_to] = self.__do_apply_mapping(attr_name_from, attr_name_to, source_attr_value)
 
         return mapped_params_dict
 
     def __do_apply_mapping(self, attr_name_from, attr_name_to, source_attr_value):
+        if self.__string_tables and attr_name_to in self.__string_tables:
+            return self.__string_tables[attr_name_to].intern(
+                self.__convert_value(attr_name_from, attr_name_to, source_attr_value))
+
+        return self.__convert_value(attr_name_from, attr_name_to, source_attr_value)
 
-        target_attr_value = self.__get_target_proto_attribute_value(attr_name_to)
+    def __convert_value(self, attr_name_from, attr_name_to, source_attr_value):
 
         from_type = self.__try_get_type(source_attr_value)
-        to_type = self.__try_get_type(target_attr_value)
+        to_type = self.__get_target_type(attr_name_to)
 
         if attr_name_from in self.__target_value_converters:
+            self.__stats.count(mapper_stats.CUSTOM_CONVERSIONS)
             return self.__target_value_converters[attr_name_from](source_attr_value)
         elif from_type in self.__nested_mappers:
+            self.__stats.count(mapper_stats.NESTED_MAPPINGS)
             return self.__try_apply_nested_mapper(
                 source_attr_value, from_type, attr_name_from, to_type, attr_name_to)
         elif from_type is not None and to_type is not None and to_type != from_type:
+            self.__count_type_conversion(from_type, to_type)
             return self.__apply_type_conversion(from_type, to_type, source_attr_value)
         else:
             return source_attr_value
 
     def __try_apply_nested_mapper(self, attr_value, from_type, attr_name_from, to_type, attr_name_to):
+        return self.__select_nested_mapper(from_type, attr_name_from, to_type, attr_name_to).map(attr_value)
+
+    def __try_select_nested_mapper(self, from_type, attr_name_from, to_type, attr_name_to):
+        try:
+            return self.__select_nested_mapper(from_type, attr_name_from, to_type, attr_name_to)
+        except ConfigurationException as er:
+            return er
+
+    def __select_nested_mapper(self, from_type, attr_name_from, to_type, attr_name_to):
 
         error_message = "Ambiguous nested mapping for attribute {}->{}. Too many mappings defined for type {}". \
             format(attr_name_from, attr_name_to, from_type.__name__)
 
         if len(self.__nested_mappers[from_type]) == 1:
-            return list(self.__nested_mappers[from_type])[0].map(attr_value)
+            return list(self.__nested_mappers[from_type])[0]
         elif to_type is not None:
             applicable_mappers = [mpr for mpr in self.__nested_mappers[from_type] if mpr.target_class == to_type]
             if len(applicable_mappers) < 1:
@@ -167,7 +882,7 @@ class OneWayMapper(object):
                     ", ".join(["{}{}".format(from_type.__name__, mpr) for mpr in self.__nested_mappers[from_type]]),
                     to_type.__name__))
             elif len(applicable_mappers) == 1:
-                return applicable_mappers[0].map(attr_value)
+                return applicable_mappers[0]
 
         raise ConfigurationException(error_message)
 
@@ -178,25 +893,21 @@ class OneWayMapper(object):
         elif issubclass(to_type, Enum):
             return cls.__get_conversion_to_enum(attr_value, from_type, to_type)
         elif issubclass(from_type, datetime) and issubclass(to_type, basestring):
-            return cls.__get_conversion_from_datetime(attr_value)
+            return format_datetime(attr_value)
         elif issubclass(from_type, basestring) and issubclass(to_type, datetime):
-            return cls.__get_conversion_to_datetime(attr_value)
+            return parse_datetime(attr_value)
         return attr_value
 
-    @classmethod
-    def __get_conversion_to_datetime(cls, attr_value):
-        try:
-            return datetime.strptime(attr_value, "%Y-%m-%dT%H:%M:%S.%f")
-        except ValueError as e1:
-            try:
-                return datetime.strptime(attr_value, "%Y-%m-%dT%H:%M:%S")
-            except ValueError as e2:
-                raise ValueError("Could not create datetime object from string: {}. {}. {}".format(
-                    attr_value, e1.message, e2.message))
+    def __count_type_conversion(self, from_type, to_type):
+        counters = self.__stats.get_counters()
+        if counters is None:
+            return
 
-    @classmethod
-    def __get_conversion_from_datetime(cls, attr_value):
-        return attr_value.isoformat()
+        if issubclass(from_type, Enum) or issubclass(to_type, Enum):
+            counters[mapper_stats.ENUM_CONVERSIONS] += 1
+        elif issubclass(from_type, datetime) and issubclass(to_type, basestring) or \
+                issubclass(from_type, basestring) and issubclass(to_type, datetime):
+            counters[mapper_stats.DATETIME_CONVERSIONS] += 1
 
     @classmethod
     def __get_conversion_to_enum(cls, attr_value, from_type, to_enum_type):
@@ -215,16 +926,47 @@ class OneWayMapper(object):
             return attr_value.name
         return attr_value
 
+    def __get_target_type(self, attr_name):
+        """
+        Returns type of target attribute - declared by type hints of target class or type of target prototype's value.
+        Type is resolved once per attribute.
+        """
+        target_type = self.__target_types.get(attr_name, _UNKNOWN_TYPE)
+
+        if target_type is _UNKNOWN_TYPE:
+            if self.__hinted_target_types is None:
+                self.__hinted_target_types = get_attribute_types(self.__target_class)
+
+            target_type = self.__hinted_target_types.get(attr_name) or \
+                self.__try_get_type(self.__get_target_proto_attribute_value(attr_name))
+            self.__target_types[attr_name] = target_type
+
+        return target_type
+
     def __get_target_proto_attribute_value(self, attr_name):
-        return self.__get_attribute_value(self.__target_prototype_obj, attr_name) \
-            if self.__target_prototype_obj else None
+        target_prototype = self.__get_target_prototype()
+        if not target_prototype:
+            return None
+
+        if is_attribute_path(attr_name):
+            # nested target values are built by the mapper, prototype doesn't have to contain them
+            return AttributePath(attr_name).find(target_prototype)
+
+        return self.__get_attribute_value(target_prototype, attr_name)
+
+    def __has_attribute_paths(self):
+        return bool(self.__source_paths or self.__nested_target_paths)
 
     def __get_attribute_value(self, obj, attr_name):
         try:
-            attr_value = obj[attr_name] if isinstance(obj, dict) else getattr(obj, attr_name)
+            if self.__source_paths and attr_name in self.__source_paths:
+                attr_value = self.__source_paths[attr_name].get(obj)
+            else:
+                attr_value = obj[attr_name] if isinstance(obj, dict) else getattr(obj, attr_name)
         except Exception as ex:
             if self.__get_setting(MapperOptions.fail_on_get_attr, True):
                 raise ex
+            self.__stats.count(mapper_stats.GET_ATTR_FALLBACKS)
             return None
 
         return attr_value
@@ -234,13 +976,44 @@ class OneWayMapper(object):
         return type(attr_value) if attr_value is not None else None
 
     def __get_actual_attr_name_mapping(self, obj):
+        """
+        Returns (attr_name_from, attr_name_to) pairs to map for given source object. Pairs are resolved once per dict key
+        shape or source class.
+        """
+        if isinstance(obj, dict):
+            return self.__get_dict_shape_attr_mapping(frozenset(obj))
+
+        source_class_attrs = \
+            self.__source_attributes_cache.get_attrs_update_cache(obj) if self.__target_prototype_obj else None
 
-        common_attributes = self.__get_common_instance_attributes(obj) if self.__target_prototype_obj else []
+        cached_class_attrs, attr_mapping = self.__object_attr_mapping
+        if attr_mapping is None or cached_class_attrs is not source_class_attrs:
+            attr_mapping = self.__resolve_attr_name_mapping(source_class_attrs)
+            self.__object_attr_mapping = (source_class_attrs, attr_mapping)
+
+        return attr_mapping
+
+    def __get_dict_shape_attr_mapping(self, dict_keys):
+        attr_mapping = self.__dict_shape_attr_mappings.get(dict_keys)
+
+        if attr_mapping is None:
+            if len(self.__dict_shape_attr_mappings) >= MAX_CACHED_DICT_SHAPES:
+                self.__dict_shape_attr_mappings.clear()
+            attr_mapping = self.__dict_shape_attr_mappings[dict_keys] = self.__resolve_attr_name_mapping(dict_keys)
+
+        return attr_mapping
+
+    def __resolve_attr_name_mapping(self, source_attrs):
+
+        common_attributes = source_attrs.intersection(self.__get_discovered_target_class_attributes()) \
+            if self.__target_prototype_obj else []
 
         actual_attr_name_mapping = {common_attr: common_attr for common_attr in common_attributes}
         actual_attr_name_mapping.update(self.__explicit_mapping)
 
-        return actual_attr_name_mapping
+        # skip attributes for which mapping is suppressed by user (attribute_name = None)
+        return tuple((attr_name_from, attr_name_to) for attr_name_from, attr_name_to in actual_attr_name_mapping.items()
+                     if attr_name_from and attr_name_to)
 
     @classmethod
     def __try_create_prototype(cls, to_class):
@@ -251,14 +1024,10 @@ class OneWayMapper(object):
             # mapping won't work
             return None
 
-    def __get_common_instance_attributes(self, from_obj):
-        source_class_attrs = self.__source_attributes_cache.get_attrs_update_cache(from_obj)
-        return source_class_attrs.intersection(self.__get_discovered_target_class_attributes())
-
     def __get_discovered_target_class_attributes(self):
         if self.__discovered_target_class_attrs is None:
-            self.__discovered_target_class_attrs = \
-                set(get_attributes(self.__target_prototype_obj)) if self.__target_prototype_obj else set()
+            target_prototype = self.__get_target_prototype()
+            self.__discovered_target_class_attrs = set(get_attributes(target_prototype)) if target_prototype else set()
 
         return self.__discovered_target_class_attrs
 
@@ -275,4 +1044,5 @@ class OneWayMapper(object):
                 raise ValueError(error_message_template.format(name))
 
     def __repr__(self):
-        return "->{}".format(self.__target_class.__name__)
+        source_class_name = self.__source_class.__name__ if self.__source_class else ""
+        return "{}->{}".format(source_class_name, self.__target_class.__name__)
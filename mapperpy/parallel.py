@@ -0,0 +1,177 @@
+import csv
+import json
+import mmap
+import multiprocessing
+import os
+import shutil
+import tempfile
+import traceback
+
+from mapperpy.exceptions import RecordMappingException
+from mapperpy.record_batch import RecordBatch
+from mapperpy.shared_columns import SHARED_MEMORY_DIR, export_batch, import_batch
+
+JSONL = "jsonl"
+CSV = "csv"
+
+CHUNKS_PER_PROCESS = 4
+
+
+def map_file_parallel(path, mapper_factory, input_format=JSONL, processes=None, chunks=None, sink=None,
+                      as_batch=False, **reader_kwargs):
+    """
+    Maps JSON Lines or CSV file in parallel. File is memory-mapped and split into byte ranges aligned to record (line)
+    boundaries, each range is mapped in a worker process which reads it directly from its own memory mapping.
+
+    CSV input has to contain header row and can't contain line breaks within quoted values.
+
+    :param mapper_factory: picklable (module level) callable returning mapper - it's called once in every worker
+    :param input_format: JSONL or CSV
+    :param processes: number of worker processes (number of CPUs by default)
+    :param chunks: number of byte ranges file is split into (CHUNKS_PER_PROCESS per process by default)
+    :param sink: if set, it's called with list of mapped objects (record batch) for every range (in input order)
+        instead of collecting all of them
+    :param as_batch: if set, mapped attributes are collected into :class:`RecordBatch` (mapper has to be
+        :class:`OneWayMapper`). Workers pass array columns back through shared memory instead of pickling objects
+    :return: list of mapped objects (record batch) in input order or number of mapped records if sink is set
+    :raise RecordMappingException: if any record can't be decoded or mapped
+    """
+    if input_format not in (JSONL, CSV):
+        raise ValueError("Unsupported input format: {}".format(input_format))
+
+    processes = processes or multiprocessing.cpu_count()
+    ranges = split_file(path, chunks or processes * CHUNKS_PER_PROCESS, skip_header=input_format == CSV)
+
+    batch_dir = tempfile.mkdtemp(prefix="mapperpy-", dir=SHARED_MEMORY_DIR) if as_batch else None
+    tasks = [(path, start, end, mapper_factory, input_format, reader_kwargs, batch_dir) for start, end in ranges]
+
+    results = None if sink is not None else [] if not as_batch else RecordBatch(mapper_factory().target_class)
+    records_count = 0
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        for mapped_objects in pool.imap(_map_range, tasks):
+            if as_batch:
+                exported_batch = mapped_objects
+                mapped_objects = import_batch(exported_batch)
+                os.remove(exported_batch.path)
+
+            records_count += len(mapped_objects)
+            if sink is None:
+                results.extend(mapped_objects)
+            else:
+                sink(mapped_objects)
+    finally:
+        # all results are consumed at this point (or mapping failed) so remaining workers can be stopped
+        pool.terminate()
+        pool.join()
+        if batch_dir is not None:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+    return results if sink is None else records_count
+
+
+def split_file(path, parts, skip_header=False):
+    """
+    Splits file into at most *parts* (start, end) byte ranges which begin at line boundaries.
+    """
+    with open(path, "rb") as fileobj:
+        size = os.fstat(fileobj.fileno()).st_size
+        if size == 0:
+            return []
+
+        mapped_file = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = _next_line_start(mapped_file, 0, size) if skip_header else 0
+            return _split_range(mapped_file, start, size, parts)
+        finally:
+            mapped_file.close()
+
+
+def _split_range(mapped_file, start, end, parts):
+    ranges = []
+    approx_size = max((end - start) // max(parts, 1), 1)
+
+    while start < end:
+        range_end = _next_line_start(mapped_file, min(start + approx_size, end) - 1, end)
+        ranges.append((start, range_end))
+        start = range_end
+
+    return ranges
+
+
+def _next_line_start(mapped_file, pos, end):
+    newline_pos = mapped_file.find(b"\n", pos, end)
+    return end if newline_pos < 0 else newline_pos + 1
+
+
+def _iter_range_lines(mapped_file, start, end):
+    """
+    Yields (offset, line) for lines within given byte range.
+    """
+    pos = start
+    while pos < end:
+        line_end = _next_line_start(mapped_file, pos, end)
+        yield pos, mapped_file[pos:line_end]
+        pos = line_end
+
+
+def _map_range(task):
+    path, start, end, mapper_factory, input_format, reader_kwargs, batch_dir = task
+    mapper = mapper_factory()
+
+    if batch_dir is None:
+        results = []
+        map_record, add_result = mapper.map, results.append
+    else:
+        results = RecordBatch(mapper.target_class)
+        map_record, add_result = mapper.map_attributes, results.append
+
+    with open(path, "rb") as fileobj:
+        mapped_file = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if input_format == JSONL:
+                _map_jsonl_range(mapped_file, start, end, map_record, add_result)
+            else:
+                _map_csv_range(mapped_file, start, end, mapper, reader_kwargs, batch_dir is not None, add_result)
+        finally:
+            mapped_file.close()
+
+    if batch_dir is None:
+        return results
+
+    return export_batch(results, os.path.join(batch_dir, "{}-{}".format(start, end)))
+
+
+def _map_jsonl_range(mapped_file, start, end, map_record, add_result):
+    for offset, line in _iter_range_lines(mapped_file, start, end):
+        if not line.strip():
+            continue
+        try:
+            add_result(map_record(json.loads(line)))
+        except Exception as er:
+            raise RecordMappingException(offset, er, traceback.format_exc())
+
+
+def _map_csv_range(mapped_file, start, end, mapper, reader_kwargs, as_attributes, add_result):
+    header = next(csv.reader([_read_line(mapped_file, 0)], **reader_kwargs))
+    current_offset = [start]
+
+    def lines():
+        for offset, line in _iter_range_lines(mapped_file, start, end):
+            current_offset[0] = offset
+            yield line
+
+    rows = mapper.map_rows(csv.reader(lines(), **reader_kwargs), header, create_object=not as_attributes)
+
+    while True:
+        try:
+            add_result(next(rows))
+        except StopIteration:
+            return
+        except Exception as er:
+            raise RecordMappingException(current_offset[0], er, traceback.format_exc())
+
+
+def _read_line(mapped_file, pos):
+    return mapped_file[pos:_next_line_start(mapped_file, pos, mapped_file.size())]
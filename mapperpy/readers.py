@@ -0,0 +1,122 @@
+import csv
+import json
+import logging
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_logger = logging.getLogger(__name__)
+
+
+class MalformedRecord(object):
+    """
+    Describes input record which could not be decoded. *line_number* starts from 1.
+    """
+
+    def __init__(self, line_number, line, error):
+        self.line_number = line_number
+        self.line = line
+        self.error = error
+
+    def __repr__(self):
+        return "MalformedRecord(line {}: {})".format(self.line_number, self.error)
+
+
+def _log_malformed_record(record):
+    _logger.warning("Skipping malformed record at line %s: %s", record.line_number, record.error)
+
+
+def iter_lines(fileobj, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Yields lines (without line terminators) from file object read in blocks of *buffer_size*.
+    """
+    remainder = None
+
+    while True:
+        block = fileobj.read(buffer_size)
+        if not block:
+            break
+
+        newline = b"\n" if isinstance(block, bytes) else u"\n"
+        lines = (remainder + block if remainder else block).split(newline)
+        # last line might be incomplete - it's completed by the next block
+        remainder = lines.pop()
+
+        for line in lines:
+            yield line
+
+    if remainder:
+        yield remainder
+
+
+def map_jsonl(fileobj_or_path, mapper, buffer_size=DEFAULT_BUFFER_SIZE, on_error=_log_malformed_record):
+    """
+    Lazily maps JSON Lines input (one JSON object per line) using given mapper. Input is read in blocks of
+    *buffer_size* bytes. Lines which can't be decoded into JSON object are passed to *on_error* as
+    :class:`MalformedRecord` and skipped, empty lines are ignored.
+
+    :param fileobj_or_path: file object or path of the file to read
+    :param mapper: :class:`OneWayMapper` or :class:`ObjectMapper`
+    """
+    if isinstance(fileobj_or_path, basestring):
+        return _map_jsonl_file(fileobj_or_path, mapper, buffer_size, on_error)
+
+    return mapper.map_many(_decode_json_lines(fileobj_or_path, buffer_size, on_error))
+
+
+def _map_jsonl_file(path, mapper, buffer_size, on_error):
+    with open(path, "rb") as fileobj:
+        for mapped_obj in mapper.map_many(_decode_json_lines(fileobj, buffer_size, on_error)):
+            yield mapped_obj
+
+
+def _decode_json_lines(fileobj, buffer_size, on_error):
+    for line_number, line in enumerate(iter_lines(fileobj, buffer_size), 1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError as er:
+            on_error(MalformedRecord(line_number, line, er))
+            continue
+
+        if not isinstance(record, dict):
+            on_error(MalformedRecord(line_number, line, ValueError(
+                "JSON object expected, instead got {}".format(type(record).__name__))))
+            continue
+
+        yield record
+
+
+def map_csv(fileobj_or_path, mapper, header=True, **reader_kwargs):
+    """
+    Lazily maps CSV input using given :class:`OneWayMapper`. Header is resolved against mapper's attribute mapping once,
+    rows are mapped by column position (no dict is built per row). Additional keyword arguments are passed to
+    *csv.reader*.
+
+    :param header: True if column names should be read from the first row, otherwise sequence of column names
+    """
+    if not header:
+        raise ValueError("Column names are required, either from the first row (header=True) or as a sequence")
+
+    if isinstance(fileobj_or_path, basestring):
+        return _map_csv_file(fileobj_or_path, mapper, header, reader_kwargs)
+
+    return _map_csv_rows(csv.reader(fileobj_or_path, **reader_kwargs), mapper, header)
+
+
+def _map_csv_file(path, mapper, header, reader_kwargs):
+    with open(path, "rb") as fileobj:
+        for mapped_obj in _map_csv_rows(csv.reader(fileobj, **reader_kwargs), mapper, header):
+            yield mapped_obj
+
+
+def _map_csv_rows(rows, mapper, header):
+    if header is True:
+        try:
+            header = next(rows)
+        except StopIteration:
+            return
+
+    for mapped_obj in mapper.map_rows(rows, header):
+        yield mapped_obj
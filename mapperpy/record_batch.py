@@ -0,0 +1,298 @@
+from array import array
+from collections import namedtuple
+from datetime import datetime, timedelta
+from enum import Enum
+
+_NONE = "none"
+_BOOL = "bool"
+_INT = "int"
+_FLOAT = "float"
+_STR = "str"
+_ENUM = "enum"
+_DATETIME = "datetime"
+_OBJECT = "object"
+
+_ARRAY_TYPECODES = {_BOOL: "b", _INT: "l", _FLOAT: "d", _ENUM: "l", _DATETIME: "l"}
+
+# naive datetimes are stored as number of microseconds since the epoch
+_EPOCH = datetime(1970, 1, 1)
+
+# Raw storage of a column - *values* are array.array for array kinds (see ARRAY_KINDS), list otherwise
+ColumnStorage = namedtuple("ColumnStorage", ["kind", "values", "nulls", "enum_class"])
+ARRAY_KINDS = frozenset(_ARRAY_TYPECODES)
+
+
+def _get_kind(value):
+    if isinstance(value, bool):
+        return _BOOL
+    elif isinstance(value, (int, long)):
+        return _INT
+    elif isinstance(value, float):
+        return _FLOAT
+    elif isinstance(value, basestring):
+        return _STR
+    elif isinstance(value, Enum):
+        return _ENUM
+    elif isinstance(value, datetime) and value.tzinfo is None:
+        return _DATETIME
+    return _OBJECT
+
+
+class Column(object):
+    """
+    Column of values stored compactly according to their type: ints, floats and bools in *array.array*, Enum items as
+    int codes, naive datetimes as microseconds since the epoch, strings in a list with equal strings deduplicated.
+    Column of mixed (or other) values is a plain list. Positions of None values are kept separately.
+    """
+
+    def __init__(self, length=0):
+        # column starts with None values only, storage is chosen when first not None value is appended
+        self.__kind = _NONE
+        self.__values = [None] * length
+        self.__nulls = set(range(length))
+        self.__enum_class = None
+        self.__enum_items = None
+        self.__enum_codes = None
+        self.__strings = None
+
+    @classmethod
+    def from_storage(cls, storage):
+        """
+        Creates column from :class:`ColumnStorage` (e.g. returned by :meth:`storage`) - values are not copied.
+        """
+        column = cls()
+        column.__set_kind(storage.kind, storage.enum_class)
+        column.__values = storage.values
+        column.__nulls = set(storage.nulls)
+
+        if column.__kind == _STR:
+            column.__strings.update((value, value) for value in column.__values if value is not None)
+
+        return column
+
+    @property
+    def kind(self):
+        return self.__kind
+
+    def storage(self):
+        return ColumnStorage(self.__kind, self.__values, self.__nulls, self.__enum_class)
+
+    def extend(self, other):
+        """
+        Appends all values of *other* column. Columns of the same kind are joined by extending their storage.
+        """
+        if self.__kind == other.__kind and self.__kind in _ARRAY_TYPECODES and \
+                self.__enum_class is other.__enum_class:
+            length = len(self.__values)
+            self.__values.extend(other.__values)
+            self.__nulls.update(idx + length for idx in other.__nulls)
+            return
+
+        for value in other:
+            self.append(value)
+
+    def append(self, value):
+        if value is None:
+            self.__nulls.add(len(self.__values))
+            self.__values.append(0 if self.__kind in _ARRAY_TYPECODES else None)
+            return
+
+        kind = _get_kind(value)
+        if self.__kind != _OBJECT and (kind != self.__kind or kind == _ENUM and type(value) is not self.__enum_class):
+            self.__change_kind(kind if self.__kind == _NONE else _OBJECT, value)
+
+        try:
+            self.__values.append(self.__encode(value))
+        except OverflowError:
+            self.__change_kind(_OBJECT, value)
+            self.__values.append(value)
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.__slice(idx)
+
+        if idx < 0:
+            idx += len(self.__values)
+
+        if self.__nulls and idx in self.__nulls:
+            return None
+
+        return self.__decode(self.__values[idx])
+
+    def __iter__(self):
+        for idx in range(len(self.__values)):
+            yield self[idx]
+
+    def __encode(self, value):
+        if self.__kind == _ENUM:
+            return self.__enum_codes[value]
+        elif self.__kind == _DATETIME:
+            delta = value - _EPOCH
+            return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        elif self.__kind == _STR:
+            return self.__strings.setdefault(value, value)
+        return value
+
+    def __decode(self, value):
+        if self.__kind == _ENUM:
+            return self.__enum_items[value]
+        elif self.__kind == _BOOL:
+            return bool(value)
+        elif self.__kind == _DATETIME:
+            return _EPOCH + timedelta(microseconds=value)
+        return value
+
+    def __change_kind(self, kind, value):
+        current_values = list(self)
+
+        self.__set_kind(kind, type(value) if kind == _ENUM else None)
+
+        placeholder = 0 if kind in _ARRAY_TYPECODES else None
+        encoded_values = [self.__encode(item) if item is not None else placeholder for item in current_values]
+        self.__values = array(_ARRAY_TYPECODES[kind], encoded_values) if kind in _ARRAY_TYPECODES \
+            else encoded_values
+
+    def __set_kind(self, kind, enum_class):
+        self.__kind = kind
+        self.__enum_class = enum_class
+        self.__enum_items = list(enum_class) if kind == _ENUM else None
+        self.__enum_codes = {item: code for code, item in enumerate(self.__enum_items)} if kind == _ENUM else None
+        self.__strings = {} if kind == _STR else None
+
+    def __slice(self, idx_slice):
+        column = Column()
+        for value in [self[idx] for idx in range(*idx_slice.indices(len(self)))]:
+            column.append(value)
+        return column
+
+
+class RowView(object):
+    """
+    Lightweight read-only view of a single row of :class:`RecordBatch` - row's values are accessed as attributes.
+    """
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, attr_name):
+        return self._batch.get_value(self._index, attr_name)
+
+    def _asdict(self):
+        return self._batch.get_row_dict(self._index)
+
+    def __eq__(self, other):
+        return isinstance(other, RowView) and self._asdict() == other._asdict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "RowView({})".format(", ".join(
+            "{}={!r}".format(attr_name, value) for attr_name, value in sorted(self._asdict().items())))
+
+
+class RecordBatch(object):
+    """
+    Mapped records stored as typed columns (see :class:`Column`). Indexing and iteration return :class:`RowView`
+    objects, slicing returns new batch. Records can be converted to target class instances with :meth:`to_objects`.
+    """
+
+    def __init__(self, target_class):
+        self.__target_class = target_class
+        self.__columns = {}
+        self.__length = 0
+
+    @property
+    def target_class(self):
+        return self.__target_class
+
+    @property
+    def attribute_names(self):
+        return sorted(self.__columns)
+
+    def append(self, mapped_attributes):
+        for attr_name, value in mapped_attributes.items():
+            if attr_name not in self.__columns:
+                self.__columns[attr_name] = Column(self.__length)
+            self.__columns[attr_name].append(value)
+
+        self.__length += 1
+
+        # attributes missing in this record
+        for attr_name, column in self.__columns.items():
+            if len(column) < self.__length:
+                column.append(None)
+
+    @classmethod
+    def from_columns(cls, target_class, columns, length):
+        """
+        :param columns: dict attribute name -> :class:`Column`, all columns of given length
+        """
+        batch = cls(target_class)
+        batch.__columns = dict(columns)
+        batch.__length = length
+        return batch
+
+    def column(self, attr_name):
+        return self.__columns[attr_name]
+
+    def extend(self, other):
+        """
+        Appends all records of *other* batch, columns are joined (see :meth:`Column.extend`).
+        """
+        for attr_name, column in other.__columns.items():
+            if attr_name not in self.__columns:
+                self.__columns[attr_name] = Column(self.__length)
+            self.__columns[attr_name].extend(column)
+
+        self.__length += len(other)
+
+        # attributes missing in the other batch
+        for attr_name, column in self.__columns.items():
+            if len(column) < self.__length:
+                column.extend(Column(self.__length - len(column)))
+
+    def get_value(self, idx, attr_name):
+        try:
+            return self.__columns[attr_name][idx]
+        except KeyError:
+            raise AttributeError("Record has no attribute {}".format(attr_name))
+
+    def get_row_dict(self, idx):
+        return {attr_name: column[idx] for attr_name, column in self.__columns.items()}
+
+    def to_object(self, idx):
+        return self.__target_class(**self.get_row_dict(idx))
+
+    def to_objects(self):
+        return [self.to_object(idx) for idx in range(self.__length)]
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.__slice(idx)
+
+        if not -self.__length <= idx < self.__length:
+            raise IndexError("Record batch index out of range")
+
+        return RowView(self, idx if idx >= 0 else idx + self.__length)
+
+    def __iter__(self):
+        for idx in range(self.__length):
+            yield RowView(self, idx)
+
+    def __slice(self, idx_slice):
+        batch = RecordBatch(self.__target_class)
+        batch.__columns = {attr_name: column[idx_slice] for attr_name, column in self.__columns.items()}
+        batch.__length = len(range(*idx_slice.indices(self.__length)))
+        return batch
+
+    def __repr__(self):
+        return "RecordBatch({}, {} records)".format(self.__target_class.__name__, self.__length)
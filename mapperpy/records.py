@@ -0,0 +1,82 @@
+import re
+from collections import namedtuple
+
+SLOTS = "slots"
+NAMEDTUPLE = "namedtuple"
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# generated classes are cached so that the same record type is shared (and can be restored when unpickling)
+_record_types = {}
+
+
+class Record(object):
+    """
+    Base class of generated record types. Record stores attributes in __slots__ (no per-instance __dict__) and can be
+    initialized only with keyword arguments, missing attributes are set to None.
+    """
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for field in self.__slots__:
+            setattr(self, field, kwargs.pop(field, None))
+
+        if kwargs:
+            raise TypeError("{} got unexpected keyword argument(s): {}".format(
+                self.__class__.__name__, ", ".join(sorted(kwargs))))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__getstate__() == other.__getstate__()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            setattr(self, field, value)
+
+    def __reduce__(self):
+        # generated class can't be found by name in any module - it's recreated from its definition instead
+        return _restore_record, (self.__class__.__name__, self.__slots__, self.__getstate__())
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, ", ".join(
+            "{}={!r}".format(field, getattr(self, field)) for field in self.__slots__))
+
+
+def record_type(name, fields, kind=SLOTS):
+    """
+    Creates compact record class with given attributes. Record types are cached by name and fields. Instances of
+    SLOTS records can be pickled, namedtuple ones only if the class is also assigned to a module level name.
+
+    :param kind: SLOTS for :class:`Record` subclass or NAMEDTUPLE for namedtuple (with all fields defaulting to None)
+    """
+    fields = tuple(fields)
+
+    cache_key = (name, fields, kind)
+    if cache_key in _record_types:
+        return _record_types[cache_key]
+
+    invalid_fields = [field for field in fields if not _IDENTIFIER.match(field) or field.startswith("__")]
+    if invalid_fields:
+        raise ValueError("Invalid record field name(s): {}".format(", ".join(invalid_fields)))
+
+    if kind == NAMEDTUPLE:
+        record_class = namedtuple(name, fields)
+        record_class.__new__.__defaults__ = (None,) * len(fields)
+    elif kind == SLOTS:
+        record_class = type(name, (Record,), {"__slots__": fields})
+    else:
+        raise ValueError("Unknown record kind: {}".format(kind))
+
+    _record_types[cache_key] = record_class
+    return record_class
+
+
+def _restore_record(name, fields, state):
+    record = Record.__new__(record_type(name, fields))
+    record.__setstate__(state)
+    return record
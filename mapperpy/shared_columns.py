@@ -0,0 +1,57 @@
+"""
+Transport of :class:`RecordBatch` between processes. Array columns (ints, floats, bools, Enum codes, datetimes) are
+written as raw bytes into a file in shared memory (``/dev/shm`` where available) and read back with a single bulk read
+per column. Only the small descriptor and remaining (string and object) columns are pickled.
+"""
+import os
+from array import array
+from collections import namedtuple
+
+from mapperpy.record_batch import ARRAY_KINDS, Column, RecordBatch
+
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# columns are (attr_name, ColumnStorage, shared) - values of shared columns are (typecode, length) stored in the file
+ExportedBatch = namedtuple("ExportedBatch", ["path", "target_class", "length", "columns"])
+
+
+def export_batch(batch, path):
+    """
+    Writes array columns of the batch into file at *path*.
+
+    :rtype: ExportedBatch
+    """
+    columns = []
+
+    with open(path, "wb") as batch_file:
+        for attr_name in batch.attribute_names:
+            storage = batch.column(attr_name).storage()
+            if storage.kind in ARRAY_KINDS:
+                storage.values.tofile(batch_file)
+                columns.append(
+                    (attr_name, storage._replace(values=(storage.values.typecode, len(storage.values))), True))
+            else:
+                columns.append((attr_name, storage, False))
+
+    return ExportedBatch(path, batch.target_class, len(batch), columns)
+
+
+def import_batch(exported_batch):
+    """
+    Reads batch written by :func:`export_batch`.
+
+    :rtype: RecordBatch
+    """
+    columns = {}
+
+    with open(exported_batch.path, "rb") as batch_file:
+        # columns are read in the order they were written
+        for attr_name, storage, shared in exported_batch.columns:
+            if shared:
+                typecode, length = storage.values
+                values = array(typecode)
+                values.fromfile(batch_file, length)
+                storage = storage._replace(values=values)
+            columns[attr_name] = Column.from_storage(storage)
+
+    return RecordBatch.from_columns(exported_batch.target_class, columns, exported_batch.length)
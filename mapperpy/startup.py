@@ -0,0 +1,73 @@
+import weakref
+from collections import namedtuple
+
+_settings = {"lazy": False, "report": False}
+
+# construction costs of live mappers created while startup report is enabled
+_registry = weakref.WeakKeyDictionary()
+
+MapperStartupCost = namedtuple(
+    "MapperStartupCost", ["mapper", "construction_seconds", "initialization_seconds", "lazy"])
+
+
+def enable_lazy_construction(enabled=True):
+    """
+    Globally enables (or disables) lazy construction of mappers created afterwards - creation of target prototype is
+    deferred until it's needed for the first time (e.g. by map or map_attr_name). Disabled by default.
+    """
+    _settings["lazy"] = bool(enabled)
+
+
+def disable_lazy_construction():
+    enable_lazy_construction(False)
+
+
+def lazy_construction_enabled():
+    return _settings["lazy"]
+
+
+def enable_startup_report(enabled=True):
+    """
+    Globally enables (or disables) measuring of construction costs of mappers created afterwards, see
+    :func:`startup_report`. Disabled by default, so that mapper construction isn't slowed down by it.
+    """
+    _settings["report"] = bool(enabled)
+
+
+def disable_startup_report():
+    enable_startup_report(False)
+
+
+def get_construction_settings():
+    """
+    Returns (lazy construction enabled, startup report enabled) pair.
+    """
+    return _settings["lazy"], _settings["report"]
+
+
+class StartupRecord(object):
+    __slots__ = ("construction_seconds", "initialization_seconds", "lazy")
+
+    def __init__(self, construction_seconds, lazy):
+        self.construction_seconds = construction_seconds
+        # time of deferred initialization, None until lazy mapper is used
+        self.initialization_seconds = None
+        self.lazy = lazy
+
+
+def register(mapper, construction_seconds, lazy):
+    record = StartupRecord(construction_seconds, lazy)
+    _registry[mapper] = record
+    return record
+
+
+def startup_report():
+    """
+    Returns :class:`MapperStartupCost` of every live :class:`OneWayMapper` (:class:`ObjectMapper` consists of two of
+    them) created while startup report was enabled, the most expensive ones first.
+    """
+    costs = [MapperStartupCost(repr(mapper), record.construction_seconds, record.initialization_seconds, record.lazy)
+             for mapper, record in list(_registry.items())]
+
+    return sorted(costs, key=lambda cost: cost.construction_seconds + (cost.initialization_seconds or 0),
+                  reverse=True)
@@ -0,0 +1,48 @@
+import sys
+
+DEFAULT_MAX_SIZE = 10000
+
+
+class StringTable(object):
+    """
+    Bounded table deduplicating equal strings - equal string values share one object. Meant for low-cardinality
+    attributes (status codes, country codes, enum names). When table is full, new values are passed through unchanged.
+    Works for both str and unicode (unlike builtin *intern*).
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.__max_size = max_size
+        self.__strings = {}
+        self.__deduplicated = 0
+        self.__bytes_saved = 0
+
+    def intern(self, value):
+        if not isinstance(value, basestring):
+            return value
+
+        existing = self.__strings.get(value)
+        if existing is None:
+            if len(self.__strings) < self.__max_size:
+                self.__strings[value] = value
+            return value
+
+        # str and unicode values can be equal, only value of the same type can be shared
+        if existing is value or type(existing) is not type(value):
+            return value
+
+        self.__deduplicated += 1
+        # estimate - the duplicate can be garbage collected unless it's referenced elsewhere
+        self.__bytes_saved += sys.getsizeof(value)
+        return existing
+
+    @property
+    def size(self):
+        return len(self.__strings)
+
+    @property
+    def deduplicated(self):
+        return self.__deduplicated
+
+    @property
+    def bytes_saved(self):
+        return self.__bytes_saved
@@ -0,0 +1,143 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy import OneWayMapper, ObjectMapper, ConfigurationException
+from mapperpy.attribute_paths import AttributePath
+
+
+class Address(object):
+    def __init__(self, city=None, street=None, geo=None):
+        self.city = city
+        self.street = street
+        self.geo = geo
+
+
+class Person(object):
+    def __init__(self, name=None, address=None):
+        self.name = name
+        self.address = address
+
+
+class FlatPerson(object):
+    def __init__(self, name=None, city=None, street=None, lat=None):
+        self.name = name
+        self.city = city
+        self.street = street
+        self.lat = lat
+
+
+class AttributePathsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = ObjectMapper.from_prototype(Person(address=Address()), FlatPerson()).custom_mappings(
+            {"address.city": "city", "address.street": "street", "address.geo.lat": "lat"})
+
+    def test_attribute_path_should_get_nested_values(self):
+        # given
+        path = AttributePath("address.geo.lat")
+
+        # when
+        values = [path.get(Person(address=Address(geo={"lat": 50.06}))),
+                  path.get({"address": {"geo": {"lat": 52.23}}}),
+                  path.get(Person())]
+
+        # then
+        assert_that(values).is_equal_to([50.06, 52.23, None])
+
+    def test_map_should_flatten_nested_source(self):
+        # when
+        flat_person = self.mapper.map(
+            Person(name="John", address=Address(city="Krakow", street="Dluga", geo={"lat": 50.06})))
+
+        # then
+        assert_that(flat_person).is_type_of(FlatPerson)
+        assert_that([flat_person.name, flat_person.city, flat_person.street, flat_person.lat]).is_equal_to(
+            ["John", "Krakow", "Dluga", 50.06])
+
+    def test_map_should_build_nested_target(self):
+        # when
+        person = self.mapper.map(FlatPerson(name="John", city="Krakow", street="Dluga", lat=50.06))
+
+        # then
+        assert_that(person.name).is_equal_to("John")
+        assert_that(person.address).is_type_of(Address)
+        assert_that([person.address.city, person.address.street]).is_equal_to(["Krakow", "Dluga"])
+        # prototype has no value for geo - dict is built
+        assert_that(person.address.geo).is_equal_to({"lat": 50.06})
+
+    def test_map_should_build_nested_dicts_without_prototype_values(self):
+        # given
+        mapper = OneWayMapper.for_target_class(dict).custom_mappings(
+            {"some_property": "nested.some_property", "some_property_02": "nested.deeper.some_property_02"})
+
+        # when
+        mapped_dict = mapper.map({"some_property": "value", "some_property_02": "value_02"})
+        mapped_attributes = mapper.map_attributes({"some_property": "value", "some_property_02": "value_02"})
+
+        # then
+        assert_that(mapped_dict).is_equal_to(
+            {"nested": {"some_property": "value", "deeper": {"some_property_02": "value_02"}}})
+        assert_that(mapped_attributes).is_equal_to(
+            {"nested.some_property": "value", "nested.deeper.some_property_02": "value_02"})
+
+    def test_map_should_build_nested_dicts_with_dict_prototype(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"name": None}).custom_mappings({"city": "address.city"})
+
+        # when
+        mapped_dict = mapper.map(FlatPerson(name="John", city="Krakow"))
+
+        # then
+        assert_that(mapped_dict).is_equal_to({"name": "John", "address": {"city": "Krakow"}})
+
+    def test_map_should_unflatten_object_into_dict_and_back(self):
+        # given
+        mapper = ObjectMapper.for_dict(FlatPerson()).custom_mappings({"city": "address.city"})
+
+        # when
+        mapped_dict = mapper.map(FlatPerson(name="John", city="Krakow"))
+        flat_person = mapper.map(mapped_dict)
+
+        # then
+        assert_that(mapped_dict).is_equal_to(
+            {"name": "John", "street": None, "lat": None, "address": {"city": "Krakow"}})
+        assert_that(flat_person).is_type_of(FlatPerson)
+        assert_that([flat_person.name, flat_person.city]).is_equal_to(["John", "Krakow"])
+
+    def test_map_many_should_use_attribute_paths(self):
+        # when
+        flat_persons = list(self.mapper.map_many(
+            [Person(name="John", address=Address(city="Krakow")), Person(name="Jane")], fields=["name", "city"]))
+        persons = list(self.mapper.map_many([FlatPerson(name="John")], fields=["name", "address.city"]))
+
+        # then
+        assert_that([(person.name, person.city) for person in flat_persons]).is_equal_to(
+            [("John", "Krakow"), ("Jane", None)])
+        assert_that(persons[0].address).is_type_of(Address)
+        assert_that(persons[0].address.city).is_none()
+
+    def test_map_should_prefer_literal_key_containing_separator(self):
+        # given
+        mapper = OneWayMapper.for_target_class(FlatPerson).custom_mappings({"address.city": "city"})
+        person = Person(address=Address(city="Warsaw"))
+        setattr(person, "address.city", "Gdansk")
+
+        # when
+        flat_persons = [mapper.map({"address.city": "Krakow"}),
+                        mapper.map({"address": {"city": "Warsaw"}}),
+                        mapper.map(person)]
+
+        # then
+        assert_that([flat_person.city for flat_person in flat_persons]).is_equal_to(["Krakow", "Warsaw", "Gdansk"])
+
+    def test_map_attr_name_should_map_paths(self):
+        # when
+        mapped_names = [self.mapper.map_attr_name("address.city"), self.mapper.map_attr_name("lat")]
+
+        # then
+        assert_that(mapped_names).is_equal_to(["city", "address.geo.lat"])
+
+    def test_custom_mappings_should_fail_for_conflicting_paths(self):
+        with self.assertRaises(ConfigurationException):
+            OneWayMapper.for_target_class(dict).custom_mappings(
+                {"some_property": "nested.value", "some_property_02": "nested.value.deeper"})
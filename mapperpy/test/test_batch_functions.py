@@ -0,0 +1,91 @@
+import sqlite3
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, batched
+from mapperpy.batch_functions import iter_chunks
+
+
+class OwnerRepository(object):
+
+    def __init__(self):
+        self.queries = 0
+        self.__connection = sqlite3.connect(":memory:")
+        self.__connection.execute("CREATE TABLE owner (id INTEGER PRIMARY KEY, name TEXT)")
+        self.__connection.executemany("INSERT INTO owner VALUES (?, ?)", [(1, "first"), (2, "second"), (3, "third")])
+
+    def get_names(self, owner_ids):
+        self.queries += 1
+        rows = self.__connection.execute("SELECT id, name FROM owner WHERE id IN ({})".format(
+            ", ".join("?" * len(owner_ids))), owner_ids).fetchall()
+        names = dict(rows)
+        return [names.get(owner_id) for owner_id in owner_ids]
+
+
+class BatchFunctionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = OwnerRepository()
+        self.objs = [TestClassSomePropertyEmptyInit1(some_property=idx % 3 + 1, some_property_02=idx)
+                     for idx in range(5)]
+
+    def test_map_many_should_call_batch_initializer_once_per_chunk(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).target_initializers({
+            "unmapped_property2": batched(
+                lambda objs: self.repository.get_names([obj.some_property for obj in objs]))})
+
+        # when
+        mapped_objects = list(mapper.map_many(self.objs, chunk_size=2))
+
+        # then
+        assert_that([obj.unmapped_property2 for obj in mapped_objects]).is_equal_to(
+            ["first", "second", "third", "first", "second"])
+        assert_that([obj.some_property_02 for obj in mapped_objects]).is_equal_to([0, 1, 2, 3, 4])
+        assert_that(self.repository.queries).is_equal_to(3)
+
+    def test_map_many_should_call_batch_converter_once_per_chunk(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2) \
+            .value_converters({"some_property": (batched(self.repository.get_names), lambda name: name)})
+
+        # when
+        mapped_objects = list(mapper.map_many(self.objs))
+        batch = mapper.map_many(self.objs, as_batch=True)
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            ["first", "second", "third", "first", "second"])
+        assert_that(list(batch.column("some_property"))).is_equal_to(
+            ["first", "second", "third", "first", "second"])
+        assert_that(self.repository.queries).is_equal_to(2)
+
+    def test_map_should_call_batch_function_with_single_value(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).target_value_converters(
+            {"some_property": batched(self.repository.get_names)})
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property=2))
+
+        # then
+        assert_that(mapped_object.some_property).is_equal_to("second")
+        assert_that(self.repository.queries).is_equal_to(1)
+
+    def test_map_many_should_fail_when_batch_function_returns_wrong_number_of_results(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).target_value_converters(
+            {"some_property": batched(lambda values: values[:1])})
+
+        # when
+        with self.assertRaises(ValueError) as context:
+            list(mapper.map_many(self.objs))
+
+        # then
+        assert_that(context.exception.message).contains("returned 1 results for 5 values")
+
+    def test_iter_chunks(self):
+        assert_that(list(iter_chunks(range(5), 2))).is_equal_to([[0, 1], [2, 3], [4]])
+        assert_that(list(iter_chunks([], 2))).is_empty()
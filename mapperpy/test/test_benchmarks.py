@@ -0,0 +1,66 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.benchmarks import run_benchmarks, compare_with_baseline, get_scenarios, SCENARIOS, \
+    run_memory_benchmarks, check_budgets
+
+
+class BenchmarksTest(unittest.TestCase):
+
+    def test_all_scenarios_should_run(self):
+        # when
+        results = run_benchmarks(repeat=1, number=1)
+
+        # then
+        assert_that(results["scenarios"]).contains_only(*[scenario.name for scenario in SCENARIOS])
+        for values in results["scenarios"].values():
+            assert_that(values["seconds_per_call"]).is_greater_than(0)
+
+    def test_get_scenarios_when_unknown_name_should_raise_exception(self):
+        with self.assertRaises(ValueError) as context:
+            get_scenarios(["object_to_object", "unknown_scenario"])
+
+        assert_that(context.exception.message).contains("unknown_scenario")
+
+    def test_compare_with_baseline_should_report_only_regressions_above_threshold(self):
+        # given
+        baseline = {"scenarios": {"fast": {"seconds_per_call": 1.0},
+                                  "slow": {"seconds_per_call": 1.0},
+                                  "missing": {"seconds_per_call": 1.0}}}
+        results = {"scenarios": {"fast": {"seconds_per_call": 1.05},
+                                 "slow": {"seconds_per_call": 1.5},
+                                 "new": {"seconds_per_call": 9.0}}}
+
+        # when
+        regressions = compare_with_baseline(results, baseline, threshold=0.1)
+
+        # then
+        assert_that([regression.scenario_name for regression in regressions]).is_equal_to(["slow"])
+        assert_that(regressions[0].ratio).is_equal_to(1.5)
+
+
+class MemoryBenchmarksTest(unittest.TestCase):
+
+    def test_memory_benchmarks_should_report_allocations_within_budgets(self):
+        # when
+        results = run_memory_benchmarks(["object_to_object", "nested_mapper", "record_batch"])
+
+        # then
+        assert_that(results["scenarios"]).contains_only("object_to_object", "nested_mapper", "record_batch")
+        for values in results["scenarios"].values():
+            assert_that(values["allocations_per_object"]).is_greater_than(0)
+            assert_that(values["objects_per_object"]).is_greater_than(0)
+            assert_that(values["bytes_per_object"]).is_greater_than(0)
+        assert_that(check_budgets(results)).is_empty()
+
+    def test_check_budgets_should_report_exceeded_budgets(self):
+        # given
+        results = {"scenarios": {"object_to_object": {"allocations_per_object": 100.0, "objects_per_object": 1.0},
+                                 "mapper_construction": {"allocations_per_object": 1000.0}}}
+
+        # when
+        violations = check_budgets(results)
+
+        # then
+        assert_that([violation.scenario_name for violation in violations]).is_equal_to(["object_to_object"])
+        assert_that(violations[0].metric).is_equal_to("allocations_per_object")
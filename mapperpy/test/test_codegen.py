@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import ObjectMapper, ConfigurationException
+from mapperpy.codegen import generate_module, find_mappers, main
+
+
+class Status(Enum):
+    active = 1
+    inactive = 2
+
+
+def to_upper(value):
+    return value.upper() if value else value
+
+
+def to_lower(value):
+    return value.lower() if value else value
+
+
+def init_unmapped(obj):
+    return "initialized_{}".format(obj["some_property"])
+
+
+object_mapper = ObjectMapper.from_prototype(
+    TestClassSomePropertyEmptyInit1(some_property=Status.active, some_property_02=datetime.now()),
+    TestClassMappedPropertyEmptyInit(mapped_property="", mapped_property_02="")).custom_mappings(
+    {"some_property": "mapped_property", "some_property_02": "mapped_property_02",
+     "some_property_03": "mapped_property_03"}).nested_mapper(
+    ObjectMapper.from_class(TestClassSomePropertyEmptyInit2, TestClassSomePropertyEmptyInit1))
+
+dict_mapper = ObjectMapper.for_dict(TestClassSomePropertyEmptyInit2(some_property="", unmapped_property2="")) \
+    .value_converters({"some_property": (to_upper, to_lower)}) \
+    .left_initializers({"unmapped_property2": init_unmapped})
+
+
+def load_module(source_code):
+    namespace = {}
+    exec(compile(source_code, "<generated>", "exec"), namespace)
+    return namespace
+
+
+class CodegenTest(unittest.TestCase):
+
+    def test_generated_functions_should_map_like_mapper(self):
+        # given
+        source_code = generate_module([object_mapper])
+        generated = load_module(source_code)
+        source = TestClassSomePropertyEmptyInit1(
+            some_property=Status.inactive, some_property_02=datetime(2024, 1, 2, 3, 4, 5),
+            some_property_03=TestClassSomePropertyEmptyInit2(some_property="nested"))
+
+        # when
+        mapped_object = generated["map_TestClassSomePropertyEmptyInit1_to_TestClassMappedPropertyEmptyInit"](source)
+        mapped_object_rev = \
+            generated["map_TestClassMappedPropertyEmptyInit_to_TestClassSomePropertyEmptyInit1"](mapped_object)
+
+        # then
+        expected_object = object_mapper.map(source)
+        assert_that(mapped_object).is_type_of(TestClassMappedPropertyEmptyInit)
+        assert_that(mapped_object.mapped_property).is_equal_to("inactive")
+        assert_that(mapped_object.mapped_property_02).is_equal_to("2024-01-02T03:04:05")
+        assert_that(mapped_object.mapped_property_03).is_type_of(TestClassSomePropertyEmptyInit1)
+        assert_that(mapped_object.mapped_property_03.some_property).is_equal_to("nested")
+        assert_that(mapped_object.mapped_property_03.__dict__).is_equal_to(expected_object.mapped_property_03.__dict__)
+
+        assert_that(mapped_object_rev.some_property).is_equal_to(Status.inactive)
+        assert_that(mapped_object_rev.some_property_02).is_equal_to(datetime(2024, 1, 2, 3, 4, 5))
+        assert_that(source_code).contains("from mapperpy.conversions import parse_datetime")
+        assert_that(mapped_object_rev.some_property_03).is_type_of(TestClassSomePropertyEmptyInit2)
+
+    def test_generated_functions_should_apply_converters_and_initializers(self):
+        # given
+        source_code = generate_module([dict_mapper])
+        generated = load_module(source_code)
+
+        # when
+        mapped_dict = generated["map_TestClassSomePropertyEmptyInit2_to_dict"](
+            TestClassSomePropertyEmptyInit2(some_property="value", unmapped_property2="unmapped"))
+        mapped_object = generated["map_dict_to_TestClassSomePropertyEmptyInit2"](mapped_dict)
+
+        # then
+        assert_that(source_code).contains("from mapperpy.test.test_codegen import init_unmapped, to_lower, to_upper")
+        assert_that(mapped_dict).is_equal_to({
+            "some_property": "VALUE", "some_property_02": None, "some_property_03": None,
+            "unmapped_property2": "unmapped"})
+        assert_that(mapped_object.some_property).is_equal_to("value")
+        assert_that(mapped_object.unmapped_property2).is_equal_to("initialized_VALUE")
+
+    def test_generate_module_should_fail_for_converter_without_import_path(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2) \
+            .value_converters({"some_property": (lambda val: val, lambda val: val)})
+
+        # when
+        with self.assertRaises(ConfigurationException) as context:
+            generate_module([mapper])
+
+        # then
+        assert_that(context.exception.message).contains("can't be referenced by import path")
+
+    def test_find_mappers_should_return_module_level_object_mappers(self):
+        # when
+        mappers = find_mappers(__import__("mapperpy.test.test_codegen", fromlist=["test_codegen"]))
+
+        # then
+        assert_that(mappers).is_equal_to([dict_mapper, object_mapper])
+
+    def test_main_should_write_generated_module(self):
+        # given
+        temp_dir = tempfile.mkdtemp()
+        output_path = os.path.join(temp_dir, "generated_mappers.py")
+
+        try:
+            # when
+            exit_code = main(["mapperpy.test.test_codegen", "-o", output_path])
+
+            # then
+            assert_that(exit_code).is_equal_to(0)
+            with open(output_path) as output_file:
+                generated = load_module(output_file.read())
+            assert_that(generated).contains_key("map_dict_to_TestClassSomePropertyEmptyInit2",
+                                                "map_TestClassSomePropertyEmptyInit2_to_TestClassSomePropertyEmptyInit1")
+        finally:
+            shutil.rmtree(temp_dir)
@@ -0,0 +1,108 @@
+import unittest
+from array import array
+
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, enable_stats, disable_stats
+from mapperpy.object_mapper import MappingDirection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ColumnsMappingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = OneWayMapper.for_target_prototype(
+            TestClassSomePropertyEmptyInit2(some_property=SomeEnum.some_enum_01, some_property_02=0))
+
+    def tearDown(self):
+        disable_stats()
+
+    def test_map_from_columns_should_map_column_dict(self):
+        # given
+        columns = {"some_property": array("i", [1, 2, 1]), "some_property_02": [10, 20, 30],
+                   "unmapped_property1": ["x", "y", "z"]}
+
+        # when
+        mapped_objects = list(self.mapper.map_from_columns(columns))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02, SomeEnum.some_enum_01])
+        assert_that([obj.some_property_02 for obj in mapped_objects]).is_equal_to([10, 20, 30])
+        assert_that([obj.unmapped_property2 for obj in mapped_objects]).is_equal_to([None, None, None])
+
+    def test_map_from_columns_should_convert_columns_and_apply_initializers(self):
+        # given
+        enable_stats()
+        mapper = self.mapper.target_initializers({"unmapped_property2": lambda row: row["some_property_02"] * 2})
+
+        # when
+        mapped_objects = list(mapper.map_from_columns(
+            {"some_property": [1, 2, None, 2, 1, 1], "some_property_02": [1, 2, 3, 4, 5, 6]}))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02, None, SomeEnum.some_enum_02, SomeEnum.some_enum_01,
+             SomeEnum.some_enum_01])
+        assert_that([obj.unmapped_property2 for obj in mapped_objects]).is_equal_to([2, 4, 6, 8, 10, 12])
+        assert_that(mapper.stats()["maps"]).is_equal_to(6)
+        assert_that(mapper.stats()["conversions"]["enum"]).is_equal_to(5)
+
+    def test_map_from_columns_should_count_only_converted_values(self):
+        # given
+        enable_stats()
+
+        # when
+        mapped_objects = list(self.mapper.map_from_columns({"some_property": [
+            SomeEnum.some_enum_01, SomeEnum.some_enum_02, 2, SomeEnum.some_enum_01, 2, SomeEnum.some_enum_01]}))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02, SomeEnum.some_enum_02, SomeEnum.some_enum_01,
+             SomeEnum.some_enum_02, SomeEnum.some_enum_01])
+        assert_that(self.mapper.stats()["conversions"]["enum"]).is_equal_to(2)
+
+    def test_map_from_columns_should_fail_for_columns_of_different_length(self):
+        with self.assertRaises(ValueError):
+            self.mapper.map_from_columns({"some_property": [1, 2], "some_property_02": [1]})
+
+    def test_object_mapper_should_map_columns_in_given_direction(self):
+        # given
+        mapper = ObjectMapper.from_prototype(
+            TestClassSomePropertyEmptyInit1(some_property=1),
+            TestClassSomePropertyEmptyInit2(some_property=SomeEnum.some_enum_01))
+
+        # when
+        mapped_right = list(mapper.map_from_columns({"some_property": [2]}, MappingDirection.left_to_right))
+        mapped_left = list(mapper.map_from_columns(
+            {"some_property": [SomeEnum.some_enum_02]}, MappingDirection.right_to_left))
+
+        # then
+        assert_that(mapped_right[0].some_property).is_equal_to(SomeEnum.some_enum_02)
+        assert_that(mapped_left[0].some_property).is_equal_to(2)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_map_from_columns_should_map_structured_array(self):
+        # given
+        columns = numpy.array([(1, 1.5), (2, 2.5)], dtype=[("some_property", "i4"), ("some_property_02", "f8")])
+
+        # when
+        mapped_objects = list(self.mapper.map_from_columns(columns))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02])
+        assert_that([obj.some_property_02 for obj in mapped_objects]).is_equal_to([1.5, 2.5])
+        assert_that(type(mapped_objects[0].some_property_02)).is_equal_to(float)
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
@@ -0,0 +1,81 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, LRU, batched
+from mapperpy.object_mapper import MappingDirection
+from mapperpy.converter_cache import CachedConverter
+
+
+class ConverterCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def to_upper(self, value):
+        self.calls.append(value)
+        return value.upper()
+
+    def test_cached_converter_should_memoize_recently_used_values(self):
+        # given
+        converter = CachedConverter(self.to_upper, 2)
+
+        # when
+        results = [converter(value) for value in ["a", "b", "a", "c", "b", "a"]]
+
+        # then
+        assert_that(results).is_equal_to(["A", "B", "A", "C", "B", "A"])
+        # "b" was evicted by "c" as least recently used, then "b" evicted "a"
+        assert_that(self.calls).is_equal_to(["a", "b", "c", "b", "a"])
+        assert_that(converter.cache_info()).is_equal_to((1, 5, 2, 2, 1.0 / 6))
+
+    def test_cached_converter_should_convert_unhashable_and_distinguish_types(self):
+        # given
+        converter = CachedConverter(lambda value: repr(value), 10)
+
+        # when
+        results = [converter(value) for value in [1, True, 1, [1]]]
+
+        # then
+        assert_that(results).is_equal_to(["1", "True", "1", "[1]"])
+        assert_that([converter.hits, converter.misses]).is_equal_to([1, 2])
+
+    def test_one_way_mapper_should_use_cached_converters(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).target_value_converters(
+            {"some_property": self.to_upper}, cache=LRU(100))
+
+        # when
+        mapped_objects = list(mapper.map_many(
+            [TestClassSomePropertyEmptyInit1(some_property=value) for value in ["pl", "de", "pl", "pl"]]))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(["PL", "DE", "PL", "PL"])
+        assert_that(self.calls).is_equal_to(["pl", "de"])
+        assert_that(mapper.converter_cache_info()["some_property"].hit_rate).is_equal_to(0.5)
+        assert_that(mapper.stats()["converter_cache_hits"]).is_equal_to(2)
+        assert_that(mapper.stats()["converter_cache_misses"]).is_equal_to(2)
+
+    def test_object_mapper_should_cache_converters_in_both_directions(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2) \
+            .value_converters({"some_property": (self.to_upper, lambda value: value.lower())}, cache=LRU(10))
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1(some_property="pl"))
+        mapper.map(TestClassSomePropertyEmptyInit1(some_property="pl"))
+        mapper.map(TestClassSomePropertyEmptyInit2(some_property="PL"))
+
+        # then
+        assert_that(self.calls).is_equal_to(["pl"])
+        assert_that(mapper.converter_cache_info(MappingDirection.left_to_right)["some_property"].hits).is_equal_to(1)
+        assert_that(mapper.converter_cache_info(MappingDirection.right_to_left)["some_property"].misses).is_equal_to(1)
+        assert_that(mapper.stats()["converter_cache_hits"]).is_equal_to(1)
+
+    def test_lru_should_reject_invalid_size_and_batch_converters(self):
+        with self.assertRaises(ValueError):
+            LRU(0)
+
+        with self.assertRaises(ValueError):
+            LRU(10).wrap(batched(lambda values: values))
@@ -1,9 +1,10 @@
 import unittest
 from assertpy import assert_that
+from enum import Enum
 
 from mapperpy.test.common_test_classes import *
 
-from mapperpy import ObjectMapper, ConfigurationException
+from mapperpy import ObjectMapper, OneWayMapper, MapperOptions, ConfigurationException
 
 __author__ = 'lgrech'
 
@@ -310,3 +311,84 @@ class ObjectMapperDictMappingTest(unittest.TestCase):
         assert_that(mapped_object_rev.some_property_02).is_equal_to("some_value_02")
         assert_that(mapped_object_rev.some_property_03).is_equal_to("some_value_03")
         assert_that(mapped_object_rev.unmapped_property1).is_none()
+
+    def test_map_dict_to_dict_with_renamed_keys(self):
+        # given
+        mapper = ObjectMapper.from_class(dict, dict).custom_mappings(
+            {"some_property": "mapped_property", "some_property_02": None})
+
+        # when
+        mapped_object = mapper.map({"some_property": "some_value", "some_property_02": "some_value_02"})
+
+        # then
+        assert_that(mapped_object).is_equal_to({"mapped_property": "some_value"})
+
+    def test_map_dict_to_dict_when_explicit_key_missing_should_raise_exception(self):
+        # given
+        mapper = ObjectMapper.from_class(dict, dict).custom_mappings({"some_property": "mapped_property"})
+
+        # when
+        with self.assertRaises(KeyError):
+            mapper.map({"some_property_02": "some_value_02"})
+
+    def test_map_dict_to_dict_when_explicit_key_missing_and_fail_on_get_attr_disabled(self):
+        # given
+        mapper = ObjectMapper.from_class(dict, dict).custom_mappings({"some_property": "mapped_property"}).\
+            options(MapperOptions.fail_on_get_attr == False)
+
+        # when
+        mapped_object = mapper.map({"some_property_02": "some_value_02"})
+
+        # then
+        assert_that(mapped_object).is_equal_to({"mapped_property": None})
+
+    def test_map_dict_to_dict_identity_should_return_filtered_copy(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"some_property": None, "some_property_02": None})
+        source = {"some_property": "some_value", "some_property_02": "some_value_02"}
+
+        # when
+        mapped_object = mapper.map(source)
+        mapped_object_subset = mapper.map({"some_property": "some_value", "unknown": "unknown_value"})
+
+        # then
+        assert_that(mapped_object).is_equal_to(source)
+        assert_that(mapped_object).is_not_same_as(source)
+        assert_that(mapped_object_subset).is_equal_to({"some_property": "some_value"})
+
+    def test_map_dict_to_dict_should_apply_converters_and_initializers(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype(
+            {"some_property": None, "some_property_02": "", "mapped_property": None}).\
+            custom_mappings({"some_property_03": "mapped_property"}).\
+            target_value_converters({"some_property": lambda val: val.upper()}).\
+            target_initializers({"initialized_property": lambda obj: len(obj)})
+
+        # when
+        mapped_object = mapper.map({"some_property": "some_value",
+                                    "some_property_02": SomeEnum.some_enum_01,
+                                    "some_property_03": "some_value_03"})
+
+        # then
+        assert_that(mapped_object).is_equal_to({"some_property": "SOME_VALUE",
+                                                "some_property_02": "some_enum_01",
+                                                "mapped_property": "some_value_03",
+                                                "initialized_property": 3})
+
+    def test_map_dict_to_dict_should_use_mappings_added_after_first_map(self):
+        # given
+        mapper = ObjectMapper.from_class(dict, dict).custom_mappings({"some_property": "mapped_property"})
+        mapper.map({"some_property": "some_value"})
+
+        # when
+        mapper.custom_mappings({"some_property_02": "mapped_property_02"})
+        mapped_object = mapper.map({"some_property": "some_value", "some_property_02": "some_value_02"})
+
+        # then
+        assert_that(mapped_object).is_equal_to({"mapped_property": "some_value",
+                                                "mapped_property_02": "some_value_02"})
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
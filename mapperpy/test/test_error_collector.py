@@ -0,0 +1,97 @@
+import pickle
+import unittest
+from datetime import datetime
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, ErrorCollector, TooManyErrorsException
+
+
+class ErrorCollectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = OneWayMapper.for_target_prototype(TestClassSomePropertyEmptyInit2(some_property=datetime.now()))
+        self.objs = [TestClassSomePropertyEmptyInit1(some_property="2024-01-02T03:04:05"),
+                     TestClassSomePropertyEmptyInit1(some_property="not a date"),
+                     TestClassSomePropertyEmptyInit1(some_property="2024-01-03T03:04:05"),
+                     TestClassSomePropertyEmptyInit1(some_property="also not a date")]
+
+    def test_map_many_should_skip_and_report_failed_objects(self):
+        # given
+        errors = ErrorCollector()
+
+        # when
+        mapped_objects = list(self.mapper.map_many(self.objs, errors=errors))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [datetime(2024, 1, 2, 3, 4, 5), datetime(2024, 1, 3, 3, 4, 5)])
+        assert_that(len(errors)).is_equal_to(2)
+        assert_that(errors.indexes).is_equal_to([1, 3])
+        assert_that(errors.select_failed(self.objs)).is_equal_to([self.objs[1], self.objs[3]])
+
+        error = errors.errors[0]
+        assert_that(error.attribute).is_equal_to("some_property")
+        assert_that(error.cause).is_instance_of(ValueError)
+        assert_that(error.message).starts_with("Record 1: could not map attribute some_property. ValueError: ")
+
+    def test_map_many_should_raise_when_max_errors_exceeded(self):
+        # given
+        errors = ErrorCollector(max_errors=1)
+
+        # when
+        with self.assertRaises(TooManyErrorsException) as context:
+            list(self.mapper.map_many(self.objs, errors=errors))
+
+        # then
+        assert_that(context.exception.errors).is_length(2)
+        assert_that(context.exception.message).starts_with("Mapping aborted after 2 errors. First error: Record 1")
+        assert_that(str(pickle.loads(pickle.dumps(context.exception, pickle.HIGHEST_PROTOCOL)))).is_equal_to(
+            str(context.exception))
+
+    def test_map_many_should_report_target_initialization_error(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomeProperty1).custom_mappings(
+            {"other_property": "unknown_property"})
+        errors = ErrorCollector()
+
+        # when
+        mapped_objects = list(mapper.map_many([{}, {"other_property": 1}], errors=errors))
+
+        # then
+        assert_that(mapped_objects).is_length(0)
+        assert_that(errors.indexes).is_equal_to([0, 1])
+        assert_that(errors.errors[0].attribute).is_equal_to("other_property")
+        assert_that(errors.errors[0].cause).is_instance_of(KeyError)
+        assert_that(errors.errors[1].attribute).is_none()
+        assert_that(errors.errors[1].cause).is_instance_of(TypeError)
+        assert_that(errors.errors[1].message).starts_with(
+            "Record 1: error when initializing class TestClassSomeProperty1 with params: {'unknown_property': 1}")
+
+    def test_map_many_as_batch_should_skip_failed_objects(self):
+        # given
+        errors = ErrorCollector()
+
+        # when
+        batch = self.mapper.map_many(self.objs, as_batch=True, errors=errors)
+
+        # then
+        assert_that(batch).is_length(2)
+        assert_that(batch[1].some_property).is_equal_to(datetime(2024, 1, 3, 3, 4, 5))
+        assert_that(errors.indexes).is_equal_to([1, 3])
+
+    def test_object_mapper_map_many_should_report_unsupported_objects(self):
+        # given
+        mapper = ObjectMapper.from_prototype(TestClassSomePropertyEmptyInit1(),
+                                             TestClassSomePropertyEmptyInit2(some_property=datetime.now()))
+        errors = ErrorCollector()
+
+        # when
+        mapped_objects = list(mapper.map_many(self.objs[:2] + [TestEmptyClass1()], errors=errors))
+
+        # then
+        assert_that(mapped_objects).is_length(1)
+        assert_that(errors.indexes).is_equal_to([1, 2])
+        assert_that(errors.errors[1].message).is_equal_to(
+            "Record 2: ValueError: This mapper does not support TestEmptyClass1 class")
@@ -0,0 +1,108 @@
+import json
+import pickle
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import MapperSpec, ObjectMapper
+from mapperpy.mapper_spec import import_object
+
+TEST_CLASSES = "mapperpy.test.common_test_classes"
+THIS_MODULE = "mapperpy.test.test_mapper_spec"
+
+
+def to_upper(value):
+    return value.upper() if value else value
+
+
+def to_lower(value):
+    return value.lower() if value else value
+
+
+def init_unmapped(obj):
+    return "initialized_{}".format(obj.some_property)
+
+
+def create_right_prototype():
+    return TestClassMappedPropertyEmptyInit(mapped_property="")
+
+
+class MapperSpecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = MapperSpec(
+            left=TEST_CLASSES + ".TestClassSomePropertyEmptyInit1",
+            right=TEST_CLASSES + ".TestClassMappedPropertyEmptyInit",
+            mappings={"some_property": "mapped_property", "some_property_02": "mapped_property_02",
+                      "some_property_03": "mapped_property_03"},
+            right_initializers={"unmapped_property2": THIS_MODULE + ".init_unmapped"},
+            value_converters={"some_property_02": (THIS_MODULE + ".to_upper", THIS_MODULE + ":to_lower")},
+            options={"fail_on_get_attr": False},
+            nested=[MapperSpec(TEST_CLASSES + ".TestClassSomeProperty1",
+                               TEST_CLASSES + ".TestClassSomePropertyEmptyInit2")])
+
+    def test_import_object(self):
+        assert_that(import_object(TEST_CLASSES + ".TestEmptyClass1")).is_equal_to(TestEmptyClass1)
+        assert_that(import_object(TEST_CLASSES + ":TestEmptyClass1")).is_equal_to(TestEmptyClass1)
+        assert_that(import_object("dict")).is_equal_to(dict)
+
+        with self.assertRaises(ImportError):
+            import_object(TEST_CLASSES + ".Unknown")
+
+    def test_build_should_configure_object_mapper(self):
+        # when
+        mapper = self.spec.build()
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(
+            some_property="value", some_property_02="value_02",
+            some_property_03=TestClassSomeProperty1(some_property="nested")))
+        mapped_object_rev = mapper.map(TestClassMappedPropertyEmptyInit(mapped_property_02="VALUE_02"))
+
+        # then
+        assert_that(mapper).is_instance_of(ObjectMapper)
+        assert_that(mapped_object.mapped_property).is_equal_to("value")
+        assert_that(mapped_object.mapped_property_02).is_equal_to("VALUE_02")
+        assert_that(mapped_object.unmapped_property2).is_equal_to("initialized_value")
+        assert_that(mapped_object.mapped_property_03).is_instance_of(TestClassSomePropertyEmptyInit2)
+        assert_that(mapped_object_rev.some_property_02).is_equal_to("value_02")
+
+    def test_build_from_prototype(self):
+        # given
+        spec = MapperSpec(TEST_CLASSES + ".TestClassSomePropertyEmptyInit1",
+                          TEST_CLASSES + ".TestClassMappedPropertyEmptyInit",
+                          mappings={"some_property": "mapped_property"},
+                          right_prototype=THIS_MODULE + ".create_right_prototype")
+
+        # when
+        mapped_object = spec().map(TestClassSomePropertyEmptyInit1(some_property=7))
+
+        # then
+        assert_that(mapped_object.mapped_property).is_equal_to(7)
+
+    def test_build_when_unknown_option_should_raise_exception(self):
+        # given
+        spec = MapperSpec("dict", "dict", options={"unknown_option": True})
+
+        # when
+        with self.assertRaises(ValueError) as context:
+            spec.build()
+
+        # then
+        assert_that(context.exception.message).contains("unknown_option")
+
+    def test_spec_should_be_picklable(self):
+        # when
+        unpickled = pickle.loads(pickle.dumps(self.spec, pickle.HIGHEST_PROTOCOL))
+
+        # then
+        assert_that(unpickled).is_equal_to(self.spec)
+        assert_that(unpickled.build().map(TestClassSomePropertyEmptyInit1(some_property="value")).mapped_property).\
+            is_equal_to("value")
+
+    def test_spec_dict_round_trip(self):
+        # when
+        spec = MapperSpec.from_dict(json.loads(json.dumps(self.spec.to_dict())))
+
+        # then
+        assert_that(spec).is_equal_to(self.spec)
+        assert_that(spec.nested[0].left).is_equal_to(TEST_CLASSES + ".TestClassSomeProperty1")
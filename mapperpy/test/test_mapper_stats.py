@@ -0,0 +1,128 @@
+import threading
+import unittest
+from datetime import datetime
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, MapperOptions, enable_stats, disable_stats, mapper_stats
+from mapperpy.mapper_stats import MapperStats
+
+
+class MapperStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        enable_stats()
+
+    def tearDown(self):
+        disable_stats()
+
+    def test_stats_when_disabled_should_not_count(self):
+        # given
+        disable_stats()
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2)
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+
+        # then
+        assert_that(mapper.stats()["maps"]).is_equal_to(0)
+        assert_that(mapper.stats()["time_spent"]).is_equal_to(0)
+
+    def test_stats_should_count_maps_and_cache_usage(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2)
+
+        # when
+        for _ in range(3):
+            mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+
+        # then
+        stats = mapper.stats()
+        assert_that(stats["maps"]).is_equal_to(3)
+        assert_that(stats["time_spent"]).is_greater_than(0)
+        assert_that(stats["attr_cache_misses"]).is_equal_to(1)
+        assert_that(stats["attr_cache_hits"]).is_equal_to(2)
+
+    def test_stats_should_count_conversions_per_kind(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype(
+            TestClassSomePropertyEmptyInit2(some_property=1, some_property_02="", some_property_03=None)).\
+            nested_mapper(OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2), TestClassSomeProperty1).\
+            target_value_converters({"unmapped_property1": lambda val: val}).\
+            custom_mappings({"unmapped_property1": "unmapped_property2"})
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1(
+            some_property=SomeEnum.some_enum_01,
+            some_property_02=datetime(2016, 5, 17),
+            some_property_03=TestClassSomeProperty1(some_property="nested"),
+            unmapped_property1="converted"))
+
+        # then
+        assert_that(mapper.stats()["conversions"]).is_equal_to(
+            {"enum": 1, "datetime": 1, "custom_converter": 1, "nested_mapper": 1})
+
+    def test_stats_should_count_fail_on_get_attr_fallbacks(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).\
+            custom_mappings({"unknown": "mapped_property"}).options(MapperOptions.fail_on_get_attr == False)
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1())
+
+        # then
+        assert_that(mapper.stats()["fail_on_get_attr_fallbacks"]).is_equal_to(1)
+
+    def test_stats_should_merge_counters_from_all_threads(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2)
+
+        def map_objects():
+            for _ in range(10):
+                mapper.map({"some_property": "some_value"})
+
+        threads = [threading.Thread(target=map_objects) for _ in range(4)]
+
+        # when
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        assert_that(mapper.stats()["maps"]).is_equal_to(40)
+
+    def test_stats_should_keep_counters_of_finished_threads_in_totals(self):
+        # given
+        stats = MapperStats()
+        for _ in range(5):
+            thread = threading.Thread(target=lambda: stats.count(mapper_stats.MAPS, 2))
+            thread.start()
+            thread.join()
+
+        # when
+        stats.count(mapper_stats.MAPS)
+
+        # then
+        assert_that(stats.snapshot()["maps"]).is_equal_to(11)
+        assert_that(stats.threads_count).is_equal_to(1)
+
+    def test_object_mapper_stats_should_merge_both_directions(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2)
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+        mapper.map(TestClassSomePropertyEmptyInit2(some_property="some_value"))
+        mapper.map(TestClassSomePropertyEmptyInit2(some_property="some_value"))
+
+        # then
+        assert_that(mapper.stats()["maps"]).is_equal_to(3)
+        assert_that(mapper.stats()["conversions"]["enum"]).is_equal_to(0)
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
@@ -590,3 +590,75 @@ class ObjectMapperTest(unittest.TestCase):
 
         # then
         assert_that(mapped_value).is_equal_to("some_value")
+
+    def test_translate_should_map_names_and_values(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassMappedPropertyEmptyInit).\
+            custom_mappings({"some_property": "mapped_property", "some_property_02": "mapped_property_02"}).\
+            value_converters({"some_property_02": (lambda val: val.upper(), lambda val: val.lower())})
+
+        # when
+        translated = mapper.translate({"some_property": "value", "some_property_02": "value_02"},
+                                      MappingDirection.left_to_right)
+        translated_rev = mapper.translate({"mapped_property_02": "VALUE_02"}, MappingDirection.right_to_left)
+        translated_names = mapper.translate({"some_property_02": "value_02"}, MappingDirection.left_to_right,
+                                            map_values=False)
+
+        # then
+        assert_that(translated).is_equal_to({"mapped_property": "value", "mapped_property_02": "VALUE_02"})
+        assert_that(translated_rev).is_equal_to({"some_property_02": "value_02"})
+        assert_that(translated_names).is_equal_to({"mapped_property_02": "value_02"})
+
+    def test_translate_should_report_all_unknown_names(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassMappedPropertyEmptyInit).\
+            custom_mappings({"some_property": "mapped_property"})
+
+        # when
+        with self.assertRaises(ValueError) as context:
+            mapper.translate({"some_property": 1, "unknown_2": 2, "mapped_property": 3, "unknown_1": 4},
+                             MappingDirection.left_to_right)
+
+        # then
+        assert_that(context.exception.message).is_equal_to(
+            "Can't find mapping for attribute names: mapped_property, unknown_1, unknown_2, direction: {}".format(
+                MappingDirection.left_to_right))
+
+    def test_translate_names_should_keep_order(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassMappedPropertyEmptyInit).\
+            custom_mappings({"some_property": "mapped_property", "some_property_02": "mapped_property_02"})
+
+        # when
+        translated = mapper.translate_names(["mapped_property_02", "mapped_property"], MappingDirection.right_to_left)
+
+        # then
+        assert_that(translated).is_equal_to(["some_property_02", "some_property"])
+
+    def test_map_attr_name_should_use_updated_mappings(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassMappedPropertyEmptyInit)
+        with self.assertRaises(ValueError):
+            mapper.map_attr_name("some_property")
+
+        # when
+        mapper.custom_mappings({"some_property": "mapped_property"})
+
+        # then
+        assert_that(mapper.map_attr_name("some_property")).is_equal_to("mapped_property")
+
+    def test_translate_names_should_use_mappings_of_directly_configured_one_way_mappers(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassMappedPropertyEmptyInit)
+        with self.assertRaises(ValueError):
+            mapper.translate_names(["some_property"], MappingDirection.left_to_right)
+
+        # when
+        mapper.from_left_mapper.custom_mappings({"some_property": "mapped_property"})
+        mapper.from_right_mapper.custom_mappings({"mapped_property": "some_property"})
+
+        # then
+        assert_that(mapper.translate_names(["some_property"], MappingDirection.left_to_right)).is_equal_to(
+            ["mapped_property"])
+        assert_that(mapper.translate({"mapped_property": "value"}, MappingDirection.right_to_left)).is_equal_to(
+            {"some_property": "value"})
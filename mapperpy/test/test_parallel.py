@@ -0,0 +1,184 @@
+import os
+import shutil
+from datetime import datetime
+import tempfile
+import unittest
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, MapperOptions, RecordMappingException, TrustedInputException, map_file_parallel
+from mapperpy.parallel import split_file, CSV
+from mapperpy.shared_columns import SHARED_MEMORY_DIR, export_batch, import_batch
+
+
+def create_batch_mapper():
+    return OneWayMapper.for_target_prototype(TestClassSomePropertyEmptyInit2(
+        some_property=SomeEnum.some_enum_01, some_property_02=datetime.now(), some_property_03=0))
+
+
+def create_mapper():
+    return OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).custom_mappings(
+        {"some_property": "mapped_property"})
+
+
+class UnpicklableError(Exception):
+
+    def __init__(self, code, details):
+        super(UnpicklableError, self).__init__("Failed with code {}: {}".format(code, details))
+
+
+def fail_on_value(value):
+    if value == "invalid":
+        raise UnpicklableError(1, value)
+    return value
+
+
+def create_failing_mapper():
+    return create_mapper().target_value_converters({"some_property": fail_on_value})
+
+
+def create_trusted_mapper():
+    return create_mapper().options(MapperOptions.trusted_input == True)
+
+
+class MapFileParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def __write_file(self, content):
+        path = os.path.join(self.temp_dir, "input")
+        with open(path, "wb") as input_file:
+            input_file.write(content)
+        return path
+
+    def test_split_file_should_align_ranges_to_lines(self):
+        # given
+        path = self.__write_file(b"header\nline_1\nline_2\nline_3\nlast")
+
+        # when
+        ranges = split_file(path, 3, skip_header=True)
+
+        # then
+        assert_that(ranges[0][0]).is_equal_to(len(b"header\n"))
+        assert_that(ranges[-1][1]).is_equal_to(len(b"header\nline_1\nline_2\nline_3\nlast"))
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert_that(end).is_equal_to(next_start)
+        with open(path, "rb") as input_file:
+            content = input_file.read()
+        for start, _ in ranges:
+            assert_that(content[start - 1:start]).is_equal_to(b"\n")
+
+    def test_split_empty_file(self):
+        assert_that(split_file(self.__write_file(b""), 4)).is_empty()
+
+    def test_map_jsonl_file_should_keep_input_order(self):
+        # given
+        path = self.__write_file(b"".join(
+            '{{"some_property": "value_{}"}}\n'.format(idx).encode("ascii") for idx in range(50)))
+
+        # when
+        mapped_objects = map_file_parallel(path, create_mapper, processes=2, chunks=7)
+
+        # then
+        assert_that([obj.mapped_property for obj in mapped_objects]).is_equal_to(
+            ["value_{}".format(idx) for idx in range(50)])
+
+    def test_map_csv_file_to_sink(self):
+        # given
+        path = self.__write_file(b"some_property,mapped_property_02\n" + b"".join(
+            "value_{},other\n".format(idx).encode("ascii") for idx in range(20)))
+        chunks = []
+
+        # when
+        records_count = map_file_parallel(path, create_mapper, input_format=CSV, processes=2, chunks=3,
+                                          sink=chunks.append)
+
+        # then
+        assert_that(records_count).is_equal_to(20)
+        mapped_objects = [obj for chunk in chunks for obj in chunk]
+        assert_that([obj.mapped_property for obj in mapped_objects]).is_equal_to(
+            ["value_{}".format(idx) for idx in range(20)])
+        assert_that(mapped_objects[0].mapped_property_02).is_equal_to("other")
+
+    def test_map_file_when_record_malformed_should_raise_exception_with_offset(self):
+        # given
+        path = self.__write_file(b'{"some_property": "value_1"}\n{"some_property": \n{"some_property": "value_3"}\n')
+
+        # when
+        with self.assertRaises(RecordMappingException) as context:
+            map_file_parallel(path, create_mapper, processes=2)
+
+        # then
+        assert_that(context.exception.offset).is_equal_to(len(b'{"some_property": "value_1"}\n'))
+
+    def test_map_file_when_cause_not_picklable_should_raise_exception_with_its_description(self):
+        # given
+        path = self.__write_file(b'{"some_property": "value_1"}\n{"some_property": "invalid"}\n')
+
+        # when
+        with self.assertRaises(RecordMappingException) as context:
+            map_file_parallel(path, create_failing_mapper, processes=2, chunks=1)
+
+        # then
+        assert_that(context.exception.offset).is_equal_to(len(b'{"some_property": "value_1"}\n'))
+        assert_that(context.exception.cause).is_equal_to("UnpicklableError: Failed with code 1: invalid")
+        assert_that(context.exception.cause_traceback).contains("fail_on_value")
+
+    def test_map_file_when_trusted_input_check_fails_should_raise_exception_with_its_description(self):
+        # given
+        path = self.__write_file(
+            b'{"some_property": "value_1", "some_property_02": 1}\n{"some_property": "value_2"}\n')
+
+        # when
+        with self.assertRaises(RecordMappingException) as context:
+            map_file_parallel(path, create_trusted_mapper, processes=2, chunks=1)
+
+        # then
+        assert_that(context.exception.offset).is_equal_to(len(b'{"some_property": "value_1", "some_property_02": 1}\n'))
+        assert_that(context.exception.cause).starts_with(TrustedInputException.__name__).contains("some_property_02")
+
+    def test_map_file_into_record_batch(self):
+        # given
+        path = self.__write_file(b"".join(
+            '{{"some_property": "some_enum_0{}", "some_property_02": "2016-05-0{}T12:00:00", "some_property_03": {}, '
+            '"unmapped_property2": "value_{}"}}\n'.format(idx % 2 + 1, idx % 9 + 1, idx, idx).encode("ascii")
+            for idx in range(30)))
+        shared_dir = SHARED_MEMORY_DIR or tempfile.gettempdir()
+        shared_files = set(os.listdir(shared_dir))
+
+        # when
+        batch = map_file_parallel(path, create_batch_mapper, processes=2, chunks=4, as_batch=True)
+
+        # then
+        assert_that(len(batch)).is_equal_to(30)
+        assert_that([batch.column(attr_name).kind for attr_name in batch.attribute_names]).is_equal_to(
+            ["enum", "datetime", "int", "str"])
+        assert_that([row.some_property_03 for row in batch]).is_equal_to(list(range(30)))
+        assert_that(batch[3].some_property).is_equal_to(SomeEnum.some_enum_02)
+        assert_that(batch[3].some_property_02).is_equal_to(datetime(2016, 5, 4, 12))
+        assert_that(batch.to_objects()[29].unmapped_property2).is_equal_to("value_29")
+        assert_that(set(os.listdir(shared_dir)) - shared_files).is_empty()
+
+    def test_export_and_import_batch(self):
+        # given
+        batch = create_batch_mapper().map_many(
+            [{"some_property": "some_enum_01", "some_property_03": 1}, {"some_property_03": None}], as_batch=True)
+        path = os.path.join(self.temp_dir, "batch")
+
+        # when
+        exported_batch = export_batch(batch, path)
+        imported_batch = import_batch(exported_batch)
+
+        # then
+        assert_that(os.path.getsize(path)).is_greater_than(0)
+        assert_that([row._asdict() for row in imported_batch]).is_equal_to([row._asdict() for row in batch])
+        assert_that(imported_batch.target_class).is_equal_to(TestClassSomePropertyEmptyInit2)
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
@@ -0,0 +1,95 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, ErrorCollector
+
+
+class ProjectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2) \
+            .target_value_converters({"some_property_02": self.convert}) \
+            .target_initializers({"unmapped_property2": self.initialize})
+        self.obj = TestClassSomePropertyEmptyInit1(some_property="value", some_property_02="value_02",
+                                                   some_property_03="value_03")
+
+    def convert(self, value):
+        self.calls.append("convert")
+        return value.upper()
+
+    def initialize(self, obj):
+        self.calls.append("initialize")
+        return "initialized"
+
+    def test_map_should_map_only_requested_fields(self):
+        # when
+        mapped_object = self.mapper.map(self.obj, fields=["some_property", "unmapped_property2"])
+
+        # then
+        assert_that(mapped_object).is_type_of(TestClassSomePropertyEmptyInit2)
+        assert_that(mapped_object.some_property).is_equal_to("value")
+        assert_that(mapped_object.some_property_02).is_none()
+        assert_that(mapped_object.some_property_03).is_none()
+        assert_that(mapped_object.unmapped_property2).is_equal_to("initialized")
+        assert_that(self.calls).is_equal_to(["initialize"])
+
+    def test_map_attributes_should_return_requested_fields(self):
+        # when
+        mapped_attributes = self.mapper.map_attributes(self.obj, fields=["some_property_02"])
+
+        # then
+        assert_that(mapped_attributes).is_equal_to({"some_property_02": "VALUE_02"})
+        assert_that(self.calls).is_equal_to(["convert"])
+
+    def test_map_many_should_map_requested_fields(self):
+        # when
+        mapped_objects = list(self.mapper.map_many([self.obj, {"some_property": "dict_value"}],
+                                                   fields=["some_property"]))
+        batch = self.mapper.map_many([self.obj], as_batch=True, fields=["some_property_03"])
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(["value", "dict_value"])
+        assert_that(batch.attribute_names).is_equal_to(["some_property_03"])
+        assert_that(self.calls).is_empty()
+
+    def test_map_many_with_errors_should_map_requested_fields(self):
+        # given
+        errors = ErrorCollector()
+
+        # when
+        mapped_objects = list(self.mapper.map_many([self.obj, {"some_property_02": 1}], errors=errors,
+                                                   fields=["some_property_02"]))
+
+        # then
+        assert_that([obj.some_property_02 for obj in mapped_objects]).is_equal_to(["VALUE_02"])
+        assert_that(errors.indexes).is_equal_to([1])
+
+    def test_map_should_skip_nested_mapper_when_not_requested(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2) \
+            .nested_mapper(ObjectMapper.from_prototype(TestClassSomeProperty1(some_property=""),
+                                                      TestClassSomeProperty2(some_property="")))
+        obj = TestClassSomePropertyEmptyInit1(some_property="value",
+                                              some_property_02=TestClassSomeProperty1(some_property="nested"))
+
+        # when
+        mapped_object = mapper.map(obj, fields=["some_property"])
+        mapped_object_nested = mapper.map(obj, fields=["some_property_02"])
+        mapped_objects = list(mapper.map_many([obj], fields=["some_property_02"]))
+
+        # then
+        assert_that(mapped_object.some_property).is_equal_to("value")
+        assert_that(mapped_object.some_property_02).is_none()
+        assert_that(mapped_object_nested.some_property_02).is_type_of(TestClassSomeProperty2)
+        assert_that(mapped_objects[0].some_property_02.some_property).is_equal_to("nested")
+
+    def test_map_should_fail_for_unknown_fields(self):
+        # when
+        with self.assertRaises(ValueError) as context:
+            self.mapper.map(self.obj, fields=["some_property", "unknown_2", "unknown_1"])
+
+        # then
+        assert_that(context.exception.message).starts_with("Unknown fields requested: unknown_1, unknown_2.")
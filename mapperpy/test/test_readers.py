@@ -0,0 +1,184 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from io import BytesIO
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, MapperOptions, map_jsonl, map_csv
+from mapperpy.readers import iter_lines
+
+
+class IterLinesTest(unittest.TestCase):
+
+    def test_iter_lines_should_join_lines_split_between_blocks(self):
+        # given
+        fileobj = BytesIO(b"first line\nsecond line\n\nlast")
+
+        # when
+        lines = list(iter_lines(fileobj, buffer_size=4))
+
+        # then
+        assert_that(lines).is_equal_to([b"first line", b"second line", b"", b"last"])
+
+
+class MapJsonLinesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit1)
+
+    def test_map_jsonl_should_map_each_line(self):
+        # given
+        fileobj = BytesIO(b'{"some_property": "value_1"}\n'
+                          b'{"some_property": "value_2", "some_property_02": 2}\r\n'
+                          b'\n'
+                          b'{"some_property_03": "value_3"}')
+
+        # when
+        mapped_objects = list(map_jsonl(fileobj, self.mapper, buffer_size=8))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(["value_1", "value_2", None])
+        assert_that(mapped_objects[1].some_property_02).is_equal_to(2)
+        assert_that(mapped_objects[2].some_property_03).is_equal_to("value_3")
+
+    def test_map_jsonl_should_report_malformed_lines_and_continue(self):
+        # given
+        fileobj = BytesIO(b'{"some_property": "value_1"}\n'
+                          b'{"some_property": \n'
+                          b'[1, 2]\n'
+                          b'{"some_property": "value_4"}\n')
+        errors = []
+
+        # when
+        mapped_objects = list(map_jsonl(fileobj, self.mapper, on_error=errors.append))
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(["value_1", "value_4"])
+        assert_that([error.line_number for error in errors]).is_equal_to([2, 3])
+        assert_that(errors[1].error.message).contains("list")
+
+    def test_map_jsonl_should_be_lazy(self):
+        # given
+        fileobj = BytesIO(b'{"some_property": "value_1"}\n{"some_property": "value_2"}\n')
+
+        # when
+        mapped_objects = map_jsonl(fileobj, self.mapper, buffer_size=16)
+        first = next(mapped_objects)
+
+        # then
+        assert_that(first.some_property).is_equal_to("value_1")
+        assert_that(fileobj.tell()).is_less_than(len(fileobj.getvalue()))
+
+    def test_map_jsonl_from_path_with_object_mapper(self):
+        # given
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = os.path.join(temp_dir, "input.jsonl")
+        with open(path, "wb") as jsonl_file:
+            jsonl_file.write(b'{"some_property": "value_1"}\n{"some_property": "value_2"}\n')
+
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, dict)
+
+        # when
+        mapped_objects = list(map_jsonl(path, mapper))
+
+        # then
+        assert_that(mapped_objects).is_length(2)
+        assert_that(mapped_objects[0]).is_instance_of(TestClassSomePropertyEmptyInit1)
+        assert_that(mapped_objects[1].some_property).is_equal_to("value_2")
+
+
+class MapCsvTest(unittest.TestCase):
+
+    def test_map_csv_should_resolve_header_against_mapping(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).custom_mappings(
+            {"some_property": "mapped_property", "mapped_property_02": None})
+        lines = ["mapped_property_02,some_property,mapped_property_03",
+                 "ignored_1,value_1,value_1_03",
+                 "ignored_2,value_2"]
+
+        # when
+        mapped_objects = list(map_csv(lines, mapper))
+
+        # then
+        assert_that([obj.mapped_property for obj in mapped_objects]).is_equal_to(["value_1", "value_2"])
+        assert_that([obj.mapped_property_02 for obj in mapped_objects]).is_equal_to([None, None])
+        assert_that([obj.mapped_property_03 for obj in mapped_objects]).is_equal_to(["value_1_03", None])
+
+    def test_map_csv_should_convert_values_using_prototype_types(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype(
+            TestClassSomePropertyEmptyInit1(some_property=SomeEnum.some_enum_01, some_property_02=datetime.now()))
+        lines = ["some_property;some_property_02", "some_enum_02;2016-05-17T12:30:45"]
+
+        # when
+        mapped_objects = list(map_csv(lines, mapper, delimiter=";"))
+
+        # then
+        assert_that(mapped_objects[0].some_property).is_equal_to(SomeEnum.some_enum_02)
+        assert_that(mapped_objects[0].some_property_02).is_equal_to(datetime(2016, 5, 17, 12, 30, 45))
+
+    def test_map_csv_with_explicit_column_names_and_initializers(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit1).target_initializers(
+            {"unmapped_property1": lambda row: row["some_property"] + row["some_property_03"]})
+
+        # when
+        mapped_objects = list(map_csv(["a,b"], mapper, header=["some_property", "some_property_03"]))
+
+        # then
+        assert_that(mapped_objects[0].some_property).is_equal_to("a")
+        assert_that(mapped_objects[0].unmapped_property1).is_equal_to("ab")
+
+    def test_map_csv_when_explicitly_mapped_column_missing_should_raise_exception(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).custom_mappings(
+            {"some_property": "mapped_property"})
+
+        # when
+        with self.assertRaises(AttributeError) as context:
+            list(map_csv(["other_property", "value"], mapper))
+
+        # then
+        assert_that(context.exception.message).contains("some_property")
+
+    def test_map_csv_when_column_missing_and_fail_on_get_attr_disabled(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).custom_mappings(
+            {"some_property": "mapped_property"}).options(MapperOptions.fail_on_get_attr == False)
+
+        # when
+        mapped_objects = list(map_csv(["other_property", "value"], mapper))
+
+        # then
+        assert_that(mapped_objects[0].mapped_property).is_none()
+
+    def test_map_rows_without_creating_objects_should_return_attributes(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit).custom_mappings(
+            {"some_property": "mapped_property"})
+
+        # when
+        mapped_attributes = list(mapper.map_rows([["value_1", "x"], ["value_2"]], ["some_property", "other_property"],
+                                                 create_object=False))
+
+        # then
+        assert_that(mapped_attributes).is_equal_to([{"mapped_property": "value_1"}, {"mapped_property": "value_2"}])
+
+    def test_map_csv_without_column_names_should_raise_exception(self):
+        with self.assertRaises(ValueError):
+            map_csv([], OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit1), header=False)
+
+    def test_map_csv_for_empty_input(self):
+        assert_that(list(map_csv([], OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit1)))).is_empty()
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
@@ -0,0 +1,187 @@
+import unittest
+from datetime import datetime
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, RecordBatch
+from mapperpy.record_batch import Column
+
+
+class ColumnTest(unittest.TestCase):
+
+    def test_column_should_store_values_by_type(self):
+        # given
+        ints, floats, bools, strings, enums, mixed = Column(), Column(), Column(), Column(), Column(), Column()
+
+        # when
+        for value in [None, 1, 2, None]:
+            ints.append(value)
+        for value in [1.5, None]:
+            floats.append(value)
+        for value in [True, False]:
+            bools.append(value)
+        for value in ["abc", "ab" + "c", None]:
+            strings.append(value)
+        for value in [SomeEnum.some_enum_02, None, SomeEnum.some_enum_01]:
+            enums.append(value)
+        for value in [1, "abc", SomeEnum.some_enum_01]:
+            mixed.append(value)
+
+        # then
+        assert_that([ints.kind, floats.kind, bools.kind, strings.kind, enums.kind, mixed.kind]).is_equal_to(
+            ["int", "float", "bool", "str", "enum", "object"])
+        assert_that(list(ints)).is_equal_to([None, 1, 2, None])
+        assert_that(list(floats)).is_equal_to([1.5, None])
+        assert_that(list(bools)).is_equal_to([True, False])
+        assert_that(list(strings)).is_equal_to(["abc", "abc", None])
+        assert_that(strings[1]).is_same_as(strings[0])
+        assert_that(list(enums)).is_equal_to([SomeEnum.some_enum_02, None, SomeEnum.some_enum_01])
+        assert_that(list(mixed)).is_equal_to([1, "abc", SomeEnum.some_enum_01])
+
+    def test_column_should_switch_to_objects_on_int_overflow(self):
+        # given
+        column = Column()
+        column.append(1)
+
+        # when
+        column.append(2 ** 80)
+
+        # then
+        assert_that(column.kind).is_equal_to("object")
+        assert_that(list(column)).is_equal_to([1, 2 ** 80])
+
+    def test_column_should_store_naive_datetimes_as_microseconds(self):
+        # given
+        column = Column()
+
+        # when
+        for value in [datetime(2016, 5, 4, 12, 30, 15, 123456), None, datetime(1969, 12, 31, 23, 59, 59)]:
+            column.append(value)
+
+        # then
+        assert_that(column.kind).is_equal_to("datetime")
+        assert_that(list(column)).is_equal_to(
+            [datetime(2016, 5, 4, 12, 30, 15, 123456), None, datetime(1969, 12, 31, 23, 59, 59)])
+
+    def test_column_extend_and_storage(self):
+        # given
+        column, other, strings = Column(), Column(), Column()
+        for value in [1, None]:
+            column.append(value)
+        for value in [None, 3]:
+            other.append(value)
+        strings.append("value")
+
+        # when
+        column.extend(other)
+        restored = Column.from_storage(column.storage())
+        restored.extend(strings)
+
+        # then
+        assert_that(list(column)).is_equal_to([1, None, None, 3])
+        assert_that(column.storage().values.typecode).is_equal_to("l")
+        assert_that(restored.kind).is_equal_to("object")
+        assert_that(list(restored)).is_equal_to([1, None, None, 3, "value"])
+
+    def test_column_slice(self):
+        # given
+        column = Column()
+        for value in [1, None, 3, 4]:
+            column.append(value)
+
+        # when
+        sliced = column[1:]
+
+        # then
+        assert_that(list(sliced)).is_equal_to([None, 3, 4])
+        assert_that(column[-1]).is_equal_to(4)
+
+
+class RecordBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = OneWayMapper.for_target_prototype(TestClassSomePropertyEmptyInit2(some_property=1))
+        self.objects = [
+            TestClassSomePropertyEmptyInit1(some_property=SomeEnum.some_enum_01, some_property_02="value_1"),
+            TestClassSomePropertyEmptyInit1(some_property=SomeEnum.some_enum_02, some_property_03=3.5)]
+
+    def test_map_many_as_batch(self):
+        # when
+        batch = self.mapper.map_many(self.objects, as_batch=True)
+
+        # then
+        assert_that(batch).is_instance_of(RecordBatch)
+        assert_that(batch).is_length(2)
+        assert_that(batch.attribute_names).is_equal_to(["some_property", "some_property_02", "some_property_03"])
+        assert_that(batch.column("some_property").kind).is_equal_to("int")
+        assert_that([row.some_property for row in batch]).is_equal_to([1, 2])
+        assert_that(batch[1].some_property_02).is_none()
+        assert_that(batch[-1].some_property_03).is_equal_to(3.5)
+        assert_that(batch[0]._asdict()).is_equal_to(
+            {"some_property": 1, "some_property_02": "value_1", "some_property_03": None})
+
+    def test_batch_row_when_unknown_attribute_should_raise_exception(self):
+        # given
+        batch = self.mapper.map_many(self.objects, as_batch=True)
+
+        # when
+        with self.assertRaises(AttributeError):
+            batch[0].unknown
+
+        with self.assertRaises(IndexError):
+            batch[2]
+
+    def test_batch_slice_and_conversion_to_objects(self):
+        # given
+        batch = self.mapper.map_many(self.objects, as_batch=True)
+
+        # when
+        sliced = batch[1:]
+        mapped_objects = sliced.to_objects()
+
+        # then
+        assert_that(sliced).is_length(1)
+        assert_that(mapped_objects).is_length(1)
+        assert_that(mapped_objects[0]).is_instance_of(TestClassSomePropertyEmptyInit2)
+        assert_that(mapped_objects[0].some_property).is_equal_to(2)
+        assert_that(mapped_objects[0].some_property_03).is_equal_to(3.5)
+
+    def test_object_mapper_map_many_as_batch(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, dict).custom_mappings(
+            {"some_property": "mapped_property"})
+
+        # when
+        batch = mapper.map_many([{"mapped_property": "value_1"}, {"mapped_property": "value_2"}], as_batch=True)
+
+        # then
+        assert_that(batch.target_class).is_equal_to(TestClassSomePropertyEmptyInit1)
+        assert_that([row.some_property for row in batch]).is_equal_to(["value_1", "value_2"])
+
+        # when
+        with self.assertRaises(ValueError):
+            mapper.map_many([{"mapped_property": "value_1"}, TestClassSomePropertyEmptyInit1()], as_batch=True)
+
+
+class RecordBatchExtendTest(unittest.TestCase):
+
+    def test_extend_should_join_batches_with_different_attributes(self):
+        # given
+        batch, other = RecordBatch(TestClassSomePropertyEmptyInit1), RecordBatch(TestClassSomePropertyEmptyInit1)
+        batch.append({"some_property": 1})
+        other.append({"some_property": 2, "some_property_02": SomeEnum.some_enum_02})
+
+        # when
+        batch.extend(other)
+
+        # then
+        assert_that(len(batch)).is_equal_to(2)
+        assert_that([row.some_property for row in batch]).is_equal_to([1, 2])
+        assert_that([row.some_property_02 for row in batch]).is_equal_to([None, SomeEnum.some_enum_02])
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
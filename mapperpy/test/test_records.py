@@ -0,0 +1,125 @@
+import pickle
+import unittest
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper
+from mapperpy.records import record_type, Record, NAMEDTUPLE
+
+
+class RecordTypeTest(unittest.TestCase):
+
+    def test_slots_record_type(self):
+        # given
+        record_class = record_type("SomeRecord", ["some_property", "some_property_02"])
+
+        # when
+        record = record_class(some_property="some_value")
+
+        # then
+        assert_that(record).is_instance_of(Record)
+        assert_that(record.some_property).is_equal_to("some_value")
+        assert_that(record.some_property_02).is_none()
+        assert_that(hasattr(record, "__dict__")).is_false()
+        assert_that(pickle.loads(pickle.dumps(record, 0)).__getstate__()).is_equal_to(record.__getstate__())
+
+    def test_slots_record_when_unknown_attribute_should_raise_exception(self):
+        with self.assertRaises(TypeError) as context:
+            record_type("SomeRecord", ["some_property"])(other_property=1)
+
+        assert_that(context.exception.message).contains("other_property")
+
+    def test_record_type_when_invalid_field_should_raise_exception(self):
+        with self.assertRaises(ValueError) as context:
+            record_type("SomeRecord", ["some_property", "invalid property"])
+
+        assert_that(context.exception.message).contains("invalid property")
+
+    def test_namedtuple_record_type(self):
+        # when
+        record = record_type("SomeRecord", ["some_property", "some_property_02"], NAMEDTUPLE)(some_property=1)
+
+        # then
+        assert_that(record).is_equal_to((1, None))
+
+
+class RecordMappingTest(unittest.TestCase):
+
+    def test_map_for_record_type(self):
+        # given
+        mapper = OneWayMapper.for_record_type("SomeRecord", ["some_property", "some_property_02"])
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value",
+                                                                   some_property_03="some_value_03"))
+
+        # then
+        assert_that(mapped_object.__class__.__name__).is_equal_to("SomeRecord")
+        assert_that(mapped_object.some_property).is_equal_to("some_value")
+        assert_that(mapped_object.some_property_02).is_none()
+
+    def test_map_for_namedtuple_record_type_from_namedtuple(self):
+        # given
+        source_class = record_type("SourceRecord", ["some_property", "unmapped_property1"], NAMEDTUPLE)
+        mapper = OneWayMapper.for_record_type("SomeRecord", ["some_property", "some_property_02"], NAMEDTUPLE)
+
+        # when
+        mapped_object = mapper.map(source_class(some_property="some_value", unmapped_property1="unmapped"))
+
+        # then
+        assert_that(mapped_object).is_equal_to(("some_value", None))
+
+    def test_as_record_type_should_keep_dict_attributes_and_conversions(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"some_property": SomeEnum.some_enum_01, "some_property_02": None}).\
+            custom_mappings({"some_property_03": "mapped_property"}).\
+            target_initializers({"initialized_property": lambda obj: "initialized"}).\
+            as_record_type("SomeRecord")
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(
+            some_property="some_enum_02", some_property_02="some_value_02", some_property_03="some_value_03"))
+
+        # then
+        assert_that(mapper.target_class.__slots__).is_equal_to(
+            ("initialized_property", "mapped_property", "some_property", "some_property_02"))
+        assert_that(mapped_object.some_property).is_equal_to(SomeEnum.some_enum_02)
+        assert_that(mapped_object.some_property_02).is_equal_to("some_value_02")
+        assert_that(mapped_object.mapped_property).is_equal_to("some_value_03")
+        assert_that(mapped_object.initialized_property).is_equal_to("initialized")
+
+    def test_object_mapper_for_record_should_map_both_ways(self):
+        # given
+        mapper = ObjectMapper.for_record(TestClassSomeProperty1(None))
+
+        # when
+        mapped_object = mapper.map(TestClassSomeProperty1(some_property="some_value", some_property_02="value_02"))
+        mapped_object_rev = mapper.map(mapped_object)
+
+        # then
+        assert_that(mapped_object.__class__.__name__).is_equal_to("TestClassSomeProperty1Record")
+        assert_that(mapped_object.some_property_02).is_equal_to("value_02")
+        assert_that(mapped_object_rev).is_instance_of(TestClassSomeProperty1)
+        assert_that(mapped_object_rev.some_property).is_equal_to("some_value")
+        assert_that(mapped_object_rev.some_property_02).is_equal_to("value_02")
+
+    def test_object_mapper_right_as_record_type(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, dict).custom_mappings(
+            {"some_property": "mapped_property"}).right_as_record_type("MappedRecord")
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+        mapped_object_rev = mapper.map(mapped_object)
+
+        # then
+        assert_that(mapped_object.mapped_property).is_equal_to("some_value")
+        assert_that(mapped_object_rev).is_instance_of(TestClassSomePropertyEmptyInit1)
+        assert_that(mapped_object_rev.some_property).is_equal_to("some_value")
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
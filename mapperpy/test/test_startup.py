@@ -0,0 +1,146 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, enable_lazy_construction, disable_lazy_construction, \
+    enable_startup_report, disable_startup_report, startup_report
+
+
+class CountingInitClass(object):
+    instances = 0
+
+    def __init__(self, some_property=None, mapped_property=None):
+        CountingInitClass.instances += 1
+        self.some_property = some_property
+        self.mapped_property = mapped_property
+
+
+class LazyConstructionTest(unittest.TestCase):
+
+    def setUp(self):
+        CountingInitClass.instances = 0
+        enable_lazy_construction()
+
+    def tearDown(self):
+        disable_lazy_construction()
+        disable_startup_report()
+
+    def test_lazy_mapper_should_create_prototype_on_first_map(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, CountingInitClass).custom_mappings(
+            {"some_property_02": "mapped_property"})
+
+        # then
+        assert_that(CountingInitClass.instances).is_equal_to(0)
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property="value", some_property_02="value_02"))
+
+        # then
+        assert_that(CountingInitClass.instances).is_equal_to(2)
+        assert_that(mapped_object.some_property).is_equal_to("value")
+        assert_that(mapped_object.mapped_property).is_equal_to("value_02")
+        assert_that(mapper.from_left_mapper.__dict__).does_not_contain_key("map")
+
+    def test_lazy_mapper_should_build_nested_target_with_prototype_class(self):
+        # given
+        class Target(object):
+            def __init__(self, nested=None):
+                self.nested = nested if nested is not None else CountingInitClass()
+
+        mapper = OneWayMapper.for_target_class(Target).custom_mappings({"some_property": "nested.some_property"})
+
+        # when
+        mapped_object = mapper.map({"some_property": "value"})
+
+        # then
+        assert_that(mapped_object.nested).is_type_of(CountingInitClass)
+        assert_that(mapped_object.nested.some_property).is_equal_to("value")
+
+    def test_lazy_mapper_should_initialize_on_map_attr_name(self):
+        # given
+        mapper = OneWayMapper.for_target_class(CountingInitClass)
+
+        # when
+        mapped_name = mapper.map_attr_name("some_property")
+
+        # then
+        assert_that(mapped_name).is_equal_to("some_property")
+        assert_that(CountingInitClass.instances).is_equal_to(1)
+
+    def test_lazy_mapper_should_keep_tracing_wrapper(self):
+        # given
+        events = []
+
+        class Hook(object):
+            def on_map_start(self, event):
+                events.append(event.target_type)
+
+            def on_map_end(self, event, start_result):
+                pass
+
+        mapper = OneWayMapper.for_target_class(CountingInitClass).tracing_hook(Hook())
+
+        # when
+        mapper.map({"some_property": "value"})
+        mapper.map({"some_property": "value"})
+
+        # then
+        assert_that(events).is_equal_to([CountingInitClass, CountingInitClass])
+        assert_that(CountingInitClass.instances).is_equal_to(3)
+
+    def test_startup_report_should_list_live_mappers(self):
+        # given
+        class LazyTarget(CountingInitClass):
+            pass
+
+        class EagerTarget(CountingInitClass):
+            pass
+
+        enable_startup_report()
+        lazy_mapper = OneWayMapper.for_target_class(LazyTarget)
+        disable_lazy_construction()
+        eager_mapper = OneWayMapper.for_target_class(EagerTarget)
+        lazy_mapper.map_attr_name("some_property")
+
+        # when
+        report = {cost.mapper: cost for cost in startup_report()}
+
+        # then
+        assert_that(report["->LazyTarget"].lazy).is_true()
+        assert_that(report["->LazyTarget"].initialization_seconds).is_greater_than(0)
+        assert_that(report["->EagerTarget"].lazy).is_false()
+        assert_that(report["->EagerTarget"].initialization_seconds).is_none()
+        assert_that(report["->EagerTarget"].construction_seconds).is_greater_than(0)
+        assert_that(eager_mapper.target_prototype).is_not_none()
+
+    def test_startup_report_should_describe_mappers_with_source_class(self):
+        # given
+        enable_startup_report()
+        mappers = [ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, CountingInitClass),
+                   ObjectMapper.for_dict(TestClassSomePropertyEmptyInit2()).right_as_record_type("SomeRecord"),
+                   OneWayMapper.for_target_class(CountingInitClass).source_class(dict)]
+
+        # when
+        report = [cost.mapper for cost in startup_report()]
+
+        # then
+        assert_that(report).contains_only(
+            "TestClassSomePropertyEmptyInit1->CountingInitClass", "CountingInitClass->TestClassSomePropertyEmptyInit1",
+            "TestClassSomePropertyEmptyInit2->SomeRecord", "SomeRecord->TestClassSomePropertyEmptyInit2",
+            "dict->CountingInitClass")
+        assert_that(mappers).is_length(3)
+
+    def test_startup_report_should_skip_mappers_created_while_disabled(self):
+        # given
+        class UnreportedTarget(CountingInitClass):
+            pass
+
+        mapper = OneWayMapper.for_target_class(UnreportedTarget)
+
+        # when
+        report = [cost.mapper for cost in startup_report()]
+
+        # then
+        assert_that(report).does_not_contain(repr(mapper))
@@ -0,0 +1,85 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, batched
+from mapperpy.string_table import StringTable
+
+
+def new_string(value):
+    # equal strings created at runtime are separate objects
+    return "".join(list(value))
+
+
+class StringTableTest(unittest.TestCase):
+
+    def test_intern_should_share_equal_strings(self):
+        # given
+        table = StringTable()
+        first, second = new_string("active"), new_string("active")
+
+        # when
+        interned = [table.intern(first), table.intern(second), table.intern(1), table.intern(None)]
+
+        # then
+        assert_that(interned).is_equal_to(["active", "active", 1, None])
+        assert_that(interned[1]).is_same_as(first)
+        assert_that(table.deduplicated).is_equal_to(1)
+        assert_that(table.bytes_saved).is_greater_than(0)
+
+    def test_intern_should_pass_values_through_when_table_is_full(self):
+        # given
+        table = StringTable(max_size=1)
+        table.intern("first")
+        second = new_string("second")
+
+        # when
+        interned = table.intern(new_string("second"))
+
+        # then
+        assert_that(interned).is_not_same_as(second)
+        assert_that(table.size).is_equal_to(1)
+
+    def test_mapper_should_intern_selected_attributes(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).intern_strings(["some_property"])
+        objs = [TestClassSomePropertyEmptyInit1(some_property=new_string("PL"), some_property_02=new_string("xy"))
+                for _ in range(3)]
+
+        # when
+        mapped_objects = list(mapper.map_many(objs))
+
+        # then
+        assert_that(mapped_objects[1].some_property).is_same_as(mapped_objects[0].some_property)
+        assert_that(mapped_objects[2].some_property).is_same_as(mapped_objects[0].some_property)
+        assert_that(mapped_objects[1].some_property_02).is_not_same_as(mapped_objects[0].some_property_02)
+        assert_that(mapper.stats()["interning"]["deduplicated"]).is_equal_to(2)
+
+    def test_map_many_should_intern_values_of_batch_converters(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).intern_strings(["some_property"]) \
+            .target_value_converters({"some_property": batched(lambda values: [new_string(value) for value in values])})
+        objs = [TestClassSomePropertyEmptyInit1(some_property="PL") for _ in range(3)]
+
+        # when
+        mapped_objects = list(mapper.map_many(objs, chunk_size=2))
+
+        # then
+        assert_that(mapped_objects[1].some_property).is_same_as(mapped_objects[0].some_property)
+        assert_that(mapped_objects[2].some_property).is_same_as(mapped_objects[0].some_property)
+        assert_that(mapper.stats()["interning"]["deduplicated"]).is_equal_to(2)
+
+    def test_dict_mapper_should_intern_in_both_directions(self):
+        # given
+        mapper = ObjectMapper.for_dict(TestClassSomePropertyEmptyInit1()).intern_strings(["some_property"])
+
+        # when
+        mapped_dicts = [mapper.map(TestClassSomePropertyEmptyInit1(some_property=new_string("PL")))
+                        for _ in range(2)]
+        mapped_objects = [mapper.map({"some_property": new_string("DE")}) for _ in range(2)]
+
+        # then
+        assert_that(mapped_dicts[1]["some_property"]).is_same_as(mapped_dicts[0]["some_property"])
+        assert_that(mapped_objects[1].some_property).is_same_as(mapped_objects[0].some_property)
+        assert_that(mapper.stats()["interning"]["deduplicated"]).is_equal_to(2)
@@ -0,0 +1,115 @@
+import unittest
+from assertpy import assert_that
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper
+from mapperpy.tracing import MapHook
+
+
+class RecordingHook(MapHook):
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_map_start(self, event):
+        self.started.append((event.source_type, event.target_type, event.depth, event.nested))
+        return len(self.started)
+
+    def on_map_end(self, event, start_result):
+        self.ended.append((start_result, event.target_type, event.depth, event.nested, event.duration, event.error))
+
+
+class TracingTest(unittest.TestCase):
+
+    def test_mapper_without_hooks_should_not_install_traced_functions(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2)
+
+        # then
+        assert_that(mapper.__dict__).does_not_contain_key("map")
+        assert_that(mapper.__dict__).does_not_contain_key("_OneWayMapper__try_apply_nested_mapper")
+
+    def test_hook_should_be_called_around_map(self):
+        # given
+        hook = RecordingHook()
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).tracing_hook(hook)
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+
+        # then
+        assert_that(mapped_object.some_property).is_equal_to("some_value")
+        assert_that(hook.started).is_equal_to(
+            [(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2, 0, False)])
+        assert_that(hook.ended).is_length(1)
+        assert_that(hook.ended[0][0]).is_equal_to(1)
+        assert_that(hook.ended[0][4]).is_greater_than_or_equal_to(0)
+        assert_that(hook.ended[0][5]).is_none()
+
+    def test_hook_should_receive_error(self):
+        # given
+        hook = RecordingHook()
+        mapper = OneWayMapper.for_target_class(TestClassMappedProperty).custom_mappings(
+            {"some_property": "unknown"}).tracing_hook(hook)
+
+        # when
+        with self.assertRaises(AttributeError):
+            mapper.map(TestClassSomeProperty1(some_property="some_value"))
+
+        # then
+        assert_that(hook.ended[0][5]).is_instance_of(AttributeError)
+
+    def test_hook_should_be_sampled(self):
+        # given
+        hook = RecordingHook()
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).tracing_hook(hook, sample_rate=3)
+
+        # when
+        for _ in range(7):
+            mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+
+        # then
+        assert_that(hook.started).is_length(3)
+        assert_that(hook.ended).is_length(3)
+
+    def test_hook_sample_rate_should_be_positive(self):
+        with self.assertRaises(ValueError):
+            OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).tracing_hook(RecordingHook(), sample_rate=0)
+
+    def test_nested_spans_should_report_depth(self):
+        # given
+        root_hook = RecordingHook()
+        nested_hook = RecordingHook()
+        nested_mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).tracing_hook(nested_hook)
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2).\
+            nested_mapper(nested_mapper, TestClassSomePropertyEmptyInit1).\
+            tracing_hook(root_hook, nested_spans=True)
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(
+            some_property=TestClassSomePropertyEmptyInit1(some_property="nested_value")))
+
+        # then
+        assert_that(mapped_object.some_property.some_property).is_equal_to("nested_value")
+        assert_that(root_hook.started).is_equal_to([
+            (TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2, 0, False),
+            (TestClassSomePropertyEmptyInit1, None, 1, True)])
+        assert_that(root_hook.ended[0][1]).is_equal_to(TestClassSomePropertyEmptyInit2)
+        assert_that(nested_hook.started).is_equal_to(
+            [(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2, 2, False)])
+
+    def test_object_mapper_hook_should_trace_both_directions(self):
+        # given
+        hook = RecordingHook()
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2).\
+            tracing_hook(hook)
+
+        # when
+        mapper.map(TestClassSomePropertyEmptyInit1(some_property="some_value"))
+        mapper.map(TestClassSomePropertyEmptyInit2(some_property="some_value"))
+
+        # then
+        assert_that([started[1] for started in hook.started]).is_equal_to(
+            [TestClassSomePropertyEmptyInit2, TestClassSomePropertyEmptyInit1])
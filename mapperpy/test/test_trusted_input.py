@@ -0,0 +1,148 @@
+import pickle
+import unittest
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, MapperOptions, TrustedInputException
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
+
+
+class TrustedInputTest(unittest.TestCase):
+
+    def test_map_should_map_trusted_objects(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit) \
+            .custom_mappings({"some_property": "mapped_property", "some_property_02": "mapped_property_02"}) \
+            .target_value_converters({"some_property_02": lambda value: value.upper()}) \
+            .target_initializers({"unmapped_property2": lambda obj: "initialized"}) \
+            .options(MapperOptions.trusted_input == True)
+
+        # when
+        mapped_objects = [mapper.map(TestClassSomePropertyEmptyInit1(
+            some_property=idx, some_property_02="value_{}".format(idx))) for idx in range(3)]
+
+        # then
+        assert_that([obj.mapped_property for obj in mapped_objects]).is_equal_to([0, 1, 2])
+        assert_that([obj.mapped_property_02 for obj in mapped_objects]).is_equal_to(["VALUE_0", "VALUE_1", "VALUE_2"])
+        assert_that([obj.unmapped_property2 for obj in mapped_objects]).is_equal_to(["initialized"] * 3)
+
+    def test_map_should_map_trusted_dicts(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"mapped_property": None, "some_property_02": 0}) \
+            .custom_mappings({"some_property": "mapped_property"}) \
+            .options(MapperOptions.trusted_input == True)
+
+        # when
+        mapped_objects = [mapper.map({"some_property": "value", "some_property_02": idx}) for idx in range(2)]
+
+        # then
+        assert_that(mapped_objects).is_equal_to([{"mapped_property": "value", "some_property_02": 0},
+                                                 {"mapped_property": "value", "some_property_02": 1}])
+        assert_that(mapper.map_attributes({"some_property": "value", "some_property_02": 2})).is_equal_to(
+            {"mapped_property": "value", "some_property_02": 2})
+
+    def test_map_should_convert_values_which_need_conversion_in_first_object(self):
+        # given
+        prototype = TestClassSomePropertyEmptyInit2(some_property=SomeEnum.some_enum_01)
+        mapper = OneWayMapper.for_target_prototype(prototype).options(MapperOptions.trusted_input == True)
+
+        # when
+        mapped_objects = [mapper.map({"some_property": value, "some_property_02": "value"}) for value in [1, 2]]
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02])
+        assert_that([obj.some_property_02 for obj in mapped_objects]).is_equal_to(["value", "value"])
+
+    def test_map_should_report_missing_attribute_in_first_object(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassMappedPropertyEmptyInit) \
+            .custom_mappings({"unknown": "mapped_property"}) \
+            .options(MapperOptions.trusted_input == True)
+
+        # when
+        with self.assertRaises(TrustedInputException) as context:
+            mapper.map(TestClassSomePropertyEmptyInit1(some_property="value"))
+
+        # then
+        assert_that(context.exception.mapper_name).is_equal_to(
+            "TestClassSomePropertyEmptyInit1->TestClassMappedPropertyEmptyInit")
+        assert_that(context.exception.attr_name).is_equal_to("unknown")
+        assert_that(str(context.exception)).contains(
+            "TestClassSomePropertyEmptyInit1->TestClassMappedPropertyEmptyInit").contains("unknown")
+
+    def test_map_should_report_missing_attribute_after_checked_objects(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"some_property": None, "some_property_02": None}) \
+            .options(MapperOptions.trusted_input == True)
+        mapper.map({"some_property": "value", "some_property_02": "value_02"})
+
+        # when
+        with self.assertRaises(TrustedInputException) as context:
+            mapper.map({"some_property": "value"})
+
+        # then
+        assert_that(context.exception.attr_name).is_equal_to("some_property_02")
+        assert_that(context.exception.reason).is_equal_to("attribute is missing")
+
+    def test_map_should_report_key_not_present_in_first_dict(self):
+        # given
+        mapper = OneWayMapper.for_target_prototype({"some_property": None, "some_property_02": None}) \
+            .options(MapperOptions.trusted_input == True)
+        mapper.map({"some_property": "value"})
+
+        # when
+        with self.assertRaises(TrustedInputException) as context:
+            mapper.map({"some_property": "value", "some_property_02": "value_02"})
+
+        # then
+        assert_that(context.exception.mapper_name).is_equal_to("dict->dict")
+        assert_that(context.exception.attr_name).is_equal_to("some_property_02")
+        assert_that(context.exception.reason).is_equal_to("attribute is not present in the first object")
+        assert_that(pickle.loads(pickle.dumps(context.exception)).args).is_equal_to(context.exception.args)
+
+    def test_map_should_report_changed_type_in_checked_sample(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2) \
+            .options(MapperOptions.trusted_input == 3)
+        mapper.map({"some_property": "value"})
+        mapper.map({"some_property": None})
+
+        # when
+        with self.assertRaises(TrustedInputException) as context:
+            mapper.map({"some_property": 1})
+
+        # then
+        assert_that(context.exception.attr_name).is_equal_to("some_property")
+        assert_that(context.exception.reason).contains("str").contains("int")
+
+    def test_map_should_not_check_types_after_sample(self):
+        # given
+        mapper = OneWayMapper.for_target_class(TestClassSomePropertyEmptyInit2) \
+            .options(MapperOptions.trusted_input == True)
+        mapper.map({"some_property": "value"})
+
+        # when
+        mapped_object = mapper.map({"some_property": 1})
+
+        # then
+        assert_that(mapped_object.some_property).is_equal_to(1)
+
+    def test_object_mapper_should_pass_option_to_both_directions(self):
+        # given
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, TestClassSomePropertyEmptyInit2) \
+            .options(MapperOptions.trusted_input == True)
+
+        # when
+        mapped_object = mapper.map(TestClassSomePropertyEmptyInit1(some_property="value"))
+        reversed_object = mapper.map(mapped_object)
+
+        # then
+        assert_that(mapped_object.some_property).is_equal_to("value")
+        assert_that(reversed_object.some_property).is_equal_to("value")
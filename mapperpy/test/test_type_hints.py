@@ -0,0 +1,104 @@
+import unittest
+from datetime import datetime
+
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy import OneWayMapper
+from mapperpy.type_hints import get_attribute_types
+
+try:
+    from typing import Optional, List
+except ImportError:
+    Optional = List = None
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
+
+
+class AnnotatedTarget(object):
+    # class annotations set explicitly, so that the class can be defined also on Python 2
+    __annotations__ = {"status": SomeEnum, "created": "datetime"}
+
+    def __init__(self, status=None, created=None, name=None):
+        self.status = status
+        self.created = created
+        self.name = name
+
+    __init__.__annotations__ = {"created": datetime, "return": None}
+
+
+class PrototypeReadsCounter(object):
+
+    def __init__(self, some_property=None):
+        self.reads = 0
+        self.some_property = some_property
+
+    def __getattribute__(self, attr_name):
+        if attr_name == "some_property":
+            object.__setattr__(self, "reads", object.__getattribute__(self, "reads") + 1)
+        return object.__getattribute__(self, attr_name)
+
+
+class TypeHintsTest(unittest.TestCase):
+
+    def test_get_attribute_types_should_merge_class_and_init_annotations(self):
+        assert_that(get_attribute_types(AnnotatedTarget)).is_equal_to({"status": SomeEnum, "created": datetime})
+        assert_that(get_attribute_types(dict)).is_empty()
+
+    def test_get_attribute_types_should_skip_generic_classes(self):
+        # given
+        class GenericList(list):
+            # typing generics on Python 2 (e.g. List[int]) are classes with origin and arguments
+            __origin__ = list
+            __args__ = (int,)
+
+        class Target(object):
+            __annotations__ = {"names": GenericList, "status": SomeEnum}
+
+        # when
+        attribute_types = get_attribute_types(Target)
+
+        # then
+        assert_that(attribute_types).is_equal_to({"status": SomeEnum})
+
+    @unittest.skipIf(Optional is None, "typing module is not available")
+    def test_get_attribute_types_should_unwrap_optional(self):
+        # given
+        class Target(object):
+            __annotations__ = {"status": Optional[SomeEnum], "names": List[str], "count": Optional[List[int]]}
+
+        # when
+        attribute_types = get_attribute_types(Target)
+
+        # then
+        assert_that(attribute_types).is_equal_to({"status": SomeEnum})
+
+    def test_map_should_convert_values_to_hinted_types(self):
+        # given
+        mapper = OneWayMapper.for_target_class(AnnotatedTarget)
+
+        # when
+        mapped_object = mapper.map({"status": "some_enum_02", "created": "2016-05-17T12:30:45", "name": "name"})
+
+        # then
+        assert_that(mapped_object.status).is_equal_to(SomeEnum.some_enum_02)
+        assert_that(mapped_object.created).is_equal_to(datetime(2016, 5, 17, 12, 30, 45))
+        assert_that(mapped_object.name).is_equal_to("name")
+
+    def test_map_should_read_prototype_value_once(self):
+        # given
+        prototype = PrototypeReadsCounter(some_property=SomeEnum.some_enum_01)
+        mapper = OneWayMapper.for_target_prototype(prototype)
+        mapper.map({"some_property": 1})
+        reads = prototype.reads
+
+        # when
+        mapped_objects = [mapper.map({"some_property": value}) for value in [1, 2, 2]]
+
+        # then
+        assert_that([obj.some_property for obj in mapped_objects]).is_equal_to(
+            [SomeEnum.some_enum_01, SomeEnum.some_enum_02, SomeEnum.some_enum_02])
+        assert_that(prototype.reads).is_equal_to(reads)
@@ -0,0 +1,96 @@
+import json
+import unittest
+from datetime import datetime
+from StringIO import StringIO
+from assertpy import assert_that
+from enum import Enum
+
+from mapperpy.test.common_test_classes import *
+
+from mapperpy import OneWayMapper, ObjectMapper, map_to_writer, JsonLinesWriter, CsvWriter
+
+
+class WritersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = OneWayMapper.for_target_prototype(
+            TestClassMappedPropertyEmptyInit(mapped_property="", mapped_property_02="")).custom_mappings(
+            {"some_property": "mapped_property", "some_property_02": "mapped_property_02"})
+        self.objects = [
+            TestClassSomePropertyEmptyInit1(some_property=SomeEnum.some_enum_01,
+                                            some_property_02=datetime(2016, 5, 17, 12, 30, 45)),
+            TestClassSomePropertyEmptyInit1(some_property="value_2")]
+
+    def test_map_to_json_lines_writer(self):
+        # given
+        output = StringIO()
+
+        # when
+        records_count = map_to_writer(self.objects, JsonLinesWriter(output, self.mapper, sort_keys=True))
+
+        # then
+        assert_that(records_count).is_equal_to(2)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert_that(records).is_equal_to([
+            {"mapped_property": "some_enum_01", "mapped_property_02": "2016-05-17T12:30:45"},
+            {"mapped_property": "value_2", "mapped_property_02": None}])
+        assert_that(output.getvalue()).ends_with("\n")
+
+    def test_json_lines_writer_should_buffer_output(self):
+        # given
+        output = StringIO()
+        writer = JsonLinesWriter(output, self.mapper, buffer_size=1024)
+
+        # when
+        writer.write(self.objects[1])
+
+        # then
+        assert_that(output.getvalue()).is_empty()
+
+        # when
+        writer.flush()
+
+        # then
+        assert_that(output.getvalue()).contains("value_2")
+
+    def test_map_to_csv_writer(self):
+        # given
+        output = StringIO()
+
+        # when
+        map_to_writer(self.objects, CsvWriter(output, self.mapper, buffer_records=1))
+
+        # then
+        assert_that(output.getvalue().splitlines()).is_equal_to([
+            "mapped_property,mapped_property_02",
+            "some_enum_01,2016-05-17T12:30:45",
+            "value_2,"])
+
+    def test_map_to_csv_writer_should_encode_unicode_values(self):
+        # given
+        output = StringIO()
+        mapper = OneWayMapper.for_target_class(dict).custom_mappings({"some_property": "city"})
+
+        # when
+        map_to_writer([{"some_property": u"Krak\u00f3w"}], CsvWriter(output, mapper, header=False))
+
+        # then
+        assert_that(output.getvalue().splitlines()).is_equal_to([u"Krak\u00f3w".encode("utf-8")])
+
+    def test_map_to_csv_writer_with_fieldnames_and_object_mapper(self):
+        # given
+        output = StringIO()
+        mapper = ObjectMapper.from_class(TestClassSomePropertyEmptyInit1, dict).custom_mappings(
+            {"some_property": "mapped_property"})
+
+        # when
+        map_to_writer([{"mapped_property": "value_1", "some_property_02": "value_2"}],
+                      CsvWriter(output, mapper, fieldnames=["some_property_02", "some_property"], header=False))
+
+        # then
+        assert_that(output.getvalue().splitlines()).is_equal_to(["value_2,value_1"])
+
+
+class SomeEnum(Enum):
+    some_enum_01 = 1
+    some_enum_02 = 2
@@ -0,0 +1,128 @@
+import itertools
+import threading
+from timeit import default_timer
+
+_local = threading.local()
+
+
+class MapHook(object):
+    """
+    Base class for tracing hooks. Value returned by *on_map_start* is passed back to *on_map_end* so hooks can
+    correlate both calls (e.g. open and close tracing span).
+    """
+
+    def on_map_start(self, event):
+        pass
+
+    def on_map_end(self, event, start_result):
+        pass
+
+
+class MapEvent(object):
+    """
+    Describes single (possibly nested) mapping call. *duration* (in seconds) and *error* are set before *on_map_end*
+    is called. *attr_name_from* and *attr_name_to* are set only for nested mapper spans.
+    """
+    __slots__ = ("source_type", "target_type", "depth", "nested", "attr_name_from", "attr_name_to", "duration",
+                 "error")
+
+    def __init__(self, source_type, target_type, nested=False, attr_name_from=None, attr_name_to=None):
+        self.source_type = source_type
+        self.target_type = target_type
+        self.depth = 0
+        self.nested = nested
+        self.attr_name_from = attr_name_from
+        self.attr_name_to = attr_name_to
+        self.duration = None
+        self.error = None
+
+    def __repr__(self):
+        return "MapEvent({}->{}, depth={}, nested={}, duration={})".format(
+            self.source_type.__name__ if self.source_type else None,
+            self.target_type.__name__ if self.target_type else None,
+            self.depth, self.nested, self.duration)
+
+
+class HookRegistration(object):
+
+    def __init__(self, hook, sample_rate=1, nested_spans=False):
+        if sample_rate < 1:
+            raise ValueError("Sample rate has to be a positive integer, {} found".format(sample_rate))
+
+        self.hook = hook
+        self.sample_rate = sample_rate
+        self.nested_spans = nested_spans
+        self.__calls_counter = itertools.count()
+
+    def is_sampled(self):
+        return self.sample_rate == 1 or next(self.__calls_counter) % self.sample_rate == 0
+
+
+class Tracer(object):
+    """
+    Wraps mapper functions with calls to registered hooks. Mappers install wrapped functions only when a hook is
+    registered so there is no tracing overhead otherwise.
+    """
+
+    def __init__(self, target_class):
+        self.__target_class = target_class
+        self.__registrations = []
+
+    def add_hook(self, hook, sample_rate=1, nested_spans=False):
+        self.__registrations.append(HookRegistration(hook, sample_rate, nested_spans))
+
+    def wrap_map(self, map_func):
+
+        def traced_map(obj, fields=None):
+            sampled = [registration for registration in self.__registrations if registration.is_sampled()]
+            if not sampled and not getattr(_local, "sampled", None):
+                # unsampled call outside of sampled spans doesn't need event nor depth tracking
+                return map_func(obj, fields)
+
+            event = MapEvent(type(obj), self.__target_class)
+            return self.__call_traced(map_func, (obj, fields), event, sampled)
+
+        return traced_map
+
+    def wrap_nested(self, apply_nested_func):
+
+        def traced_apply_nested(attr_value, from_type, attr_name_from, to_type, attr_name_to):
+            # nested spans are reported only within map calls sampled for the same hook
+            active = getattr(_local, "sampled", ())
+            sampled = [registration for registration in self.__registrations
+                       if registration.nested_spans and registration in active]
+            if not sampled and not active:
+                return apply_nested_func(attr_value, from_type, attr_name_from, to_type, attr_name_to)
+
+            event = MapEvent(from_type, to_type, True, attr_name_from, attr_name_to)
+            return self.__call_traced(
+                apply_nested_func, (attr_value, from_type, attr_name_from, to_type, attr_name_to), event, sampled)
+
+        return traced_apply_nested
+
+    @classmethod
+    def __call_traced(cls, func, args, event, sampled):
+        depth = getattr(_local, "depth", 0)
+        previously_sampled = getattr(_local, "sampled", ())
+
+        event.depth = depth
+        started = [(registration.hook, registration.hook.on_map_start(event)) for registration in sampled]
+
+        _local.depth = depth + 1
+        if sampled and not event.nested:
+            _local.sampled = previously_sampled + tuple(sampled)
+        start_time = default_timer()
+        try:
+            result = func(*args)
+            if event.nested and result is not None:
+                event.target_type = type(result)
+            return result
+        except Exception as ex:
+            event.error = ex
+            raise
+        finally:
+            event.duration = default_timer() - start_time
+            _local.depth = depth
+            _local.sampled = previously_sampled
+            for hook, start_result in started:
+                hook.on_map_end(event, start_result)
@@ -0,0 +1,46 @@
+try:
+    from typing import Union
+except ImportError:
+    Union = None
+
+_NONE_TYPE = type(None)
+
+
+def get_attribute_types(cls):
+    """
+    Returns dict attribute name -> class declared by type hints of the class: annotations of its *__init__* arguments
+    and class annotations (which cover dataclass fields and typing.NamedTuple). Optional[X] is resolved to X, hints
+    which aren't classes (e.g. forward references given as strings, generics) are skipped.
+    """
+    hints = {}
+
+    for klass in reversed(getattr(cls, "__mro__", ())):
+        hints.update(klass.__dict__.get("__annotations__", {}))
+
+    init_hints = dict(getattr(getattr(cls, "__init__", None), "__annotations__", None) or {})
+    init_hints.pop("return", None)
+    hints.update(init_hints)
+
+    attribute_types = {}
+    for attr_name, hint in hints.items():
+        attr_type = _get_hinted_class(hint)
+        if attr_type is not None:
+            attribute_types[attr_name] = attr_type
+
+    return attribute_types
+
+
+def _get_hinted_class(hint):
+    is_union = Union is not None and getattr(hint, "__origin__", None) is Union or type(hint).__name__ == "UnionType"
+    if is_union:
+        classes = [arg for arg in getattr(hint, "__args__", ()) if arg is not _NONE_TYPE]
+        return _get_plain_class(classes[0]) if len(classes) == 1 else None
+
+    return _get_plain_class(hint) if hint is not _NONE_TYPE else None
+
+
+def _get_plain_class(hint):
+    # typing generics (e.g. List[int]) are classes on Python 2, they are recognized by their origin and arguments
+    is_generic = getattr(hint, "__origin__", None) is not None or getattr(hint, "__args__", None) or \
+        getattr(hint, "__module__", None) == "typing"
+    return hint if isinstance(hint, type) and not is_generic else None
@@ -0,0 +1,101 @@
+import csv
+import json
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_BUFFER_RECORDS = 1000
+
+
+class JsonLinesWriter(object):
+    """
+    Writes mapped attributes of every object as a single JSON Lines record. Target objects are not created - mapped
+    attributes go straight to the output. Output is buffered and written in blocks of at least *buffer_size*
+    characters. Additional keyword arguments are passed to *json.dumps*.
+    """
+
+    def __init__(self, fileobj, mapper, buffer_size=DEFAULT_BUFFER_SIZE, **json_kwargs):
+        self.__fileobj = fileobj
+        self.__mapper = mapper
+        self.__buffer_size = buffer_size
+        self.__encoder = json.JSONEncoder(**json_kwargs)
+        self.__buffer = []
+        self.__buffered_size = 0
+
+    def write(self, obj):
+        record = self.__encoder.encode(self.__mapper.map_attributes(obj))
+        self.__buffer.append(record)
+        self.__buffered_size += len(record) + 1
+
+        if self.__buffered_size >= self.__buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.__buffer:
+            self.__buffer.append("")
+            self.__fileobj.write("\n".join(self.__buffer))
+            self.__buffer = []
+            self.__buffered_size = 0
+
+
+class CsvWriter(object):
+    """
+    Writes mapped attributes of every object as CSV row. Target objects are not created - mapped attributes go straight
+    to the output. Rows are written in batches of *buffer_records*. Additional keyword arguments are passed to
+    *csv.writer*.
+
+    :param fieldnames: columns to write, by default mapped attribute names of the first object (sorted)
+    :param header: if set, header row is written before the first row
+    :param encoding: encoding of unicode values (csv module writes only byte strings)
+    """
+
+    def __init__(self, fileobj, mapper, fieldnames=None, header=True, buffer_records=DEFAULT_BUFFER_RECORDS,
+                 encoding="utf-8", **writer_kwargs):
+        self.__writer = csv.writer(fileobj, **writer_kwargs)
+        self.__encoding = encoding
+        self.__mapper = mapper
+        self.__fieldnames = tuple(fieldnames) if fieldnames else None
+        self.__header = header
+        self.__buffer_records = buffer_records
+        self.__buffer = []
+
+    @property
+    def fieldnames(self):
+        return self.__fieldnames
+
+    def write(self, obj):
+        mapped_attributes = self.__mapper.map_attributes(obj)
+
+        if self.__fieldnames is None:
+            self.__fieldnames = tuple(sorted(mapped_attributes))
+
+        if self.__header:
+            self.__buffer.append(self.__fieldnames)
+            self.__header = False
+
+        encoding = self.__encoding
+        self.__buffer.append([value.encode(encoding) if isinstance(value, unicode) else value
+                              for value in (mapped_attributes.get(fieldname) for fieldname in self.__fieldnames)])
+
+        if len(self.__buffer) >= self.__buffer_records:
+            self.flush()
+
+    def flush(self):
+        if self.__buffer:
+            self.__writer.writerows(self.__buffer)
+            self.__buffer = []
+
+
+def map_to_writer(iterable, writer):
+    """
+    Maps all objects from iterable into given writer (:class:`JsonLinesWriter`, :class:`CsvWriter`) and flushes it.
+
+    :return: number of written records
+    """
+    records_count = 0
+
+    write = writer.write
+    for obj in iterable:
+        write(obj)
+        records_count += 1
+
+    writer.flush()
+    return records_count
@@ -8,7 +8,7 @@ setup(name='MapperPy',
       author='Lukasz Grech',
       author_email='mapperpy@gmail.com',
       url='https://github.com/lgrech/MapperPy',
-      packages=['mapperpy'],
+      packages=['mapperpy', 'mapperpy.benchmarks'],
       install_requires=['enum34'],
       tests_require=['assertpy'],
       keywords='object mapping')